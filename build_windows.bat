@@ -4,7 +4,7 @@ echo ========================================
 echo 视频分析工具 Windows 打包脚本 v2.0
 echo ========================================
 
-echo [1/6] 检查 Python 安装...
+echo [1/7] 检查 Python 安装...
 python --version
 if %errorlevel% neq 0 (
     echo 错误: 未找到 Python，请先安装 Python 3.8+
@@ -13,10 +13,10 @@ if %errorlevel% neq 0 (
     exit /b 1
 )
 
-echo [2/6] 升级 pip...
+echo [2/7] 升级 pip...
 python -m pip install --upgrade pip
 
-echo [3/6] 安装项目依赖...
+echo [3/7] 安装项目依赖...
 pip install -r requirements.txt
 if %errorlevel% neq 0 (
     echo 错误: 依赖安装失败，请检查网络连接
@@ -24,7 +24,7 @@ if %errorlevel% neq 0 (
     exit /b 1
 )
 
-echo [4/6] 安装 PyInstaller...
+echo [4/7] 安装 PyInstaller...
 pip install pyinstaller
 if %errorlevel% neq 0 (
     echo 错误: PyInstaller 安装失败
@@ -32,13 +32,21 @@ if %errorlevel% neq 0 (
     exit /b 1
 )
 
-echo [5/6] 清理旧的构建文件...
+echo [5/7] 清理旧的构建文件...
 if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
 if exist __pycache__ rmdir /s /q __pycache__
 for /d /r . %%d in (__pycache__) do @if exist "%%d" rmdir /s /q "%%d"
 
-echo [6/6] 开始打包（这可能需要几分钟）...
+echo [6/7] 预编译源码...
+python -m compileall -q -j 0 main.py src
+if %errorlevel% neq 0 (
+    echo 错误: 源码编译失败，请检查语法错误
+    pause
+    exit /b 1
+)
+
+echo [7/7] 开始打包（这可能需要几分钟）...
 pyinstaller main.spec --clean --noconfirm --log-level INFO
 if %errorlevel% neq 0 (
     echo 错误: 打包失败，请检查错误信息
@@ -16,20 +16,109 @@ Gemini视频内容识别客户端 - 主程序入口
 """
 
 import sys
-import os
-import tkinter as tk
-from tkinter import messagebox
+import io
+import contextlib
+import functools
+import importlib
+import importlib.util
 
-# 添加src目录到Python路径
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+def _lazy_import(name):
+    """
+    延迟导入模块：模块代码在首次访问其属性时才执行
+    
+    Args:
+        name (str): 模块完整名称
+        
+    Returns:
+        module: 模块对象
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
 
-try:
-    from src.ui.main_window import MainWindow
-    from src.utils.config import config
-except ImportError as e:
-    print(f"导入模块失败: {e}")
-    print("请确保已安装所有依赖包: pip install -r requirements.txt")
-    sys.exit(1)
+# 程序运行必需的依赖包
+_REQUIRED_PACKAGES = ('google.genai', 'dotenv', 'PIL')
+
+# 模块名到发行包名的映射（发行包名已规范化为小写下划线形式）
+_DISTRIBUTION_NAMES = {
+    'google.genai': 'google_genai',
+    'dotenv': 'python_dotenv',
+    'PIL': 'pillow'
+}
+
+@functools.lru_cache(maxsize=None)
+def _installed_distributions():
+    """
+    获取已安装发行包名称集合（只扫描一次 .dist-info 元数据）
+    
+    Returns:
+        frozenset: 规范化后的发行包名称
+    """
+    from importlib.metadata import distributions
+    
+    names = set()
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            names.add(name.lower().replace('-', '_'))
+    return frozenset(names)
+
+def _is_package_available(package):
+    """
+    检查包是否可以被导入（只定位模块，不执行模块代码）
+    
+    Args:
+        package (str): 包名，支持 google.genai 这类带点的子模块名
+        
+    Returns:
+        bool: 包是否存在
+    """
+    distribution = _DISTRIBUTION_NAMES.get(package, package).lower()
+    if distribution in _installed_distributions():
+        return True
+    
+    # 未以发行包形式安装时（如源码路径），回退到模块查找
+    try:
+        # find_spec 查找子模块时会导入父包，父包缺失时抛出 ModuleNotFoundError
+        return importlib.util.find_spec(package) is not None
+    except (ImportError, ValueError):
+        return False
+
+# 含C扩展的包：存在不代表可用，需实际加载扩展模块确认
+_NATIVE_EXTENSIONS = {
+    'PIL': 'PIL._imaging'
+}
+
+def _is_package_loadable(package):
+    """
+    确认已存在的包能否正常加载（仅对含C扩展且尚未导入的包实际导入）
+    
+    Args:
+        package (str): 包名
+        
+    Returns:
+        bool: 包是否可以正常加载
+    """
+    extension = _NATIVE_EXTENSIONS.get(package)
+    if extension is None or extension in sys.modules:
+        return True
+    
+    try:
+        importlib.import_module(extension)
+        return True
+    except ImportError:
+        return False
 
 def check_dependencies():
     """
@@ -38,26 +127,32 @@ def check_dependencies():
     Returns:
         bool: 依赖包是否完整
     """
-    required_packages = [
-        'google.genai',
-        'dotenv',
-        'PIL'
-    ]
+    # 以 python -O/-OO 运行时视为生产环境，跳过检查
+    if not __debug__:
+        return True
+    
+    # 已导入的包无需再探测
+    if all(package in sys.modules for package in _REQUIRED_PACKAGES):
+        return True
     
     missing_packages = []
+    broken_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+    for package in _REQUIRED_PACKAGES:
+        if not _is_package_available(package):
             missing_packages.append(package)
+        elif not _is_package_loadable(package):
+            broken_packages.append(package)
     
-    if missing_packages:
-        print("缺少以下依赖包:")
-        for package in missing_packages:
-            print(f"  - {package}")
-        print("\n请运行以下命令安装依赖包:")
-        print("pip install -r requirements.txt")
+    if missing_packages or broken_packages:
+        sections = []
+        if missing_packages:
+            items = '\n'.join(f"  - {package}" for package in missing_packages)
+            sections.append(f"缺少以下依赖包:\n{items}")
+        if broken_packages:
+            items = '\n'.join(f"  - {package}" for package in broken_packages)
+            sections.append(f"以下依赖包已安装但无法加载:\n{items}")
+        print('\n'.join(sections) + "\n\n请运行以下命令安装依赖包:\npip install -r requirements.txt")
         return False
     
     return True
@@ -69,6 +164,12 @@ def check_configuration():
     Returns:
         bool: 配置是否有效
     """
+    # 以 python -O/-OO 运行时视为生产环境，跳过检查
+    if not __debug__:
+        return True
+    
+    from src.utils.config import config
+    
     if not config.is_valid():
         print("配置检查失败:")
         print("- Gemini API密钥未配置")
@@ -84,39 +185,87 @@ def show_startup_info():
     """
     显示启动信息
     """
+    from src.utils.config import config
+    
+    sep = "=" * 50
+    sys.stdout.write(
+        f"{sep}\nGemini视频内容识别客户端\n版本: 1.0.0\n{sep}\n"
+        f"支持的视频格式: {config.supported_formats_str}\n"
+        f"最大文件大小: {config.max_file_size_mb}MB\n{sep}\n"
+    )
+    sys.stdout.flush()
+
+def _setup_logging():
+    """
+    配置根日志记录器：业务代码只把日志放入队列，由后台线程负责输出
+    """
+    import atexit
+    import logging
+    import logging.handlers
+    import queue
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.WARNING)
+
+def _run_startup_checks():
+    """
+    显示启动信息并执行依赖包和配置检查
+    
+    Returns:
+        bool: 是否可以继续启动
+    """
+    # 显示启动信息（配置模块在此处按需导入）
+    show_startup_info()
+    
+    # 检查依赖包
+    print("检查依赖包...")
+    if not check_dependencies():
+        return False
+    print("✓ 依赖包检查通过")
+    
+    # 检查配置
+    print("检查配置...")
+    if not check_configuration():
+        return False
+    print("✓ 配置检查通过")
+    
+    print("启动应用程序...")
     print("="*50)
-    print("Gemini视频内容识别客户端")
-    print("版本: 1.0.0")
-    print("="*50)
-    print(f"支持的视频格式: {', '.join(config.get_supported_formats())}")
-    print(f"最大文件大小: {config.max_file_size_mb}MB")
-    print("="*50)
+    return True
 
 def main():
     """
     主函数
     """
+    app = None
+    
     try:
-        # 显示启动信息
-        show_startup_info()
+        _setup_logging()
         
-        # 检查依赖包
-        print("检查依赖包...")
-        if not check_dependencies():
-            return 1
-        print("✓ 依赖包检查通过")
+        # 启动阶段的输出先写入缓冲区，结束后一次性输出
+        startup_log = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(startup_log):
+                ready = _run_startup_checks()
+        finally:
+            sys.stdout.write(startup_log.getvalue())
+            sys.stdout.flush()
         
-        # 检查配置
-        print("检查配置...")
-        if not check_configuration():
+        if not ready:
             return 1
-        print("✓ 配置检查通过")
-        
-        print("启动应用程序...")
-        print("="*50)
         
-        # 创建并运行主窗口
-        app = MainWindow()
+        # 创建并运行主窗口（访问 MainWindow 时才真正执行模块代码）
+        main_window = _lazy_import('src.ui.main_window')
+        app = main_window.MainWindow()
         app.run()
         
         return 0
@@ -124,24 +273,43 @@ def main():
     except KeyboardInterrupt:
         print("\n程序被用户中断")
         return 0
+    except ImportError as e:
+        print(f"导入模块失败: {e}\n请确保已安装所有依赖包: pip install -r requirements.txt")
+        return 1
     except Exception as e:
         print(f"程序运行时发生错误: {e}")
         
         # 如果是图形界面错误，显示错误对话框
         try:
-            root = tk.Tk()
-            root.withdraw()  # 隐藏主窗口
-            messagebox.showerror(
-                "程序错误", 
-                f"程序运行时发生错误:\n{str(e)}\n\n请检查配置和依赖包是否正确安装。"
-            )
-            root.destroy()
+            import tkinter as tk
+            from tkinter import messagebox
+            
+            message = f"程序运行时发生错误:\n{str(e)}\n\n请检查配置和依赖包是否正确安装。"
+            
+            # 主窗口仍然存在时复用其Tk实例，避免再创建一个Tcl解释器
+            parent = getattr(app, 'root', None)
+            try:
+                if parent is None or not parent.winfo_exists():
+                    parent = None
+            except tk.TclError:
+                parent = None
+            
+            if parent is not None:
+                messagebox.showerror("程序错误", message, parent=parent)
+            else:
+                root = tk.Tk()
+                root.withdraw()  # 隐藏主窗口
+                messagebox.showerror("程序错误", message)
+                root.destroy()
         except:
             pass
         
         return 1
 
 if __name__ == "__main__":
+    # 打包为Windows可执行文件时需要
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     # 设置程序退出码
-    exit_code = main()
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(main())
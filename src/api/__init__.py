@@ -3,8 +3,26 @@
 """
 API模块
 包含与外部API交互的相关功能
+
+GeminiClient 按需导入，避免仅使用飞书客户端时加载 google.genai。
+设置环境变量 EAGER_IMPORT=1 可在导入时立即加载，便于在CI中尽早发现导入错误。
 """
 
-from .gemini_client import GeminiClient
+import os
+
+__all__ = ['GeminiClient']
+
+
+def __getattr__(name):
+    if name == 'GeminiClient':
+        from .gemini_client import GeminiClient
+        return GeminiClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
-__all__ = ['GeminiClient']
\ No newline at end of file
+if os.getenv('EAGER_IMPORT') == '1':
+    from .gemini_client import GeminiClient  # noqa: F401
@@ -6,11 +6,215 @@
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import os
 import time
-from typing import Dict, List, Optional, Any
+import random
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from datetime import datetime
 import logging
+import threading
+import weakref
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    序列化为UTF-8编码的JSON字节串，已安装orjson时使用orjson
+    
+    Args:
+        obj (Any): 待序列化对象
+        
+    Returns:
+        bytes: JSON字节串
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(content: bytes) -> Any:
+    """
+    解析JSON字节串，已安装orjson时使用orjson
+    
+    Args:
+        content (bytes): JSON字节串
+        
+    Returns:
+        Any: 解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _text_block(text: str) -> Dict:
+    """
+    构建云文档文本块
+    
+    Args:
+        text (str): 文本内容
+        
+    Returns:
+        Dict: 文本块结构
+    """
+    return {
+        "block_type": 2,  # 文本块
+        "text": {
+            "elements": [{
+                "text_run": {
+                    "content": text
+                }
+            }]
+        }
+    }
+
+# 访问令牌的本地缓存文件，按 app_id 保存，进程重启后可直接复用
+TOKEN_CACHE_FILE = Path.home() / '.feishu_token_cache.json'
+
+# 后台刷新令牌的提前量（秒），在 token_expires_at 之前再提前该时间刷新
+TOKEN_REFRESH_AHEAD = 300
+
+# 请求重试配置：仅对限流、服务端错误和网络异常重试
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_ERROR_CODES = frozenset({99991400})  # 飞书请求频率超限错误码
+
+# 可安全重发的幂等方法；其他方法（POST）只在确认服务端未处理请求时重试，避免重复写入
+IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# 被限流（429或频率超限错误码）时允许更多次重试和更长的等待
+RATE_LIMIT_MAX_ATTEMPTS = 8
+RATE_LIMIT_MAX_DELAY = 60.0
+
+# 熔断配置：时间窗口内连续失败达到阈值后熔断，冷却后放行一个探测请求
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_FAILURE_WINDOW = 30.0
+BREAKER_OPEN_SECONDS = 10.0
+
+class _CircuitBreaker:
+    """
+    简单的熔断器
+    关闭状态正常放行；失败过多时打开，直接拒绝请求；冷却后进入半开状态，只放行一个探测请求
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self):
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self.first_failure_at = 0.0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """
+        判断是否允许发起请求
+        
+        Returns:
+            bool: 是否允许
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.time() - self.opened_at >= BREAKER_OPEN_SECONDS:
+                # 冷却结束，放行一个探测请求
+                self.state = self.HALF_OPEN
+                return True
+            return False
+    
+    def record_success(self):
+        """记录一次成功请求，恢复为关闭状态"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.fail_count = 0
+    
+    def record_failure(self):
+        """记录一次失败请求，达到阈值或探测失败时打开熔断"""
+        with self._lock:
+            now = time.time()
+            if self.fail_count == 0 or now - self.first_failure_at > BREAKER_FAILURE_WINDOW:
+                self.fail_count = 0
+                self.first_failure_at = now
+            self.fail_count += 1
+            
+            if self.state == self.HALF_OPEN or self.fail_count >= BREAKER_FAILURE_THRESHOLD:
+                self.state = self.OPEN
+                self.opened_at = now
+
+# 视频分析表的字段定义
+VIDEO_ANALYSIS_FIELDS = (
+    {
+        "field_name": "文件名称",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "文件路径",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "文件大小",
+        "type": 2,  # 数字类型
+        "property": {}
+    },
+    {
+        "field_name": "文件格式",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "分析提示词",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "分析结果",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "创建时间",
+        "type": 5,  # 日期时间类型
+        "property": {}
+    },
+    {
+        "field_name": "序列ID",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "扣子调用ID",
+        "type": 1,  # 文本类型
+        "property": {}
+    },
+    {
+        "field_name": "标签",
+        "type": 1,  # 文本类型
+        "property": {}
+    }
+)
+
+# 批量创建字段时的最大并发请求数
+FIELD_CREATE_WORKERS = 5
+
+# 文档根block、字段配置等元数据的缓存有效期（秒）
+METADATA_CACHE_TTL = 600
 
 class FeishuClient:
     """
@@ -30,53 +234,255 @@ class FeishuClient:
         self.app_secret = app_secret
         self.access_token = None
         self.token_expires_at = 0
+        self._token_lock = threading.Lock()
+        self._refresh_timer = None
         self.base_url = "https://open.feishu.cn/open-apis"
         
+        # 复用HTTP连接，避免每次请求重新建立TCP+TLS连接
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Content-Type": "application/json; charset=utf-8"
+        })
+        self._methods = {
+            "GET": self._session.get,
+            "POST": self._session.post,
+            "PUT": self._session.put,
+            "DELETE": self._session.delete
+        }
+        
+        # 按接口类别（bitable、sheets、docx等）区分的熔断器
+        self._breakers = defaultdict(_CircuitBreaker)
+        
+        # 元数据缓存：{doc_token: (root_block_id, 缓存时间)}、{(app_token, table_id): (字段配置, 缓存时间)}
+        self._doc_root_cache: Dict[str, Tuple[str, float]] = {}
+        self._field_config_cache: Dict[Tuple[str, str], Tuple[Dict, float]] = {}
+        
         # 设置日志
         self.logger = logging.getLogger(__name__)
     
-    def _get_access_token(self) -> bool:
+    def _get_access_token(self, force_refresh: bool = False) -> bool:
         """
         获取访问令牌
         
+        Args:
+            force_refresh (bool): 是否忽略当前令牌强制重新获取（后台刷新时使用）
+        
         Returns:
             bool: 是否成功获取令牌
         """
+        with self._token_lock:
+            try:
+                if not force_refresh:
+                    # 检查当前令牌是否有效
+                    if self.access_token and time.time() < self.token_expires_at:
+                        return True
+                    
+                    # 尝试复用其他进程已获取的令牌
+                    if self._load_cached_token():
+                        return True
+                
+                url = f"{self.base_url}/auth/v3/tenant_access_token/internal"
+                data = {
+                    "app_id": self.app_id,
+                    "app_secret": self.app_secret
+                }
+                
+                response = self._session.post(url, json=data)
+                response.raise_for_status()
+                
+                result = _json_loads(response.content)
+                if result.get("code") == 0:
+                    # 令牌有效期为2小时，提前5分钟刷新
+                    self._set_access_token(
+                        result["tenant_access_token"],
+                        time.time() + result["expire"] - 300
+                    )
+                    self.logger.info("飞书访问令牌获取成功")
+                    self._save_cached_token()
+                    return True
+                else:
+                    self.logger.error(f"获取飞书访问令牌失败: {result.get('msg')}")
+                    return False
+                    
+            except Exception as e:
+                self.logger.error(f"获取飞书访问令牌异常: {str(e)}")
+                return False
+    
+    def _set_access_token(self, token: str, expires_at: float):
+        """
+        设置访问令牌，作为会话的默认Authorization请求头，并安排后台刷新
+        
+        Args:
+            token (str): 访问令牌
+            expires_at (float): 令牌失效（需要刷新）的时间戳
+        """
+        self.access_token = token
+        self.token_expires_at = expires_at
+        self._session.headers["Authorization"] = f"Bearer {token}"
+        self._schedule_token_refresh()
+    
+    def _schedule_token_refresh(self):
+        """
+        在令牌过期前（提前TOKEN_REFRESH_AHEAD秒）于后台线程刷新令牌，避免请求时同步等待刷新
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        
+        delay = self.token_expires_at - TOKEN_REFRESH_AHEAD - time.time()
+        if delay <= 0:
+            self._refresh_timer = None
+            return
+        
+        # 使用弱引用，客户端对象被回收后不再继续刷新
+        refresh = weakref.WeakMethod(self._refresh_access_token)
+        self._refresh_timer = threading.Timer(delay, lambda: refresh() and refresh()())
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _refresh_access_token(self):
+        """
+        后台刷新访问令牌
+        """
+        if not self._get_access_token(force_refresh=True):
+            self.logger.warning("后台刷新飞书访问令牌失败，将在下次请求时重试")
+    
+    def _load_cached_token(self) -> bool:
+        """
+        从本地缓存文件加载未过期的访问令牌
+        
+        Returns:
+            bool: 是否加载到有效令牌
+        """
         try:
-            # 检查当前令牌是否有效
-            if self.access_token and time.time() < self.token_expires_at:
-                return True
+            with open(TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                entry = json.load(f).get(self.app_id)
+        except (OSError, ValueError):
+            return False
+        
+        if not entry or time.time() >= entry.get('expires_at', 0):
+            return False
+        
+        self._set_access_token(entry['token'], entry['expires_at'])
+        self.logger.info("使用缓存的飞书访问令牌")
+        return True
+    
+    def _save_cached_token(self):
+        """
+        将当前访问令牌写入本地缓存文件
+        """
+        try:
+            try:
+                with open(TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+            except (OSError, ValueError):
+                cache = {}
             
-            url = f"{self.base_url}/auth/v3/tenant_access_token/internal"
-            headers = {
-                "Content-Type": "application/json; charset=utf-8"
+            # 顺便清理已过期的令牌
+            now = time.time()
+            cache = {
+                app_id: entry for app_id, entry in cache.items()
+                if isinstance(entry, dict) and entry.get('expires_at', 0) > now
             }
-            data = {
-                "app_id": self.app_id,
-                "app_secret": self.app_secret
+            cache[self.app_id] = {
+                'token': self.access_token,
+                'expires_at': self.token_expires_at
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            
-            result = response.json()
-            if result.get("code") == 0:
-                self.access_token = result["tenant_access_token"]
-                # 令牌有效期为2小时，提前5分钟刷新
-                self.token_expires_at = time.time() + result["expire"] - 300
-                self.logger.info("飞书访问令牌获取成功")
-                return True
-            else:
-                self.logger.error(f"获取飞书访问令牌失败: {result.get('msg')}")
-                return False
-                
+            # 先写临时文件再替换，避免多个进程同时写入时读到不完整的内容
+            fd, tmp_path = tempfile.mkstemp(dir=str(TOKEN_CACHE_FILE.parent), prefix='.feishu_token_')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, TOKEN_CACHE_FILE)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
         except Exception as e:
-            self.logger.error(f"获取飞书访问令牌异常: {str(e)}")
-            return False
+            self.logger.debug(f"保存飞书访问令牌缓存失败: {str(e)}")
+    
+    def _do_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
+        """
+        发起单次HTTP请求并解析响应
+        
+        Args:
+            method (str): HTTP方法
+            endpoint (str): API端点
+            data (Dict, optional): 请求数据
+            params (Dict, optional): URL参数
+            
+        Returns:
+            Dict: 完整的响应JSON
+            
+        Raises:
+            requests.exceptions.RequestException: 网络错误或HTTP错误状态码
+        """
+        method = method.upper()
+        send = self._methods.get(method)
+        if send is None:
+            raise ValueError(f"不支持的HTTP方法: {method}")
+        
+        url = f"{self.base_url}{endpoint}"
+        
+        # 记录请求详情
+        self.logger.info(f"发起API请求: {method} {url}")
+        if params:
+            self.logger.info(f"请求参数: {params}")
+        if data:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("请求数据: %s", _json_dumps(data).decode("utf-8"))
+        
+        if method == "GET":
+            response = send(url, params=params or data)
+        elif method == "DELETE":
+            response = send(url, params=params)
+        else:
+            # 预先序列化请求体，Content-Type 已在会话中设置
+            body = _json_dumps(data) if data is not None else None
+            response = send(url, data=body, params=params)
+        
+        # 记录响应状态
+        self.logger.info(f"响应状态码: {response.status_code}")
+        
+        response.raise_for_status()
+        result = _json_loads(response.content)
+        
+        # 记录响应详情
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("响应结果: %s", _json_dumps(result).decode("utf-8"))
+        
+        return result
+    
+    def _retry_delay(self, attempt: int, response=None, rate_limited: bool = False) -> float:
+        """
+        计算重试等待时间：优先使用Retry-After响应头，否则指数退避并加入随机抖动
+        
+        Args:
+            attempt (int): 当前重试次数（从0开始）
+            response: HTTP响应对象（可选）
+            rate_limited (bool): 是否因限流而重试（允许更长的等待）
+            
+        Returns:
+            float: 等待秒数
+        """
+        max_delay = RATE_LIMIT_MAX_DELAY if rate_limited else RETRY_MAX_DELAY
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(max_delay, float(retry_after))
+                except ValueError:
+                    pass
+        
+        delay = RETRY_BASE_DELAY * (2 ** attempt) * (1 + random.random() * RETRY_JITTER)
+        return min(max_delay, delay)
     
     def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Optional[Dict]:
         """
-        发起API请求
+        发起API请求，对限流、服务端错误和网络异常进行指数退避重试
+        
+        同一类接口连续失败时熔断一段时间，期间直接返回None而不发起网络请求。
         
         Args:
             method (str): HTTP方法
@@ -87,73 +493,170 @@ class FeishuClient:
         Returns:
             Optional[Dict]: 响应数据
         """
+        breaker = self._breakers[self._endpoint_category(endpoint)]
+        if not breaker.allow():
+            self.logger.warning(f"飞书接口暂时不可用（熔断中），跳过请求: {method.upper()} {endpoint}")
+            return None
+        
         if not self._get_access_token():
             self.logger.error("获取访问令牌失败")
+            breaker.record_failure()
             return None
         
-        try:
-            url = f"{self.base_url}{endpoint}"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json; charset=utf-8"
-            }
-            
-            # 记录请求详情
-            self.logger.info(f"发起API请求: {method.upper()} {url}")
-            if params:
-                self.logger.info(f"请求参数: {params}")
-            if data:
-                self.logger.info(f"请求数据: {json.dumps(data, ensure_ascii=False, indent=2)}")
-            
-            if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params or data)
-            elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, json=data, params=params)
-            elif method.upper() == "PUT":
-                response = requests.put(url, headers=headers, json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"不支持的HTTP方法: {method}")
-            
-            # 记录响应状态
-            self.logger.info(f"响应状态码: {response.status_code}")
+        result, service_ok = self._request_with_retry(method, endpoint, data, params)
+        if service_ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        return result
+    
+    @staticmethod
+    def _endpoint_category(endpoint: str) -> str:
+        """
+        获取接口所属类别（如 bitable、sheets、docx），用于区分熔断器
+        
+        Args:
+            endpoint (str): API端点
             
-            response.raise_for_status()
-            result = response.json()
+        Returns:
+            str: 接口类别
+        """
+        return endpoint.lstrip('/').split('/', 1)[0]
+    
+    def _request_with_retry(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Tuple[Optional[Dict], bool]:
+        """
+        发起API请求并重试可恢复的错误
+        
+        POST等非幂等请求只在服务端确定未处理时重试（连接失败、429、频率超限），
+        读取超时、连接中断和5xx时写入可能已生效，重发会产生重复记录。
+        
+        Args:
+            method (str): HTTP方法
+            endpoint (str): API端点
+            data (Dict, optional): 请求数据
+            params (Dict, optional): URL参数
             
-            # 记录响应详情
-            self.logger.info(f"响应结果: {json.dumps(result, ensure_ascii=False, indent=2)}")
+        Returns:
+            Tuple[Optional[Dict], bool]: (响应数据, 服务端是否正常响应)
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            try:
+                result = self._do_request(method, endpoint, data, params)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # 读取超时或连接中断时服务端可能已处理请求，非幂等请求不重发
+                if not (idempotent or self._request_not_sent(e)) or attempt >= RETRY_MAX_ATTEMPTS - 1:
+                    self.logger.error(f"API请求异常: {str(e)}")
+                    return None, False
+                delay = self._retry_delay(attempt)
+                self.logger.warning(f"API请求网络异常，{delay:.1f}秒后重试 ({attempt + 1}/{RETRY_MAX_ATTEMPTS}): {str(e)}")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            except Exception as e:
+                response = getattr(e, 'response', None)
+                # 429表示请求未被处理，可以重发；5xx时服务端可能已处理，只重试幂等请求
+                if (response is not None and response.status_code in RETRY_STATUS_CODES
+                        and (idempotent or response.status_code == 429)):
+                    rate_limited = response.status_code == 429
+                    max_attempts = RATE_LIMIT_MAX_ATTEMPTS if rate_limited else RETRY_MAX_ATTEMPTS
+                    if attempt < max_attempts - 1:
+                        delay = self._retry_delay(attempt, response, rate_limited)
+                        self.logger.warning(f"API请求返回 {response.status_code}，{delay:.1f}秒后重试 ({attempt + 1}/{max_attempts})")
+                        time.sleep(delay)
+                        attempt += 1
+                        continue
+                
+                self.logger.error(f"API请求异常: {str(e)}")
+                # 记录详细的错误信息
+                if response is not None:
+                    self.logger.error(f"响应状态码: {response.status_code}")
+                    try:
+                        error_detail = _json_loads(response.content)
+                        self.logger.error("API错误详情: %s", _json_dumps(error_detail).decode("utf-8"))
+                    except:
+                        self.logger.error(f"API响应内容: {response.text}")
+                # 未收到响应或服务端错误视为服务异常，客户端错误（4xx）不计入
+                return None, response is not None and response.status_code not in RETRY_STATUS_CODES
             
             if result.get("code") == 0:
                 self.logger.info("API请求成功")
-                return result.get("data")
-            else:
-                error_code = result.get('code')
-                error_msg = result.get('msg')
-                self.logger.error(f"API请求失败: code={error_code}, msg={error_msg}")
-                
-                # 检查特定的错误类型
-                if error_code == 1254005:  # 记录不存在
-                    self.logger.error("错误类型: 记录不存在 (RecordIdNotFound)")
-                elif error_code == 1254004:  # 表格不存在
-                    self.logger.error("错误类型: 表格不存在")
-                elif error_code == 1254001:  # 应用不存在
-                    self.logger.error("错误类型: 应用不存在")
-                
-                return None
-                
-        except Exception as e:
-            self.logger.error(f"API请求异常: {str(e)}")
-            # 记录详细的错误信息
-            if hasattr(e, 'response') and e.response is not None:
-                self.logger.error(f"响应状态码: {e.response.status_code}")
-                try:
-                    error_detail = e.response.json()
-                    self.logger.error(f"API错误详情: {json.dumps(error_detail, ensure_ascii=False, indent=2)}")
-                except:
-                    self.logger.error(f"API响应内容: {e.response.text}")
-            return None
+                return result.get("data"), True
+            
+            error_code = result.get('code')
+            error_msg = result.get('msg')
+            
+            if error_code in RETRY_ERROR_CODES and attempt < RATE_LIMIT_MAX_ATTEMPTS - 1:
+                delay = self._retry_delay(attempt, rate_limited=True)
+                self.logger.warning(f"API请求被限流: code={error_code}，{delay:.1f}秒后重试 ({attempt + 1}/{RATE_LIMIT_MAX_ATTEMPTS})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+            
+            self.logger.error(f"API请求失败: code={error_code}, msg={error_msg}")
+            
+            # 检查特定的错误类型
+            if error_code == 1254005:  # 记录不存在
+                self.logger.error("错误类型: 记录不存在 (RecordIdNotFound)")
+            elif error_code == 1254004:  # 表格不存在
+                self.logger.error("错误类型: 表格不存在")
+            elif error_code == 1254001:  # 应用不存在
+                self.logger.error("错误类型: 应用不存在")
+            
+            # 重试后仍被限流视为服务异常，其他业务错误说明服务正常
+            return None, error_code not in RETRY_ERROR_CODES
+    
+    @staticmethod
+    def _request_not_sent(error: Exception) -> bool:
+        """
+        判断网络异常是否发生在请求发出之前（连接超时或连接被拒绝），此时重发不会重复执行
+        
+        Args:
+            error (Exception): requests抛出的网络异常
+            
+        Returns:
+            bool: 请求是否确定未发出
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        
+        # 连接被拒绝的原始异常被urllib3和requests层层包装，沿异常链和参数查找
+        pending = [error]
+        seen = set()
+        while pending:
+            exc = pending.pop()
+            if id(exc) in seen:
+                continue
+            seen.add(id(exc))
+            if isinstance(exc, ConnectionRefusedError):
+                return True
+            linked = (*exc.args, exc.__cause__, exc.__context__, getattr(exc, 'reason', None))
+            pending.extend(item for item in linked if isinstance(item, BaseException))
+        return False
+    
+    def _make_requests_concurrently(self, requests_args: List[tuple], max_workers: int = 10) -> List[Optional[Dict]]:
+        """
+        并发发起多个相互独立的API请求
+        
+        Args:
+            requests_args (List[tuple]): 每个请求的 _make_request 参数元组 (method, endpoint[, data[, params]])
+            max_workers (int): 最大并发数，用于控制请求频率
+            
+        Returns:
+            List[Optional[Dict]]: 与请求顺序一致的响应数据列表
+        """
+        if not requests_args:
+            return []
+        
+        # 先在当前线程获取令牌，避免各线程重复请求令牌
+        if not self._get_access_token():
+            self.logger.error("获取访问令牌失败")
+            return [None] * len(requests_args)
+        
+        workers = min(max_workers, len(requests_args))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda args: self._make_request(*args), requests_args))
     
     def create_bitable(self, name: str, folder_token: str = None) -> Optional[str]:
         """
@@ -209,12 +712,21 @@ class FeishuClient:
         Returns:
             bool: 是否创建成功
         """
+        endpoint = f"/bitable/v1/apps/{app_token}/tables/{table_id}/fields"
+        # 各字段的创建互不依赖，并发发起请求（限制并发数以免超出飞书应用的QPS限制）
+        results = self._make_requests_concurrently(
+            [("POST", endpoint, field) for field in fields],
+            max_workers=FIELD_CREATE_WORKERS
+        )
         success_count = 0
-        for field in fields:
-            # 修复API调用参数格式
-            result = self._make_request("POST", f"/bitable/v1/apps/{app_token}/tables/{table_id}/fields", field)
+        for field, result in zip(fields, results):
             if result:
                 success_count += 1
+            else:
+                self.logger.error(f"创建字段失败: {field.get('field_name')}")
+        
+        # 字段已变化，清除该表的字段配置缓存
+        self._field_config_cache.pop((app_token, table_id), None)
         
         return success_count == len(fields)
     
@@ -249,6 +761,7 @@ class FeishuClient:
             
             if result:
                 self.logger.info(f"成功创建字段: {field_name}")
+                self._field_config_cache.pop((self.app_token, self.table_id), None)
                 return True
             else:
                 self.logger.error(f"创建字段失败: {field_name}")
@@ -303,21 +816,77 @@ class FeishuClient:
             "fields": record_data
         }
         
-        # 先检查记录是否存在
-        try:
-            # 尝试获取记录来验证其存在性
-            get_result = self._make_request("GET", f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/{record_id}")
-            if get_result is None:
-                self.logger.warning(f"记录 {record_id} 不存在，无法更新")
-                return False
-        except Exception as e:
-            self.logger.warning(f"检查记录存在性时出错: {str(e)}")
-            # 继续尝试更新，让API返回具体错误
-        
+        # 记录不存在时接口返回 1254005，由 _make_request 记录错误类型
         result = self._make_request("PUT", f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/{record_id}", data)
         return result is not None
     
-    def get_records(self, app_token: str, table_id: str, page_size: int = 100, page_token: str = None) -> Optional[Dict]:
+    def batch_add_records(self, app_token: str, table_id: str, records: List[Dict], batch_size: int = 500) -> List[Optional[str]]:
+        """
+        批量添加记录到多维表格（每批一次请求）
+        
+        Args:
+            app_token (str): 表格令牌
+            table_id (str): 数据表ID
+            records (List[Dict]): 记录数据列表
+            batch_size (int): 每批记录数，飞书接口单次上限为1000
+            
+        Returns:
+            List[Optional[str]]: 与输入顺序一致的记录ID列表，失败的批次对应位置为None
+        """
+        url = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_create"
+        params = {
+            "user_id_type": "open_id"
+        }
+        
+        record_ids = []
+        for i in range(0, len(records), batch_size):
+            chunk = records[i:i + batch_size]
+            data = {
+                "records": [{"fields": record_data} for record_data in chunk]
+            }
+            
+            result = self._make_request("POST", url, data, params)
+            created = result.get("records", []) if result else []
+            if len(created) == len(chunk):
+                record_ids.extend(record.get("record_id") for record in created)
+            else:
+                self.logger.error(f"批量添加记录失败: 第 {i + 1}-{i + len(chunk)} 条")
+                record_ids.extend([None] * len(chunk))
+        
+        return record_ids
+    
+    def batch_update_records(self, app_token: str, table_id: str, records: Dict[str, Dict], batch_size: int = 500) -> List[bool]:
+        """
+        批量更新记录（每批一次请求）
+        
+        Args:
+            app_token (str): 表格令牌
+            table_id (str): 数据表ID
+            records (Dict[str, Dict]): 记录ID到更新数据的映射
+            batch_size (int): 每批记录数，飞书接口单次上限为1000
+            
+        Returns:
+            List[bool]: 与输入顺序一致的更新结果列表
+        """
+        url = f"/bitable/v1/apps/{app_token}/tables/{table_id}/records/batch_update"
+        items = list(records.items())
+        
+        results = []
+        for i in range(0, len(items), batch_size):
+            chunk = items[i:i + batch_size]
+            data = {
+                "records": [
+                    {"record_id": record_id, "fields": record_data}
+                    for record_id, record_data in chunk
+                ]
+            }
+            
+            result = self._make_request("POST", url, data)
+            results.extend([result is not None] * len(chunk))
+        
+        return results
+    
+    def get_records(self, app_token: str, table_id: str, page_size: int = 500, page_token: str = None) -> Optional[Dict]:
         """
         获取记录列表
         
@@ -336,6 +905,30 @@ class FeishuClient:
         
         return self._make_request("GET", f"/bitable/v1/apps/{app_token}/tables/{table_id}/records", params)
     
+    def iter_records(self, app_token: str, table_id: str, page_size: int = 500) -> Iterator[Dict]:
+        """
+        逐条遍历数据表中的所有记录，内部自动分页
+        
+        Args:
+            app_token (str): 表格令牌
+            table_id (str): 数据表ID
+            page_size (int): 每页记录数，飞书接口上限为500
+            
+        Yields:
+            Dict: 单条记录
+        """
+        page_token = None
+        while True:
+            result = self.get_records(app_token, table_id, page_size=page_size, page_token=page_token)
+            if not result:
+                return
+            
+            yield from result.get("items") or []
+            
+            page_token = result.get("page_token")
+            if not result.get("has_more") or not page_token:
+                return
+    
     def delete_record(self, app_token: str, table_id: str, record_id: str) -> bool:
         """
         删除记录
@@ -390,6 +983,11 @@ class FeishuClient:
         Returns:
             Optional[Dict]: 字段配置信息
         """
+        cache_key = (app_token, table_id)
+        cached = self._field_config_cache.get(cache_key)
+        if cached and time.time() - cached[1] < METADATA_CACHE_TTL:
+            return cached[0]
+        
         try:
             result = self._make_request(
                 "GET", 
@@ -410,6 +1008,7 @@ class FeishuClient:
                             'property': field.get('property', {}),
                             'ui_type': field.get('ui_type', '')
                         }
+                    self._field_config_cache[cache_key] = (field_config, time.time())
                     return field_config
                 else:
                     self.logger.error(f"获取字段配置失败，响应格式不正确: {result}")
@@ -429,58 +1028,8 @@ class FeishuClient:
         Returns:
             List[Dict]: 字段定义列表
         """
-        return [
-            {
-                "field_name": "文件名称",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "文件路径",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "文件大小",
-                "type": 2,  # 数字类型
-                "property": {}
-            },
-            {
-                "field_name": "文件格式",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "分析提示词",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "分析结果",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "创建时间",
-                "type": 5,  # 日期时间类型
-                "property": {}
-            },
-            {
-                "field_name": "序列ID",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "扣子调用ID",
-                "type": 1,  # 文本类型
-                "property": {}
-            },
-            {
-                "field_name": "标签",
-                "type": 1,  # 文本类型
-                "property": {}
-            }
-        ]
+        # 返回副本，避免调用方修改共享的字段定义
+        return [{**field, "property": dict(field["property"])} for field in VIDEO_ANALYSIS_FIELDS]
     
     def get_spreadsheet_info(self, spreadsheet_token: str) -> Optional[Dict]:
         """
@@ -558,7 +1107,7 @@ class FeishuClient:
             self.logger.info(f"准备更新电子表格: {spreadsheet_token[:10]}...")
             self.logger.info(f"工作表ID: {sheet_id}")
             self.logger.info(f"范围: {range_str}")
-            self.logger.info(f"数据: {values}")
+            self.logger.debug("数据: %s", values)
             
             # 直接调用底层请求，不通过_make_request以获得更详细的控制
             if not self._get_access_token():
@@ -566,21 +1115,18 @@ class FeishuClient:
                 return False
             
             url = f"{self.base_url}{endpoint}"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json; charset=utf-8"
-            }
             
             self.logger.info(f"发起PUT请求: {url}")
-            response = requests.put(url, headers=headers, json=data)
+            response = self._session.put(url, data=_json_dumps(data))
             
             self.logger.info(f"响应状态码: {response.status_code}")
-            self.logger.info(f"响应头: {dict(response.headers)}")
+            self.logger.debug("响应头: %s", response.headers)
             
             if response.status_code == 200:
                 try:
-                    result = response.json()
-                    self.logger.info(f"响应内容: {json.dumps(result, ensure_ascii=False, indent=2)}")
+                    result = _json_loads(response.content)
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("响应内容: %s", _json_dumps(result).decode("utf-8"))
                     
                     # 检查是否有错误码
                     if 'code' in result and result['code'] != 0:
@@ -708,19 +1254,16 @@ class FeishuClient:
         
         try:
             url = f"{self.base_url}{endpoint}"
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json; charset=utf-8"
-            }
             
             self.logger.info(f"发起云文档API请求: GET {url}")
-            response = requests.get(url, headers=headers)
+            response = self._session.get(url)
             
             self.logger.info(f"云文档API响应状态码: {response.status_code}")
             
             if response.status_code == 200:
-                result = response.json()
-                self.logger.info(f"云文档API响应: {json.dumps(result, ensure_ascii=False, indent=2)}")
+                result = _json_loads(response.content)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("云文档API响应: %s", _json_dumps(result).decode("utf-8"))
                 
                 if result.get("code") == 0:
                     return result.get("data", {})
@@ -732,8 +1275,8 @@ class FeishuClient:
             else:
                 self.logger.error(f"云文档API请求HTTP错误: {response.status_code}")
                 try:
-                    error_detail = response.json()
-                    self.logger.error(f"错误详情: {json.dumps(error_detail, ensure_ascii=False, indent=2)}")
+                    error_detail = _json_loads(response.content)
+                    self.logger.error("错误详情: %s", _json_dumps(error_detail).decode("utf-8"))
                 except:
                     self.logger.error(f"错误响应内容: {response.text}")
                 return None
@@ -771,68 +1314,45 @@ class FeishuClient:
             bool: 是否成功
         """
         try:
-            # 首先测试文档连接
-            if not self.test_doc_connection(doc_token):
-                self.logger.error(f"文档连接测试失败，doc_token: {doc_token}")
-                return False
-            
-            # 获取文档信息以确定插入位置
-            doc_info = self.get_doc_info(doc_token)
-            if not doc_info:
-                self.logger.error(f"无法获取文档信息，doc_token: {doc_token}")
-                return False
-            
-            # 获取文档的blocks信息，找到根block
-            blocks_endpoint = f"/docx/v1/documents/{doc_token}/blocks"
-            blocks_result = self._make_request("GET", blocks_endpoint, params={"document_revision_id": -1, "page_size": 1})
-            
-            if not blocks_result:
-                self.logger.error("获取文档blocks失败: 请求返回空结果")
-                return False
-            
-            # 获取根block ID - _make_request已经返回了data部分
-            blocks = blocks_result.get("items", [])
-            if not blocks:
-                self.logger.error("文档中没有找到blocks")
-                return False
+            # 根block在文档生命周期内不变，优先使用缓存
+            root_block_id = None
+            cached = self._doc_root_cache.get(doc_token)
+            if cached and time.time() - cached[1] < METADATA_CACHE_TTL:
+                root_block_id = cached[0]
             
-            root_block_id = blocks[0].get("block_id")
-            if not root_block_id:
-                self.logger.error("无法获取根block ID")
-                return False
+            if root_block_id is None:
+                # 获取文档的blocks信息，找到根block（文档不存在或无权限时请求失败，同时起到连接检查的作用）
+                blocks_endpoint = f"/docx/v1/documents/{doc_token}/blocks"
+                blocks_result = self._make_request("GET", blocks_endpoint, params={"document_revision_id": -1, "page_size": 1})
+                
+                if not blocks_result:
+                    self.logger.error(f"获取文档blocks失败，doc_token: {doc_token}")
+                    return False
+                
+                # 获取根block ID - _make_request已经返回了data部分
+                blocks = blocks_result.get("items", [])
+                if not blocks:
+                    self.logger.error("文档中没有找到blocks")
+                    return False
+                
+                root_block_id = blocks[0].get("block_id")
+                if not root_block_id:
+                    self.logger.error("无法获取根block ID")
+                    return False
+                
+                self._doc_root_cache[doc_token] = (root_block_id, time.time())
             
             # 构建插入内容的请求 - 使用正确的端点格式
             endpoint = f"/docx/v1/documents/{doc_token}/blocks/{root_block_id}/children"
             
-            # 将内容按行分割并构建块结构
-            lines = content.split('\n')
-            children = []
-            
-            for line in lines:
-                if line.strip():  # 非空行
-                    children.append({
-                        "block_type": 2,  # 文本块
-                        "text": {
-                            "elements": [{
-                                "text_run": {
-                                    "content": line + "\n"
-                                }
-                            }]
-                        }
-                    })
+            # 将内容按行分割并构建块结构，单行内容无需分割
+            if '\n' not in content:
+                lines = (content,)
+            else:
+                lines = [line for line in content.split('\n') if line.strip()]
             
             # 如果没有有效内容，添加一个空行
-            if not children:
-                children.append({
-                    "block_type": 2,
-                    "text": {
-                        "elements": [{
-                            "text_run": {
-                                "content": content + "\n"
-                            }
-                        }]
-                    }
-                })
+            children = [_text_block(line + "\n") for line in lines] or [_text_block(content + "\n")]
             
             data = {
                 "children": children,
@@ -846,6 +1366,8 @@ class FeishuClient:
                 self.logger.info("云文档内容追加成功")
                 return True
             else:
+                # 可能是文档已删除或根block失效，清除缓存以便下次重新获取
+                self._doc_root_cache.pop(doc_token, None)
                 self.logger.error("云文档内容追加失败: API请求失败")
                 return False
                 
@@ -7,10 +7,65 @@
 
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Tuple, List
 
 import lark_oapi as lark
-from lark_oapi.api.docx.v1 import *
+from lark_oapi.api.docx.v1 import (
+    CreateDocumentBlockChildrenRequest,
+    CreateDocumentBlockChildrenRequestBody,
+    GetDocumentRequest,
+    ListDocumentBlockRequest,
+)
+
+# 文本块类型
+TEXT_BLOCK_TYPE = 2
+
+
+def _build_children(content: str, block_type: int = TEXT_BLOCK_TYPE) -> List[Dict[str, Any]]:
+    """
+    将文本按行构建为飞书文档块（与接口JSON结构一致的字典）
+    
+    Args:
+        content (str): 文本内容
+        block_type (int): 块类型
+        
+    Returns:
+        List[Dict[str, Any]]: 文档块列表
+    """
+    lines = [line for line in content.splitlines() if line.strip()]
+    
+    # 如果没有有效内容，添加一个包含原始内容的块
+    if not lines:
+        lines = [content]
+    
+    return [
+        {
+            'block_type': block_type,
+            'text': {'elements': [{'text_run': {'content': line + '\n'}}]}
+        }
+        for line in lines
+    ]
+
+
+@dataclass
+class DocInfo:
+    """云文档基本信息"""
+    __slots__ = ('document_id', 'revision_id', 'title')
+    
+    document_id: str
+    revision_id: int
+    title: str
+
+
+@dataclass
+class BlockSummary:
+    """文档块摘要"""
+    __slots__ = ('block_id', 'block_type')
+    
+    block_id: str
+    block_type: int
 
 
 class FeishuSDKClient:
@@ -19,6 +74,10 @@ class FeishuSDKClient:
     使用飞书官方Python SDK实现云文档操作
     """
     
+    # 按(app_id, app_secret)共享的SDK客户端，复用连接与租户token
+    _clients: Dict[Tuple[str, str], lark.Client] = {}
+    _clients_lock = threading.Lock()
+    
     def __init__(self, app_id: str, app_secret: str):
         """
         初始化飞书SDK客户端
@@ -31,12 +90,35 @@ class FeishuSDKClient:
         self.app_secret = app_secret
         self.logger = logging.getLogger(__name__)
         
-        # 创建飞书客户端
-        self.client = lark.Client.builder() \
-            .app_id(app_id) \
-            .app_secret(app_secret) \
-            .log_level(lark.LogLevel.INFO) \
-            .build()
+        # 获取共享的飞书客户端
+        self.client = self.get_client(app_id, app_secret)
+        
+        # 根块ID缓存：{doc_token: root_block_id}，根块在文档生命周期内不变
+        self._root_cache: Dict[str, str] = {}
+    
+    @classmethod
+    def get_client(cls, app_id: str, app_secret: str) -> lark.Client:
+        """
+        获取应用凭证对应的共享飞书客户端，不存在时创建
+        
+        Args:
+            app_id (str): 飞书应用ID
+            app_secret (str): 飞书应用密钥
+            
+        Returns:
+            lark.Client: 共享的客户端实例
+        """
+        key = (app_id, app_secret)
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None:
+                client = lark.Client.builder() \
+                    .app_id(app_id) \
+                    .app_secret(app_secret) \
+                    .log_level(lark.LogLevel.INFO) \
+                    .build()
+                cls._clients[key] = client
+            return client
     
     def test_doc_connection(self, doc_token: str) -> bool:
         """
@@ -55,7 +137,7 @@ class FeishuSDKClient:
             self.logger.error(f"测试云文档连接失败: {str(e)}")
             return False
     
-    def get_doc_info(self, doc_token: str) -> Optional[Dict[str, Any]]:
+    def get_doc_info(self, doc_token: str) -> Optional[DocInfo]:
         """
         获取云文档信息
         
@@ -63,7 +145,7 @@ class FeishuSDKClient:
             doc_token (str): 云文档token
             
         Returns:
-            Optional[Dict[str, Any]]: 云文档信息
+            Optional[DocInfo]: 云文档信息
         """
         try:
             # 构造请求对象
@@ -80,14 +162,17 @@ class FeishuSDKClient:
                     f"获取文档信息失败, code: {response.code}, msg: {response.msg}, log_id: {response.get_log_id()}")
                 return None
             
-            # 返回文档信息
-            return response.data.__dict__ if response.data else None
+            # 返回文档信息（复制所需字段，避免调用方修改SDK对象）
+            document = response.data.document if response.data else None
+            if document is None:
+                return None
+            return DocInfo(document.document_id, document.revision_id, document.title)
             
         except Exception as e:
             self.logger.error(f"获取云文档信息异常: {str(e)}")
             return None
     
-    def get_doc_blocks(self, doc_token: str, page_size: int = 500) -> Optional[Dict[str, Any]]:
+    def get_doc_blocks(self, doc_token: str, page_size: int = 500) -> Optional[List[BlockSummary]]:
         """
         获取文档块信息
         
@@ -96,7 +181,7 @@ class FeishuSDKClient:
             page_size (int): 页面大小
             
         Returns:
-            Optional[Dict[str, Any]]: 文档块信息
+            Optional[List[BlockSummary]]: 第一页的文档块摘要
         """
         try:
             # 构造请求对象
@@ -116,12 +201,49 @@ class FeishuSDKClient:
                 return None
             
             # 返回块信息
-            return response.data.__dict__ if response.data else None
+            if not response.data:
+                return None
+            return [BlockSummary(b.block_id, b.block_type) for b in response.data.items or ()]
             
         except Exception as e:
             self.logger.error(f"获取文档块异常: {str(e)}")
             return None
     
+    def _get_root_block_id(self, doc_token: str) -> Optional[str]:
+        """
+        获取文档根块ID，优先使用缓存
+        
+        Args:
+            doc_token (str): 云文档token
+            
+        Returns:
+            Optional[str]: 根块ID，获取失败时返回None
+        """
+        root_block_id = self._root_cache.get(doc_token)
+        if root_block_id:
+            return root_block_id
+        
+        # 首先测试文档连接
+        if not self.test_doc_connection(doc_token):
+            self.logger.error(f"文档连接测试失败，doc_token: {doc_token}")
+            return None
+        
+        # 获取文档块信息，找到根块
+        blocks = self.get_doc_blocks(doc_token, page_size=1)
+        if not blocks:
+            self.logger.error("无法获取文档块信息")
+            return None
+        
+        # 获取根块ID
+        root_block_id = blocks[0].block_id
+        if not root_block_id:
+            self.logger.error("无法获取根块ID")
+            return None
+        
+        self.logger.info(f"找到根块ID: {root_block_id}")
+        self._root_cache[doc_token] = root_block_id
+        return root_block_id
+    
     def append_doc_content(self, doc_token: str, content: str) -> bool:
         """
         向云文档追加内容
@@ -134,98 +256,58 @@ class FeishuSDKClient:
             bool: 是否成功
         """
         try:
-            # 首先测试文档连接
-            if not self.test_doc_connection(doc_token):
-                self.logger.error(f"文档连接测试失败，doc_token: {doc_token}")
-                return False
-            
-            # 获取文档块信息，找到根块
-            blocks_info = self.get_doc_blocks(doc_token, page_size=1)
-            if not blocks_info or not blocks_info.get('items'):
-                self.logger.error("无法获取文档块信息")
-                return False
-            
-            # 获取根块ID
-            root_block = blocks_info['items'][0]
-            # Block对象使用属性访问，不是字典
-            root_block_id = getattr(root_block, 'block_id', None)
-            if not root_block_id:
-                self.logger.error("无法获取根块ID")
-                return False
-            
-            self.logger.info(f"找到根块ID: {root_block_id}")
-            
-            # 将内容按行分割并构建块结构
-            lines = content.split('\n')
-            children = []
-            
-            for line in lines:
-                if line.strip():  # 非空行
-                    # 创建文本块
-                    text_element = TextElement.builder() \
-                        .text_run(TextRun.builder().content(line + "\n").build()) \
-                        .build()
-                    
-                    text_block = Text.builder() \
-                        .elements([text_element]) \
-                        .build()
-                    
-                    block = Block.builder() \
-                        .block_type(2) \
-                        .text(text_block) \
-                        .build()
-                    
-                    children.append(block)
-            
-            # 如果没有有效内容，添加一个包含原始内容的块
-            if not children:
-                text_element = TextElement.builder() \
-                    .text_run(TextRun.builder().content(content + "\n").build()) \
-                    .build()
-                
-                text_block = Text.builder() \
-                    .elements([text_element]) \
-                    .build()
-                
-                block = Block.builder() \
-                    .block_type(2) \
-                    .text(text_block) \
-                    .build()
-                
-                children.append(block)
+            return self._create_children(doc_token, _build_children(content))
             
-            # 构造请求对象
-            request_body = CreateDocumentBlockChildrenRequestBody.builder() \
-                .children(children) \
-                .index(-1) \
-                .document_revision_id(-1) \
-                .build()
+        except Exception as e:
+            self.logger.error(f"云文档内容追加异常: {str(e)}")
+            return False
+    
+    def _create_children(self, doc_token: str, children: List[Dict[str, Any]]) -> bool:
+        """
+        在文档根块末尾插入子块
+        
+        Args:
+            doc_token (str): 云文档token
+            children (List[Dict[str, Any]]): 要插入的块
             
-            request = CreateDocumentBlockChildrenRequest.builder() \
-                .document_id(doc_token) \
-                .block_id(root_block_id) \
-                .request_body(request_body) \
-                .build()
+        Returns:
+            bool: 是否成功
+        """
+        root_block_id = self._get_root_block_id(doc_token)
+        if not root_block_id:
+            return False
+        
+        # 构造请求对象（请求体直接由字典构建，无需逐个调用构建器）
+        request_body = CreateDocumentBlockChildrenRequestBody({
+            'children': children,
+            'index': -1,
+            'document_revision_id': -1
+        })
+        
+        request = CreateDocumentBlockChildrenRequest.builder() \
+            .document_id(doc_token) \
+            .block_id(root_block_id) \
+            .request_body(request_body) \
+            .build()
+        
+        # 发起请求
+        response = self.client.docx.v1.document_block_children.create(request)
+        
+        # 处理失败返回
+        if not response.success():
+            self.logger.error(
+                f"追加文档内容失败, code: {response.code}, msg: {response.msg}, log_id: {response.get_log_id()}")
             
-            # 发起请求
-            response = self.client.docx.v1.document_block_children.create(request)
+            # 文档可能已删除或权限变更，清除根块缓存以便下次重新获取
+            self._root_cache.pop(doc_token, None)
             
-            # 处理失败返回
-            if not response.success():
-                self.logger.error(
-                    f"追加文档内容失败, code: {response.code}, msg: {response.msg}, log_id: {response.get_log_id()}")
-                
-                # 提供更详细的错误信息
-                if response.code == 99991663:
-                    self.logger.error("权限不足：请确保应用已被添加为文档协作者")
-                elif response.code == 99991400:
-                    self.logger.error("文档不存在或token无效")
-                
-                return False
-            
-            self.logger.info("云文档内容追加成功")
-            return True
+            # 提供更详细的错误信息
+            if response.code == 99991663:
+                self.logger.error("权限不足：请确保应用已被添加为文档协作者")
+            elif response.code == 99991400:
+                self.logger.error("文档不存在或token无效")
             
-        except Exception as e:
-            self.logger.error(f"云文档内容追加异常: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+        
+        self.logger.info("云文档内容追加成功")
+        return True
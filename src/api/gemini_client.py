@@ -6,11 +6,225 @@ Gemini API客户端模块
 """
 
 import os
+import json
 import time
-from typing import Optional, Dict, Any
-from google import genai
+import logging
+import asyncio
+import hashlib
+import mimetypes
+import random
+import re
+import functools
+import tempfile
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Iterator, AsyncIterator
 from ..utils.config import config
-from ..utils.aliyun_oss_uploader import create_oss_uploader_from_config
+
+if TYPE_CHECKING:
+    from google import genai
+
+# OSS配置文件路径
+_OSS_CONFIG_PATH = Path(__file__).resolve().parents[2] / 'config' / 'oss_config.json'
+
+# 按API密钥共享的genai客户端，复用底层HTTP连接池与TLS会话
+_GENAI_CLIENTS: Dict[str, 'genai.Client'] = {}
+_GENAI_CLIENTS_LOCK = threading.Lock()
+# 连接池保活设置
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 60
+
+# 可续传上传设置
+GEMINI_UPLOAD_URL = 'https://generativelanguage.googleapis.com/upload/v1beta/files'
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # 必须是256KiB的整数倍
+UPLOAD_CHUNK_RETRIES = 3
+UPLOAD_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 上传去重缓存：文件SHA-256 -> Gemini文件信息 / OSS链接
+UPLOAD_CACHE_FILE = Path.home() / '.cache' / 'video-analyzer' / 'uploads.json'
+# 未完成上传的会话状态目录，按文件SHA-256命名（含上传地址，仅当前用户可读写）
+UPLOAD_STATE_DIR = UPLOAD_CACHE_FILE.parent / 'upload-state'
+_UPLOAD_CACHE_LOCK = threading.Lock()
+# Gemini文件保留48小时，提前1小时视为过期
+GEMINI_FILE_TTL = 47 * 3600
+
+# 可重试的服务端过载/限流错误
+_RETRY_RE = re.compile(r"(?:503|overloaded|unavailable|rate[- ]?limit)", re.IGNORECASE)
+
+# 批量删除文件的默认并发数
+DELETE_MAX_CONCURRENCY = 32
+
+# 文件处理状态轮询：指数退避（0.25s起，最长8s）并加入±10%抖动
+POLL_BASE_DELAY = 0.25
+POLL_MAX_DELAY = 8.0
+POLL_JITTER = 0.1
+
+# 批量分析的默认并发数
+BATCH_MAX_CONCURRENCY = 8
+# 遇到限流/过载时，占用并发名额的冷却时间（秒）
+BATCH_RATE_LIMIT_COOLDOWN = 10.0
+
+
+def _file_digest(file_path: str) -> str:
+    """
+    计算文件的SHA-256摘要，文件大小和修改时间不变时复用上次结果
+    
+    Args:
+        file_path (str): 文件路径
+        
+    Returns:
+        str: 十六进制摘要
+    """
+    stat = os.stat(file_path)
+    return _compute_file_digest(os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _compute_file_digest(file_path: str, size: int, mtime_ns: int) -> str:
+    """
+    读取文件计算SHA-256摘要（size和mtime_ns仅用作缓存键）
+    
+    Args:
+        file_path (str): 文件绝对路径
+        size (int): 文件大小
+        mtime_ns (int): 文件修改时间（纳秒）
+        
+    Returns:
+        str: 十六进制摘要
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+        return digest.hexdigest()
+
+
+def _prime_file_digest(file_path: str) -> None:
+    """
+    预先计算文件摘要，使随后并发的Gemini上传与OSS上传直接命中缓存，避免重复读取整个文件
+    
+    Args:
+        file_path (str): 文件路径
+    """
+    try:
+        _file_digest(file_path)
+    except OSError:
+        # 文件不可读时交由各上传任务报告错误
+        pass
+
+
+def _retryable(max_retries: int = 3, base_delay: float = 2, label: str = '服务器'):
+    """
+    为返回结果字典的API方法添加过载重试，同时支持同步和异步方法
+    
+    被装饰的方法失败时直接抛出异常；服务端过载/限流错误按指数退避重试，
+    其他错误或重试耗尽时返回 {'success': False, 'error': ...}。
+    
+    Args:
+        max_retries (int): 最大尝试次数
+        base_delay (float): 基础延迟时间（秒），每次重试翻倍
+        label (str): 提示信息中的服务名称
+    """
+    def _next_delay(error_str: str, attempt: int) -> Any:
+        # 返回重试前的等待时间，不再重试时返回失败结果
+        if not _RETRY_RE.search(error_str):
+            return {
+                'success': False,
+                'error': error_str
+            }
+        if attempt >= max_retries - 1:
+            return {
+                'success': False,
+                'error': f"{label}持续过载，已重试{max_retries}次。请稍后再试。原始错误: {error_str}"
+            }
+        delay = base_delay * (2 ** attempt)
+        logging.getLogger(__name__).warning(
+            f"{label}过载，{delay}秒后重试... (尝试 {attempt + 1}/{max_retries})")
+        return delay
+    
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = _next_delay(str(e), attempt)
+                        if isinstance(delay, dict):
+                            return delay
+                        await asyncio.sleep(delay)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    delay = _next_delay(str(e), attempt)
+                    if isinstance(delay, dict):
+                        return delay
+                    time.sleep(delay)
+        return wrapper
+    
+    return decorator
+
+
+def _poll_delay(attempt: int) -> float:
+    """
+    计算第attempt次轮询前的等待时间
+    
+    Args:
+        attempt (int): 已轮询次数（从0开始）
+        
+    Returns:
+        float: 等待时间（秒）
+    """
+    delay = min(POLL_MAX_DELAY, POLL_BASE_DELAY * (2 ** attempt))
+    return delay * (1 + random.uniform(-POLL_JITTER, POLL_JITTER))
+
+
+def _load_upload_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    读取上传去重缓存
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: 文件摘要到上传信息的映射
+    """
+    try:
+        with open(UPLOAD_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_upload_cache(digest: str, **fields: Any) -> None:
+    """
+    更新指定文件摘要的上传缓存项（原子写入）
+    
+    Args:
+        digest (str): 文件SHA-256摘要
+        **fields: 要写入的字段
+    """
+    with _UPLOAD_CACHE_LOCK:
+        cache = _load_upload_cache()
+        cache.setdefault(digest, {}).update(fields)
+        try:
+            UPLOAD_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_CACHE_FILE.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, UPLOAD_CACHE_FILE)
+        except OSError:
+            # 缓存写入失败不影响上传结果
+            pass
+
 
 class GeminiClient:
     """
@@ -28,9 +242,62 @@ class GeminiClient:
         if not config.is_valid():
             raise ValueError("Gemini API密钥未配置，请检查.env文件")
         
-        # 初始化客户端
-        self.client = genai.Client(api_key=config.gemini_api_key)
+        # 获取共享客户端
+        self.client = self.get_client(config.gemini_api_key)
         self.model_name = model_name or config.get_current_model()
+        self.logger = logging.getLogger(__name__)
+        
+        # OSS上传器，创建成功后在实例内复用
+        self._oss_uploader_cache = None
+    
+    @classmethod
+    def get_client(cls, api_key: str) -> 'genai.Client':
+        """
+        获取指定API密钥对应的共享genai客户端，不存在时创建
+        
+        Args:
+            api_key (str): Gemini API密钥
+            
+        Returns:
+            genai.Client: 共享的客户端实例
+        """
+        with _GENAI_CLIENTS_LOCK:
+            client = _GENAI_CLIENTS.get(api_key)
+            if client is None:
+                client = cls._create_client(api_key)
+                _GENAI_CLIENTS[api_key] = client
+            return client
+    
+    @staticmethod
+    def _create_client(api_key: str) -> 'genai.Client':
+        """
+        创建启用连接保活的genai客户端
+        
+        Args:
+            api_key (str): Gemini API密钥
+            
+        Returns:
+            genai.Client: 客户端实例
+        """
+        # google.genai导入较慢，延迟到首次创建客户端时
+        from google import genai
+        
+        try:
+            import httpx
+            from google.genai import types
+            
+            limits = httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+            http_options = types.HttpOptions(
+                client_args={'limits': limits},
+                async_client_args={'limits': limits}
+            )
+            return genai.Client(api_key=api_key, http_options=http_options)
+        except (ImportError, AttributeError, TypeError, ValueError):
+            # 旧版SDK不支持自定义连接参数，使用默认设置
+            return genai.Client(api_key=api_key)
     
     def set_model(self, model_name: str) -> bool:
         """
@@ -57,6 +324,7 @@ class GeminiClient:
         """
         return self.model_name
     
+    @_retryable(max_retries=3, base_delay=2, label='上传服务器')
     def upload_file(self, file_path: str, display_name: Optional[str] = None) -> Dict[str, Any]:
         """
         上传文件到Gemini API
@@ -67,70 +335,22 @@ class GeminiClient:
             
         Returns:
             Dict[str, Any]: 上传结果信息
-            
-        Raises:
-            Exception: 上传失败时抛出异常
         """
-        max_retries = 3
-        base_delay = 2  # 基础延迟时间（秒）
+        # 相同内容的文件已上传且仍可用时直接复用
+        cached_file = self._find_cached_gemini_file(file_path)
+        if cached_file:
+            return self._upload_success_result(cached_file)
         
-        for attempt in range(max_retries):
-            try:
-                if display_name is None:
-                    display_name = os.path.basename(file_path)
-                
-                # 上传文件
-                uploaded_file = self.client.files.upload(
-                    file=file_path,
-                    config={
-                        'display_name': display_name
-                    }
-                )
-                
-                # 等待文件处理完成
-                self._wait_for_file_processing(uploaded_file.name)
-                
-                return {
-                    'success': True,
-                    'file_name': uploaded_file.name,
-                    'file_uri': uploaded_file.uri,
-                    'display_name': uploaded_file.display_name,
-                    'mime_type': uploaded_file.mime_type,
-                    'size_bytes': uploaded_file.size_bytes
-                }
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # 检查是否是503错误或服务器过载错误
-                if ('503' in error_str or 
-                    'overloaded' in error_str.lower() or 
-                    'unavailable' in error_str.lower() or
-                    'rate limit' in error_str.lower()):
-                    
-                    if attempt < max_retries - 1:  # 不是最后一次尝试
-                        # 指数退避：每次重试延迟时间翻倍
-                        delay = base_delay * (2 ** attempt)
-                        print(f"上传服务器过载，{delay}秒后重试... (尝试 {attempt + 1}/{max_retries})")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        return {
-                            'success': False,
-                            'error': f"上传服务器持续过载，已重试{max_retries}次。请稍后再试。原始错误: {error_str}"
-                        }
-                else:
-                    # 其他类型的错误，直接返回
-                    return {
-                        'success': False,
-                        'error': error_str
-                    }
+        if display_name is None:
+            display_name = os.path.basename(file_path)
         
-        # 理论上不会到达这里
-        return {
-            'success': False,
-            'error': '未知错误'
-        }
+        # 分块上传文件，失败重试时从已确认的偏移继续
+        uploaded_file = self._resumable_upload(file_path, display_name)
+        
+        # 等待文件处理完成
+        self._wait_for_file_processing(uploaded_file['name'])
+        
+        return self._upload_success_result(uploaded_file)
     
     def _wait_for_file_processing(self, file_name: str, max_wait_time: int = 300) -> None:
         """
@@ -144,6 +364,7 @@ class GeminiClient:
             TimeoutError: 处理超时
         """
         start_time = time.time()
+        attempt = 0
         
         while time.time() - start_time < max_wait_time:
             try:
@@ -153,16 +374,19 @@ class GeminiClient:
                 elif file_info.state == 'FAILED':
                     raise Exception(f"文件处理失败: {file_info.error}")
                 
-                time.sleep(2)  # 等待2秒后重试
+                time.sleep(_poll_delay(attempt))
+                attempt += 1
                 
             except Exception as e:
                 if "not found" in str(e).lower():
-                    time.sleep(2)
+                    time.sleep(_poll_delay(attempt))
+                    attempt += 1
                     continue
                 raise e
         
         raise TimeoutError("文件处理超时")
     
+    @_retryable(max_retries=3, base_delay=2)
     def analyze_video(self, file_uri: str, prompt: str) -> Dict[str, Any]:
         """
         分析视频内容
@@ -174,72 +398,15 @@ class GeminiClient:
         Returns:
             Dict[str, Any]: 分析结果
         """
-        max_retries = 3
-        base_delay = 2  # 基础延迟时间（秒）
-        
-        for attempt in range(max_retries):
-            try:
-                # 构建请求内容
-                contents = [
-                    {
-                        'role': 'user',
-                        'parts': [
-                            {
-                                'file_data': {
-                                    'file_uri': file_uri,
-                                    'mime_type': 'video/*'
-                                }
-                            },
-                            {
-                                'text': prompt
-                            }
-                        ]
-                    }
-                ]
-                
-                # 生成内容
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=contents
-                )
-                
-                return {
-                    'success': True,
-                    'result': response.text,
-                    'usage': getattr(response, 'usage_metadata', None)
-                }
-                
-            except Exception as e:
-                error_str = str(e)
-                
-                # 检查是否是503错误或服务器过载错误
-                if ('503' in error_str or 
-                    'overloaded' in error_str.lower() or 
-                    'unavailable' in error_str.lower() or
-                    'rate limit' in error_str.lower()):
-                    
-                    if attempt < max_retries - 1:  # 不是最后一次尝试
-                        # 指数退避：每次重试延迟时间翻倍
-                        delay = base_delay * (2 ** attempt)
-                        print(f"服务器过载，{delay}秒后重试... (尝试 {attempt + 1}/{max_retries})")
-                        time.sleep(delay)
-                        continue
-                    else:
-                        return {
-                            'success': False,
-                            'error': f"服务器持续过载，已重试{max_retries}次。请稍后再试。原始错误: {error_str}"
-                        }
-                else:
-                    # 其他类型的错误，直接返回
-                    return {
-                        'success': False,
-                        'error': error_str
-                    }
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=self._build_video_contents(file_uri, prompt)
+        )
         
-        # 理论上不会到达这里
         return {
-            'success': False,
-            'error': '未知错误'
+            'success': True,
+            'result': response.text,
+            'usage': getattr(response, 'usage_metadata', None)
         }
     
     def analyze_video_with_file(self, file_path: str, prompt: str) -> Dict[str, Any]:
@@ -253,22 +420,302 @@ class GeminiClient:
         Returns:
             Dict[str, Any]: 分析结果，包含OSS链接信息
         """
-        # 上传文件到Gemini
-        upload_result = self.upload_file(file_path)
+        _prime_file_digest(file_path)
+        
+        # Gemini上传与OSS上传互不依赖，并发进行
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gemini_future = executor.submit(self.upload_file, file_path)
+            oss_future = executor.submit(self._upload_to_oss, file_path)
+            upload_result = gemini_future.result()
+            oss_result = oss_future.result()
         
         if not upload_result['success']:
             return upload_result
         
-        # 同时上传到OSS
-        oss_result = self._upload_to_oss(file_path)
-        
         # 分析视频
         analysis_result = self.analyze_video(
             upload_result['file_uri'], 
             prompt
         )
         
-        # 合并结果
+        return self._merge_analysis_result(analysis_result, upload_result, oss_result)
+    
+    def _resumable_upload(self, file_path: str, display_name: str) -> Dict[str, Any]:
+        """
+        使用可续传协议分块上传文件
+        
+        上传地址保存在文件旁的状态文件中，并以文件SHA-256校验，
+        中断或重试时会查询服务端已接收的偏移并从该处继续。
+        
+        Args:
+            file_path (str): 文件路径
+            display_name (str): 显示名称
+            
+        Returns:
+            Dict[str, Any]: Gemini返回的文件信息
+            
+        Raises:
+            httpx.HTTPError: 上传失败时抛出异常
+        """
+        import httpx
+        
+        total = os.path.getsize(file_path)
+        digest = _file_digest(file_path)
+        state_path = UPLOAD_STATE_DIR / f"{digest}.json"
+        
+        with httpx.Client(
+            headers={'x-goog-api-key': config.gemini_api_key},
+            timeout=httpx.Timeout(60.0, connect=10.0)
+        ) as http:
+            upload_url = self._load_upload_state(state_path, digest)
+            offset = self._query_upload_offset(http, upload_url) if upload_url else None
+            
+            if offset is None:
+                upload_url = self._start_resumable_upload(http, file_path, display_name, total)
+                offset = 0
+                self._save_upload_state(state_path, digest, upload_url)
+            
+            failures = 0
+            with open(file_path, 'rb') as f:
+                while True:
+                    f.seek(offset)
+                    chunk = f.read(UPLOAD_CHUNK_SIZE)
+                    last = offset + len(chunk) >= total
+                    
+                    try:
+                        response = http.post(
+                            upload_url,
+                            content=chunk,
+                            headers={
+                                'X-Goog-Upload-Command': 'upload, finalize' if last else 'upload',
+                                'X-Goog-Upload-Offset': str(offset)
+                            }
+                        )
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        if e.response.status_code not in UPLOAD_RETRY_STATUS_CODES:
+                            raise
+                        failures += 1
+                        if failures >= UPLOAD_CHUNK_RETRIES:
+                            raise
+                    except httpx.TransportError:
+                        failures += 1
+                        if failures >= UPLOAD_CHUNK_RETRIES:
+                            raise
+                    else:
+                        if last:
+                            break
+                        offset += len(chunk)
+                        failures = 0
+                        continue
+                    
+                    # 仅重传失败的分块：以服务端确认的偏移为准
+                    time.sleep(2 ** failures)
+                    offset = self._query_upload_offset(http, upload_url)
+                    if offset is None:
+                        raise RuntimeError("上传会话已失效，无法续传")
+        
+        self._remove_upload_state(state_path)
+        uploaded_file = response.json()['file']
+        _update_upload_cache(
+            digest,
+            gemini_file=uploaded_file,
+            gemini_expires_at=time.time() + GEMINI_FILE_TTL
+        )
+        return uploaded_file
+    
+    def _find_cached_gemini_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        查找相同内容文件已上传到Gemini的记录
+        
+        Args:
+            file_path (str): 文件路径
+            
+        Returns:
+            Optional[Dict[str, Any]]: 仍处于ACTIVE状态的文件信息，不存在时返回None
+        """
+        try:
+            entry = _load_upload_cache().get(_file_digest(file_path))
+            if not entry or 'gemini_file' not in entry:
+                return None
+            if entry.get('gemini_expires_at', 0) <= time.time():
+                return None
+            
+            file_info = self.client.files.get(name=entry['gemini_file']['name'])
+            if file_info.state == 'ACTIVE':
+                return entry['gemini_file']
+        except Exception:
+            pass
+        return None
+    
+    @staticmethod
+    def _start_resumable_upload(http, file_path: str, display_name: str, total: int) -> str:
+        """
+        发起可续传上传会话
+        
+        Args:
+            http (httpx.Client): HTTP客户端
+            file_path (str): 文件路径
+            display_name (str): 显示名称
+            total (int): 文件大小（字节）
+            
+        Returns:
+            str: 上传地址
+        """
+        mime_type = mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        response = http.post(
+            GEMINI_UPLOAD_URL,
+            headers={
+                'X-Goog-Upload-Protocol': 'resumable',
+                'X-Goog-Upload-Command': 'start',
+                'X-Goog-Upload-Header-Content-Length': str(total),
+                'X-Goog-Upload-Header-Content-Type': mime_type
+            },
+            json={'file': {'display_name': display_name}}
+        )
+        response.raise_for_status()
+        return response.headers['x-goog-upload-url']
+    
+    @staticmethod
+    def _query_upload_offset(http, upload_url: str) -> Optional[int]:
+        """
+        查询上传会话中服务端已接收的字节数
+        
+        Args:
+            http (httpx.Client): HTTP客户端
+            upload_url (str): 上传地址
+            
+        Returns:
+            Optional[int]: 已接收的字节数，会话不可用时返回None
+        """
+        import httpx
+        
+        try:
+            response = http.post(upload_url, headers={'X-Goog-Upload-Command': 'query'})
+        except httpx.TransportError:
+            return None
+        
+        if response.status_code != 200 or response.headers.get('x-goog-upload-status') != 'active':
+            return None
+        return int(response.headers.get('x-goog-upload-size-received', 0))
+    
+    @staticmethod
+    def _load_upload_state(state_path: Path, digest: str) -> Optional[str]:
+        """
+        读取未完成上传的地址
+        
+        Args:
+            state_path (Path): 状态文件路径
+            digest (str): 当前文件的SHA-256摘要
+            
+        Returns:
+            Optional[str]: 文件内容未变化时返回上传地址，否则返回None
+        """
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if state.get('sha256') != digest:
+            return None
+        return state.get('upload_url')
+    
+    @staticmethod
+    def _save_upload_state(state_path: Path, digest: str, upload_url: str) -> None:
+        """
+        保存上传地址，便于中断后续传（文件仅当前用户可读写）
+        
+        Args:
+            state_path (Path): 状态文件路径
+            digest (str): 文件的SHA-256摘要
+            upload_url (str): 上传地址
+        """
+        try:
+            state_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(state_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'sha256': digest, 'upload_url': upload_url}, f)
+        except OSError:
+            # 目录不可写时仅失去跨进程续传能力
+            pass
+    
+    @staticmethod
+    def _remove_upload_state(state_path: Path) -> None:
+        """
+        删除上传状态文件
+        
+        Args:
+            state_path (Path): 状态文件路径
+        """
+        try:
+            os.remove(state_path)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _upload_success_result(uploaded_file: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        构建上传成功的结果信息
+        
+        Args:
+            uploaded_file (Dict[str, Any]): Gemini返回的文件信息
+            
+        Returns:
+            Dict[str, Any]: 上传结果信息
+        """
+        return {
+            'success': True,
+            'file_name': uploaded_file['name'],
+            'file_uri': uploaded_file['uri'],
+            'display_name': uploaded_file.get('displayName'),
+            'mime_type': uploaded_file.get('mimeType'),
+            'size_bytes': int(uploaded_file.get('sizeBytes', 0))
+        }
+    
+    @staticmethod
+    def _build_video_contents(file_uri: str, prompt: str) -> list:
+        """
+        构建视频分析请求内容
+        
+        Args:
+            file_uri (str): 文件URI
+            prompt (str): 分析提示
+            
+        Returns:
+            list: 请求内容
+        """
+        return [
+            {
+                'role': 'user',
+                'parts': [
+                    {
+                        'file_data': {
+                            'file_uri': file_uri,
+                            'mime_type': 'video/*'
+                        }
+                    },
+                    {
+                        'text': prompt
+                    }
+                ]
+            }
+        ]
+    
+    @staticmethod
+    def _merge_analysis_result(analysis_result: Dict[str, Any], upload_result: Dict[str, Any],
+                               oss_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        将文件信息和OSS信息合并到分析结果中
+        
+        Args:
+            analysis_result (Dict[str, Any]): 分析结果
+            upload_result (Dict[str, Any]): Gemini上传结果
+            oss_result (Dict[str, Any]): OSS上传结果
+            
+        Returns:
+            Dict[str, Any]: 合并后的分析结果
+        """
         if analysis_result['success']:
             analysis_result['file_info'] = {
                 'name': upload_result['file_name'],
@@ -289,6 +736,164 @@ class GeminiClient:
         
         return analysis_result
     
+    @_retryable(max_retries=3, base_delay=2, label='上传服务器')
+    async def upload_file_async(self, file_path: str, display_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        上传文件到Gemini API（异步版本，等待期间不阻塞事件循环）
+        
+        Args:
+            file_path (str): 文件路径
+            display_name (str, optional): 显示名称
+            
+        Returns:
+            Dict[str, Any]: 上传结果信息
+        """
+        # 相同内容的文件已上传且仍可用时直接复用（计算摘要需读取整个文件，放到线程中执行）
+        cached_file = await asyncio.to_thread(self._find_cached_gemini_file, file_path)
+        if cached_file:
+            return self._upload_success_result(cached_file)
+        
+        if display_name is None:
+            display_name = os.path.basename(file_path)
+        
+        # 分块上传为同步实现，放到线程中执行
+        uploaded_file = await asyncio.to_thread(
+            self._resumable_upload, file_path, display_name
+        )
+        
+        # 等待文件处理完成
+        await self._wait_for_file_processing_async(uploaded_file['name'])
+        
+        return self._upload_success_result(uploaded_file)
+    
+    async def _wait_for_file_processing_async(self, file_name: str, max_wait_time: int = 300) -> None:
+        """
+        等待文件处理完成（异步版本）
+        
+        Args:
+            file_name (str): 文件名
+            max_wait_time (int): 最大等待时间（秒）
+            
+        Raises:
+            TimeoutError: 处理超时
+        """
+        start_time = time.time()
+        attempt = 0
+        
+        while time.time() - start_time < max_wait_time:
+            try:
+                file_info = await self.client.aio.files.get(name=file_name)
+                if file_info.state == 'ACTIVE':
+                    return
+                elif file_info.state == 'FAILED':
+                    raise Exception(f"文件处理失败: {file_info.error}")
+                
+                await asyncio.sleep(_poll_delay(attempt))
+                attempt += 1
+                
+            except Exception as e:
+                if "not found" in str(e).lower():
+                    await asyncio.sleep(_poll_delay(attempt))
+                    attempt += 1
+                    continue
+                raise e
+        
+        raise TimeoutError("文件处理超时")
+    
+    @_retryable(max_retries=3, base_delay=2)
+    async def analyze_video_async(self, file_uri: str, prompt: str) -> Dict[str, Any]:
+        """
+        分析视频内容（异步版本）
+        
+        Args:
+            file_uri (str): 文件URI
+            prompt (str): 分析提示
+            
+        Returns:
+            Dict[str, Any]: 分析结果
+        """
+        response = await self.client.aio.models.generate_content(
+            model=self.model_name,
+            contents=self._build_video_contents(file_uri, prompt)
+        )
+        
+        return {
+            'success': True,
+            'result': response.text,
+            'usage': getattr(response, 'usage_metadata', None)
+        }
+    
+    async def analyze_video_with_file_async(self, file_path: str, prompt: str) -> Dict[str, Any]:
+        """
+        上传并分析视频文件（异步版本），Gemini上传与OSS上传并发进行
+        
+        Args:
+            file_path (str): 视频文件路径
+            prompt (str): 分析提示
+            
+        Returns:
+            Dict[str, Any]: 分析结果，包含OSS链接信息
+        """
+        await asyncio.to_thread(_prime_file_digest, file_path)
+        
+        # OSS上传器为同步实现，放到线程中执行
+        upload_result, oss_result = await asyncio.gather(
+            self.upload_file_async(file_path),
+            asyncio.to_thread(self._upload_to_oss, file_path)
+        )
+        
+        if not upload_result['success']:
+            return upload_result
+        
+        analysis_result = await self.analyze_video_async(
+            upload_result['file_uri'],
+            prompt
+        )
+        
+        return self._merge_analysis_result(analysis_result, upload_result, oss_result)
+    
+    async def analyze_videos_batch(self, jobs: List[Tuple[str, str]],
+                                   max_concurrency: int = BATCH_MAX_CONCURRENCY) -> List[Any]:
+        """
+        并发上传并分析多个视频
+        
+        遇到限流或服务器过载时，该任务会在冷却时间内继续占用并发名额，
+        从而临时降低整体并发，避免持续触发限流。
+        
+        Args:
+            jobs (List[Tuple[str, str]]): (视频文件路径, 分析提示) 列表
+            max_concurrency (int): 最大并发数
+            
+        Returns:
+            List[Any]: 与jobs顺序一致的分析结果，未捕获的异常会作为结果返回
+        """
+        semaphore = asyncio.BoundedSemaphore(max_concurrency)
+        
+        async def _one(file_path: str, prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self.analyze_video_with_file_async(file_path, prompt)
+                error_str = str(result.get('error', '')) if not result.get('success') else ''
+                if '429' in error_str or _RETRY_RE.search(error_str):
+                    await asyncio.sleep(BATCH_RATE_LIMIT_COOLDOWN)
+                return result
+        
+        return await asyncio.gather(
+            *(_one(file_path, prompt) for file_path, prompt in jobs),
+            return_exceptions=True
+        )
+    
+    def _get_oss_uploader(self):
+        """
+        获取OSS上传器：创建成功后在实例内复用，配置缺失或无效时下次重新读取配置
+        
+        Returns:
+            Optional[AliyunOSSUploader]: OSS上传器，配置无效时返回None
+        """
+        if self._oss_uploader_cache is None:
+            from ..utils.aliyun_oss_uploader import create_oss_uploader_from_config
+            self._oss_uploader_cache = create_oss_uploader_from_config(str(_OSS_CONFIG_PATH))
+        return self._oss_uploader_cache
+    
     def _upload_to_oss(self, file_path: str) -> Dict[str, Any]:
         """
         上传文件到OSS
@@ -300,20 +905,24 @@ class GeminiClient:
             Dict[str, Any]: 上传结果
         """
         try:
-            # 创建OSS上传器，使用配置文件
-            config_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config', 'oss_config.json')
-            uploader = create_oss_uploader_from_config(config_file)
+            uploader = self._get_oss_uploader()
             if not uploader:
                 return {
                     'success': False,
                     'error': 'OSS配置未找到或无效'
                 }
             
+            # 相同内容的文件已在OSS中时直接复用
+            digest = _file_digest(file_path)
+            entry = _load_upload_cache().get(digest, {})
+            if entry.get('oss_object_key') and uploader.bucket.object_exists(entry['oss_object_key']):
+                return {
+                    'success': True,
+                    'url': entry['oss_url'],
+                    'file_name': entry['oss_object_key']
+                }
+            
             # 生成OSS存储路径（不包含文件名）
-            import datetime
-            file_name = os.path.basename(file_path)
-            name, ext = os.path.splitext(file_name)
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             # 只设置目录路径，让uploader自己处理文件名
             custom_path = "videos"
             
@@ -325,6 +934,11 @@ class GeminiClient:
             )
             
             if result['success']:
+                _update_upload_cache(
+                    digest,
+                    oss_url=result['file_url'],
+                    oss_object_key=result['object_key']
+                )
                 return {
                     'success': True,
                     'url': result['file_url'],
@@ -342,6 +956,47 @@ class GeminiClient:
                 'error': f'OSS上传异常: {str(e)}'
             }
     
+    @staticmethod
+    def _file_summary(file) -> Dict[str, Any]:
+        """
+        提取文件对象的常用信息
+        
+        Args:
+            file: Gemini返回的文件对象
+            
+        Returns:
+            Dict[str, Any]: 文件信息
+        """
+        return {
+            'name': file.name,
+            'display_name': file.display_name,
+            'uri': file.uri,
+            'mime_type': file.mime_type,
+            'size_bytes': file.size_bytes,
+            'create_time': file.create_time,
+            'state': file.state
+        }
+    
+    def iter_files(self) -> Iterator[Dict[str, Any]]:
+        """
+        逐个返回已上传的文件，按页拉取，无需等待全部分页完成
+        
+        Yields:
+            Dict[str, Any]: 文件信息
+        """
+        for file in self.client.files.list():
+            yield self._file_summary(file)
+    
+    async def iter_files_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        逐个返回已上传的文件（异步版本）
+        
+        Yields:
+            Dict[str, Any]: 文件信息
+        """
+        async for file in await self.client.aio.files.list():
+            yield self._file_summary(file)
+    
     def list_files(self) -> Dict[str, Any]:
         """
         列出已上传的文件
@@ -350,23 +1005,9 @@ class GeminiClient:
             Dict[str, Any]: 文件列表
         """
         try:
-            files = list(self.client.files.list())
-            
-            file_list = []
-            for file in files:
-                file_list.append({
-                    'name': file.name,
-                    'display_name': file.display_name,
-                    'uri': file.uri,
-                    'mime_type': file.mime_type,
-                    'size_bytes': file.size_bytes,
-                    'create_time': file.create_time,
-                    'state': file.state
-                })
-            
             return {
                 'success': True,
-                'files': file_list
+                'files': list(self.iter_files())
             }
             
         except Exception as e:
@@ -386,14 +1027,77 @@ class GeminiClient:
             Dict[str, Any]: 删除结果
         """
         try:
-            self.client.files.delete(file_name)
-            return {
-                'success': True,
-                'message': f"文件 {file_name} 已删除"
-            }
+            self.client.files.delete(name=file_name)
+            return self._delete_result(file_name)
             
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
\ No newline at end of file
+            return self._delete_result(file_name, e)
+    
+    def delete_files(self, file_names: List[str],
+                     max_workers: int = DELETE_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        并发删除多个已上传的文件，文件已不存在视为删除成功
+        
+        Args:
+            file_names (List[str]): 文件名列表
+            max_workers (int): 最大并发数
+            
+        Returns:
+            List[Dict[str, Any]]: 与file_names顺序一致的删除结果
+        """
+        if not file_names:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_names))) as executor:
+            return list(executor.map(self.delete_file, file_names))
+    
+    async def delete_files_async(self, file_names: List[str],
+                                 concurrency: int = DELETE_MAX_CONCURRENCY) -> List[Dict[str, Any]]:
+        """
+        并发删除多个已上传的文件（异步版本），文件已不存在视为删除成功
+        
+        Args:
+            file_names (List[str]): 文件名列表
+            concurrency (int): 最大并发数
+            
+        Returns:
+            List[Dict[str, Any]]: 与file_names顺序一致的删除结果
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _delete(file_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    await self.client.aio.files.delete(name=file_name)
+                    return self._delete_result(file_name)
+                except Exception as e:
+                    return self._delete_result(file_name, e)
+        
+        return await asyncio.gather(*(_delete(file_name) for file_name in file_names))
+    
+    @staticmethod
+    def _delete_result(file_name: str, error: Optional[Exception] = None) -> Dict[str, Any]:
+        """
+        构建删除结果，文件不存在（404）按删除成功处理
+        
+        Args:
+            file_name (str): 文件名
+            error (Exception, optional): 删除时的异常
+            
+        Returns:
+            Dict[str, Any]: 删除结果
+        """
+        if error is not None:
+            error_str = str(error)
+            if '404' not in error_str and 'not found' not in error_str.lower():
+                return {
+                    'success': False,
+                    'name': file_name,
+                    'error': error_str
+                }
+        
+        return {
+            'success': True,
+            'name': file_name,
+            'message': f"文件 {file_name} 已删除"
+        }
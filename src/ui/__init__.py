@@ -3,9 +3,22 @@
 """
 UI模块
 包含用户界面相关的组件
+
+组件按需导入，导入子模块时不会加载整个界面。
 """
 
-from .main_window import MainWindow
-from .settings_dialog import SettingsDialog
+__all__ = ['MainWindow', 'SettingsDialog']
+
+
+def __getattr__(name):
+    if name == 'MainWindow':
+        from .main_window import MainWindow
+        return MainWindow
+    if name == 'SettingsDialog':
+        from .settings_dialog import SettingsDialog
+        return SettingsDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['MainWindow', 'SettingsDialog']
\ No newline at end of file
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,32 +7,205 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import csv
-import json
-import time
+import logging
+import math
+import operator
+import functools
+import io
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
-from ..utils.database import db
+from typing import Callable, Dict, List, Optional
+from ..utils.database import db, filter_records
 from ..utils.feishu_sync import feishu_sync
 from ..utils.smart_field_setup import SmartFieldSetup
 from ..utils.feishu_doc_sync import FeishuDocSyncService
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+# 文件大小单位
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+# 最多加载的历史记录数
+HISTORY_LOAD_LIMIT = 1000
+# 实时搜索的防抖延迟（毫秒）
+SEARCH_DEBOUNCE_MS = 300
+# 数据库搜索结果最多缓存的关键词数
+SEARCH_CACHE_SIZE = 32
+# 表格每批插入的行数：首批同步插入，其余在空闲时分批插入
+TREE_PAGE_SIZE = 100
+# 飞书同步状态文字，下标为 (表格已同步 << 1) | 文档已同步
+_FEISHU_STATUS = ("○ 未同步", "✓ 文档已同步", "✓ 表格已同步", "✓ 全部已同步")
+# 导出CSV的列
+_CSV_FIELDNAMES = [
+    '序列号', '文件名', '文件路径', '文件大小(字节)', '文件类型',
+    '分析提示', '分析结果', 'OSS链接', 'OSS文件名', '创建时间', '更新时间'
+]
+# 按CSV列顺序取记录字段：OSS列之前的字段、OSS列的占位值、OSS列之后的字段
+_CSV_HEAD_GETTER = operator.itemgetter(
+    'sequence_id', 'file_name', 'file_path', 'file_size', 'mime_type',
+    'analysis_prompt', 'analysis_result'
+)
+_CSV_EMPTY_OSS = ('', '')
+_CSV_TAIL_GETTER = operator.itemgetter('created_at', 'updated_at')
+# 导出CSV时每批序列化、写入（并汇报进度）的行数
+CSV_WRITE_BATCH_SIZE = 1000
+# 分析结果每次插入文本框的字符数，超出部分在空闲时分段插入
+RESULT_CHUNK_SIZE = 4096
+# 超过该字符数的内容优先通过系统剪贴板接口复制（需安装pyperclip）
+NATIVE_CLIPBOARD_THRESHOLD = 64 * 1024
+
+
+def _record_to_csv_row(record: Dict) -> tuple:
+    """
+    将记录转换为CSV行，列顺序与 _CSV_FIELDNAMES 一致
+    
+    Args:
+        record (Dict): 记录数据
+        
+    Returns:
+        tuple: CSV行数据，OSS列留空
+    """
+    return _CSV_HEAD_GETTER(record) + _CSV_EMPTY_OSS + _CSV_TAIL_GETTER(record)
+
+@functools.lru_cache(maxsize=4096)
+def _format_size(size_bytes: int) -> str:
+    """
+    格式化文件大小，按log2直接确定单位
+    
+    Args:
+        size_bytes (int): 文件大小（字节）
+        
+    Returns:
+        str: 格式化后的文件大小
+    """
+    if not size_bytes:
+        return "0 B"
+    
+    i = min(3, int(math.log2(size_bytes)) // 10) if size_bytes >= 1 else 0
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_time(created_at: str) -> str:
+    """
+    将ISO格式的时间字符串格式化为显示用的时间
+    
+    Args:
+        created_at (str): ISO格式时间字符串
+        
+    Returns:
+        str: 格式化后的时间，解析失败时返回原字符串
+    """
+    if not created_at:
+        return ''
+    
+    try:
+        dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+        return dt.strftime('%Y-%m-%d %H:%M:%S')
+    except (ValueError, AttributeError):
+        return created_at
+
+
 class HistoryViewer:
     """
     历史记录查看器
     """
     
-    def __init__(self, parent: tk.Widget):
+    # 工具栏中的批量操作行：(标签, [(按钮文字, 方法名), ...])
+    _TOOLBAR_ROWS = (
+        ("删除操作:", (
+            ("删除选中记录", "_delete_selected_record"),
+            ("批量删除", "_batch_delete_records"),
+            ("删除所有数据", "_delete_all_records"),
+        )),
+        ("多维表格同步:", (
+            ("同步选中到多维表格", "_sync_selected_to_feishu"),
+            ("同步所有到多维表格", "_sync_all_to_feishu"),
+        )),
+        ("电子表格同步:", (
+            ("同步选中到电子表格", "_sync_selected_to_spreadsheet"),
+            ("同步所有到电子表格", "_sync_all_to_spreadsheet"),
+        )),
+        ("云文档同步:", (
+            ("同步选中到云文档", "_sync_selected_to_doc"),
+            ("同步所有到云文档", "_sync_all_to_doc"),
+        )),
+    )
+    
+    def __init__(self, parent: tk.Widget, doc_sync: Optional[FeishuDocSyncService] = None):
         """
         初始化历史记录查看器
         
         Args:
             parent (tk.Widget): 父窗口
+            doc_sync (Optional[FeishuDocSyncService]): 共用的云文档同步服务，不提供时首次使用时创建
         """
         self.parent = parent
+        self.logger = logging.getLogger(__name__)
         self.history_window = None
         self.history_data = []
         self.filtered_data = []
         
+        # 尚未插入表格的行及分批插入任务
+        self._pending_rows = deque()
+        self._page_after_id = None
+        
+        # 历史记录是否已全部加载（全部加载时在内存中搜索）
+        self._history_complete = False
+        self._search_after_id = None
+        
+        # 数据库搜索结果缓存：关键词 -> 记录列表，重新加载数据时清空
+        self._search_cache = {}
+        
+        # 记录索引：已加载的记录按 sequence_id，当前显示的记录按表格行ID
+        self._history_by_seq = {}
+        self._by_row = {}
+        
+        # 分析结果中尚未插入文本框的分段及插入任务
+        self._result_chunks = None
+        self._result_after_id = None
+        
+        # 电子表格同步服务，首次同步时创建，之后复用其客户端和连接池
+        self._spreadsheet_sync_service = None
+        self._spreadsheet_sync_lock = threading.Lock()
+        
+        # 云文档同步服务，之后一直复用（包括HTTP连接池和连接测试结果）
+        self._doc_sync_service = doc_sync
+        
+        # 飞书多维表格同步在单独的工作线程中依次执行，不阻塞界面
+        self._sync_executor = ThreadPoolExecutor(max_workers=1)
+        
+    @property
+    def _spreadsheet_sync(self):
+        """
+        获取电子表格同步服务（延迟创建，可在后台线程中调用）
+        
+        Returns:
+            FeishuSpreadsheetSync: 电子表格同步服务
+        """
+        with self._spreadsheet_sync_lock:
+            if self._spreadsheet_sync_service is None:
+                from ..utils.feishu_spreadsheet_sync import FeishuSpreadsheetSync
+                self._spreadsheet_sync_service = FeishuSpreadsheetSync()
+            return self._spreadsheet_sync_service
+    
+    @property
+    def _doc_sync(self) -> FeishuDocSyncService:
+        """
+        获取云文档同步服务（延迟创建）
+        
+        Returns:
+            FeishuDocSyncService: 云文档同步服务
+        """
+        if self._doc_sync_service is None:
+            self._doc_sync_service = FeishuDocSyncService()
+        return self._doc_sync_service
+    
     def open_history_viewer(self) -> None:
         """
         打开历史记录查看窗口
@@ -109,103 +282,26 @@ class HistoryViewer:
         )
         refresh_btn.pack(side="left", padx=(0, 5))
         
-        export_btn = ttk.Button(
+        self._export_btn = ttk.Button(
             basic_action_frame,
             text="导出CSV",
             command=self._export_to_csv
         )
-        export_btn.pack(side="left", padx=(0, 5))
-        
-        # 第二行：删除操作
-        second_row_frame = tk.Frame(toolbar_frame)
-        second_row_frame.pack(fill="x", pady=(0, 5))
-        
-        delete_label = tk.Label(second_row_frame, text="删除操作:", font=("Arial", 10, "bold"))
-        delete_label.pack(side="left", padx=(0, 10))
-        
-        delete_btn = ttk.Button(
-            second_row_frame,
-            text="删除选中记录",
-            command=self._delete_selected_record
-        )
-        delete_btn.pack(side="left", padx=(0, 5))
-        
-        batch_delete_btn = ttk.Button(
-            second_row_frame,
-            text="批量删除",
-            command=self._batch_delete_records
-        )
-        batch_delete_btn.pack(side="left", padx=(0, 5))
-        
-        delete_all_btn = ttk.Button(
-            second_row_frame,
-            text="删除所有数据",
-            command=self._delete_all_records
-        )
-        delete_all_btn.pack(side="left")
-        
-        # 第三行：飞书多维表格同步
-        third_row_frame = tk.Frame(toolbar_frame)
-        third_row_frame.pack(fill="x", pady=(0, 5))
-        
-        feishu_label = tk.Label(third_row_frame, text="多维表格同步:", font=("Arial", 10, "bold"))
-        feishu_label.pack(side="left", padx=(0, 10))
-        
-        feishu_sync_selected_btn = ttk.Button(
-            third_row_frame,
-            text="同步选中到多维表格",
-            command=self._sync_selected_to_feishu
-        )
-        feishu_sync_selected_btn.pack(side="left", padx=(0, 5))
-        
-        feishu_sync_all_btn = ttk.Button(
-            third_row_frame,
-            text="同步所有到多维表格",
-            command=self._sync_all_to_feishu
-        )
-        feishu_sync_all_btn.pack(side="left")
-        
-        # 第四行：飞书电子表格同步
-        fourth_row_frame = tk.Frame(toolbar_frame)
-        fourth_row_frame.pack(fill="x", pady=(0, 5))
-        
-        spreadsheet_label = tk.Label(fourth_row_frame, text="电子表格同步:", font=("Arial", 10, "bold"))
-        spreadsheet_label.pack(side="left", padx=(0, 10))
+        self._export_btn.pack(side="left", padx=(0, 5))
         
-        spreadsheet_sync_selected_btn = ttk.Button(
-            fourth_row_frame,
-            text="同步选中到电子表格",
-            command=self._sync_selected_to_spreadsheet
-        )
-        spreadsheet_sync_selected_btn.pack(side="left", padx=(0, 5))
-        
-        spreadsheet_sync_all_btn = ttk.Button(
-            fourth_row_frame,
-            text="同步所有到电子表格",
-            command=self._sync_all_to_spreadsheet
-        )
-        spreadsheet_sync_all_btn.pack(side="left")
-        
-        # 第五行：飞书云文档同步
-        fifth_row_frame = tk.Frame(toolbar_frame)
-        fifth_row_frame.pack(fill="x", pady=(0, 5))
-        
-        doc_label = tk.Label(fifth_row_frame, text="云文档同步:", font=("Arial", 10, "bold"))
-        doc_label.pack(side="left", padx=(0, 10))
-        
-        doc_sync_selected_btn = ttk.Button(
-            fifth_row_frame,
-            text="同步选中到云文档",
-            command=self._sync_selected_to_doc
-        )
-        doc_sync_selected_btn.pack(side="left", padx=(0, 5))
-        
-        doc_sync_all_btn = ttk.Button(
-            fifth_row_frame,
-            text="同步所有到云文档",
-            command=self._sync_all_to_doc
-        )
-        doc_sync_all_btn.pack(side="left")
+        # 其余各行：批量操作按钮，按 _TOOLBAR_ROWS 定义生成
+        for label_text, buttons in self._TOOLBAR_ROWS:
+            row_frame = tk.Frame(toolbar_frame)
+            row_frame.pack(fill="x", pady=(0, 5))
+            
+            tk.Label(row_frame, text=label_text, font=("Arial", 10, "bold")).pack(side="left", padx=(0, 10))
+            
+            for index, (text, command_name) in enumerate(buttons):
+                ttk.Button(
+                    row_frame,
+                    text=text,
+                    command=getattr(self, command_name)
+                ).pack(side="left", padx=(0, 5) if index < len(buttons) - 1 else 0)
         
         # 分割器
         paned_window = tk.PanedWindow(main_frame, orient=tk.HORIZONTAL)
@@ -223,11 +319,14 @@ class HistoryViewer:
         tree_frame = tk.Frame(left_frame)
         tree_frame.pack(fill="both", expand=True)
         
-        # 定义列（包含隐藏的sequence_id_data列用于存储数据）
-        columns = ("选择", "序列号", "文件名", "文件大小", "分析时间", "飞书状态", "sequence_id_data")
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=15, selectmode="extended")
+        # 定义列（每行的ID即为记录的sequence_id）
+        columns = ("选择", "序列号", "文件名", "文件大小", "分析时间", "飞书状态")
+        self.tree = ttk.Treeview(
+            tree_frame, columns=columns, displaycolumns=columns,
+            show="headings", height=15, selectmode="extended"
+        )
         
-        # 用于跟踪选中状态的字典
+        # 用于跟踪选中状态的字典：行ID -> 序列号
         self.selected_items = {}
         
         # 设置列标题和宽度
@@ -237,16 +336,14 @@ class HistoryViewer:
         self.tree.heading("文件大小", text="文件大小")
         self.tree.heading("分析时间", text="分析时间")
         self.tree.heading("飞书状态", text="飞书状态")
-        self.tree.heading("sequence_id_data", text="")  # 隐藏列的标题
         
-        self.tree.column("选择", width=50, minwidth=50)
-        self.tree.column("序列号", width=200, minwidth=180)  # 增加序列号列宽度
+        # 列宽固定，只有文件名列随窗口伸缩，调整窗口大小时无需重新计算所有列
+        self.tree.column("选择", width=50, minwidth=50, stretch=False)
+        self.tree.column("序列号", width=200, minwidth=180, stretch=False)  # 增加序列号列宽度
         self.tree.column("文件名", width=400, minwidth=350)  # 大幅增加文件名列宽度
-        self.tree.column("文件大小", width=100, minwidth=90)  # 稍微增加文件大小列宽度
-        self.tree.column("分析时间", width=160, minwidth=140)  # 增加分析时间列宽度
-        self.tree.column("飞书状态", width=120, minwidth=100)  # 增加飞书状态列宽度
-        # 隐藏sequence_id_data列
-        self.tree.column("sequence_id_data", width=0, minwidth=0, stretch=False)
+        self.tree.column("文件大小", width=100, minwidth=90, stretch=False)  # 稍微增加文件大小列宽度
+        self.tree.column("分析时间", width=160, minwidth=140, stretch=False)  # 增加分析时间列宽度
+        self.tree.column("飞书状态", width=120, minwidth=100, stretch=False)  # 增加飞书状态列宽度
         
         # 全选状态
         self.select_all_state = False
@@ -258,7 +355,8 @@ class HistoryViewer:
         # 添加滚动条
         tree_scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         tree_scrollbar_x = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=tree_scrollbar_y.set, xscrollcommand=tree_scrollbar_x.set)
+        self._tree_scrollbar_y = tree_scrollbar_y
+        self.tree.configure(yscrollcommand=self._on_tree_scrolled, xscrollcommand=tree_scrollbar_x.set)
         
         # 布局
         self.tree.pack(side="left", fill="both", expand=True)
@@ -387,8 +485,11 @@ class HistoryViewer:
         加载历史记录数据
         """
         try:
-            self.history_data = db.get_all_analysis_results(limit=1000)
-            self.filtered_data = self.history_data.copy()
+            self.history_data = db.get_all_analysis_results(limit=HISTORY_LOAD_LIMIT)
+            self._history_complete = len(self.history_data) < HISTORY_LOAD_LIMIT
+            self._history_by_seq = {record.get('sequence_id'): record for record in self.history_data}
+            self._search_cache.clear()
+            self.filtered_data = self.history_data
             self._update_tree_view()
             self._update_stats()
             
@@ -398,61 +499,173 @@ class HistoryViewer:
     def _update_tree_view(self) -> None:
         """
         更新树形视图
+        
+        只同步插入第一批行，其余行在界面空闲时分批插入，
+        滚动接近底部时会立即插入下一批。
         """
-        # 清空现有数据
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # 取消上一次尚未完成的分批插入
+        if self._page_after_id is not None:
+            self.history_window.after_cancel(self._page_after_id)
+            self._page_after_id = None
         
-        # 添加数据
+        # 按行ID索引当前显示的记录，选中记录时直接查找；同时在Python侧准备好所有行的值
+        self._by_row = {}
+        self._pending_rows = deque()
         for record in self.filtered_data:
-            # 格式化文件大小
-            file_size = self._format_file_size(record.get('file_size', 0))
+            row_id = self._make_row_id(record)
+            self._by_row[row_id] = record
+            self._pending_rows.append((row_id, self._record_to_row(record, row_id)))
+        
+        # 插入期间把表格从布局中移除，避免逐行触发重绘和几何计算
+        pack_info = self.tree.pack_info()
+        siblings = self.tree.master.pack_slaves()
+        next_index = siblings.index(self.tree) + 1
+        self.tree.pack_forget()
+        
+        try:
+            # 一次调用清空现有数据
+            self.tree.delete(*self.tree.get_children())
+            
+            # 添加第一批数据
+            self._insert_next_page()
+        finally:
+            # 按原来的位置和参数重新显示表格
+            if next_index < len(siblings):
+                pack_info['before'] = siblings[next_index]
+            self.tree.pack(**pack_info)
+    
+    def _insert_next_page(self) -> None:
+        """
+        插入下一批待显示的行，仍有剩余时在空闲时继续
+        """
+        self._page_after_id = None
+        
+        # 窗口已关闭时放弃剩余的行
+        if not self.tree.winfo_exists():
+            self._pending_rows.clear()
+            return
+        
+        pending = self._pending_rows
+        for _ in range(min(TREE_PAGE_SIZE, len(pending))):
+            self._insert_row(*pending.popleft())
+        
+        if pending:
+            self._page_after_id = self.history_window.after_idle(self._insert_next_page)
+    
+    def _insert_pending_rows(self) -> None:
+        """
+        立即插入所有待显示的行（需要遍历整个表格的操作前调用）
+        """
+        if self._page_after_id is not None:
+            self.history_window.after_cancel(self._page_after_id)
+            self._page_after_id = None
+        
+        pending = self._pending_rows
+        while pending:
+            self._insert_row(*pending.popleft())
+    
+    def _make_row_id(self, record: Dict) -> str:
+        """
+        生成记录在表格中的行ID：通常为sequence_id，
+        缺少sequence_id（旧数据）或与已显示的行重复时按记录对象生成唯一ID
+        
+        Args:
+            record (Dict): 记录数据
             
-            # 格式化时间
-            created_at = record.get('created_at', '')
-            if created_at:
-                try:
-                    # 解析时间字符串
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    formatted_time = created_at
-            else:
-                formatted_time = ''
-            
-            # 飞书同步状态 - 综合考虑电子表格和云文档同步状态
-            spreadsheet_row = record.get('feishu_spreadsheet_row')
-            spreadsheet_sync_status = record.get('spreadsheet_sync_status', 0)
-            doc_sync_status = record.get('doc_sync_status', 0)
-            
-            # 检查各种同步状态
-            spreadsheet_synced = spreadsheet_row and spreadsheet_sync_status == 1
-            doc_synced = doc_sync_status == 1
-            
-            if spreadsheet_synced and doc_synced:
-                feishu_status = "✓ 全部已同步"
-            elif spreadsheet_synced or doc_synced:
-                if spreadsheet_synced:
-                    feishu_status = "✓ 表格已同步"
-                else:
-                    feishu_status = "✓ 文档已同步"
-            else:
-                feishu_status = "○ 未同步"
-            
-            # 检查选择状态
-            sequence_id = record.get('sequence_id', '')
-            select_status = "☑" if sequence_id in self.selected_items else "☐"
-            
-            # 插入数据（包含所有7列的值）
-            item_id = self.tree.insert("", "end", values=(
-                select_status,
-                sequence_id,
-                record.get('file_name', ''),
-                file_size,
-                formatted_time,
-                feishu_status,
-                sequence_id  # sequence_id_data列的值
-            ))
+        Returns:
+            str: 行ID
+        """
+        sequence_id = record.get('sequence_id')
+        if sequence_id and sequence_id not in self._by_row:
+            return sequence_id
+        # sequence_id由数字和字母组成，不会与带#前缀的ID冲突
+        return f"#{id(record)}"
+    
+    def _insert_row(self, row_id: str, values: tuple) -> None:
+        """
+        在表格末尾插入一行
+        
+        Args:
+            row_id (str): 行ID
+            values (tuple): 表格各列的值
+        """
+        self.tree.insert("", "end", iid=row_id, values=values)
+    
+    def _refresh_records(self, sequence_ids: List[str]) -> None:
+        """
+        从数据库重新读取指定记录，原地更新缓存的记录和对应的表格行
+        
+        Args:
+            sequence_ids (List[str]): 记录序列号列表
+        """
+        fresh_records = db.get_analysis_by_sequence_ids(sequence_ids)
+        if not fresh_records:
+            return
+        
+        # 缓存的搜索结果中的记录已过期
+        self._search_cache.clear()
+        
+        for fresh in fresh_records:
+            sequence_id = fresh['sequence_id']
+            
+            # 已加载的记录和搜索结果可能是不同的字典，分别更新（行ID通常即为sequence_id）
+            for record in (self._history_by_seq.get(sequence_id), self._by_row.get(sequence_id)):
+                if record is not None:
+                    record.update(fresh)
+            
+            record = self._by_row.get(sequence_id)
+            if record is not None and self.tree.exists(sequence_id):
+                self.tree.item(sequence_id, values=self._record_to_row(record, sequence_id))
+    
+    def _refresh_loaded_records(self) -> None:
+        """
+        整体同步后原地刷新已加载的记录，不重新构建表格
+        """
+        sequence_ids = set(self._history_by_seq)
+        sequence_ids.update(record.get('sequence_id') for record in self._by_row.values())
+        self._refresh_records([sequence_id for sequence_id in sequence_ids if sequence_id])
+    
+    def _on_tree_scrolled(self, first: str, last: str) -> None:
+        """
+        表格滚动回调：更新滚动条，接近底部时立即插入下一批
+        
+        Args:
+            first (str): 可见区域起始位置
+            last (str): 可见区域结束位置
+        """
+        self._tree_scrollbar_y.set(first, last)
+        if self._pending_rows and float(last) > 0.9:
+            if self._page_after_id is not None:
+                self.history_window.after_cancel(self._page_after_id)
+            self._insert_next_page()
+    
+    def _record_to_row(self, record: Dict, row_id: str) -> tuple:
+        """
+        将记录转换为表格行的值
+        
+        Args:
+            record (Dict): 记录数据
+            row_id (str): 记录在表格中的行ID
+            
+        Returns:
+            tuple: 表格各列的值（包含所有6列）
+        """
+        get = record.get
+        sequence_id = get('sequence_id') or ''
+        
+        # 飞书同步状态 - 综合考虑电子表格和云文档同步状态
+        spreadsheet_synced = bool(get('feishu_spreadsheet_row')) and get('spreadsheet_sync_status', 0) == 1
+        doc_synced = get('doc_sync_status', 0) == 1
+        
+        # 文件大小和时间的格式化结果按值缓存，刷新和搜索时不再重复计算
+        return (
+            "☑" if row_id in self.selected_items else "☐",
+            sequence_id,
+            get('file_name', ''),
+            _format_size(get('file_size', 0)),
+            _format_time(get('created_at', '')),
+            _FEISHU_STATUS[spreadsheet_synced << 1 | doc_synced]
+        )
     
     def _format_file_size(self, size_bytes: int) -> str:
         """
@@ -464,23 +677,15 @@ class HistoryViewer:
         Returns:
             str: 格式化后的文件大小
         """
-        if size_bytes == 0:
-            return "0 B"
-        
-        size_names = ["B", "KB", "MB", "GB"]
-        i = 0
-        while size_bytes >= 1024 and i < len(size_names) - 1:
-            size_bytes /= 1024.0
-            i += 1
-        
-        return f"{size_bytes:.1f} {size_names[i]}"
+        return _format_size(size_bytes)
     
     def _update_stats(self) -> None:
         """
         更新统计信息
         """
+        # 未过滤时filtered_data与history_data是同一个列表
         total_count = len(self.filtered_data)
-        if len(self.filtered_data) != len(self.history_data):
+        if self.filtered_data is not self.history_data:
             self.stats_label.config(text=f"显示记录数: {total_count} / 总记录数: {len(self.history_data)}")
         else:
             self.stats_label.config(text=f"总记录数: {total_count}")
@@ -496,18 +701,8 @@ class HistoryViewer:
         if not selection:
             return
         
-        # 从隐藏的sequence_id_data列获取正确的sequence_id
-        sequence_id = self.tree.set(selection[0], "sequence_id_data")
-        
-        if not sequence_id:
-            return
-        
-        # 查找对应的记录
-        selected_record = None
-        for record in self.filtered_data:
-            if record.get('sequence_id') == sequence_id:
-                selected_record = record
-                break
+        # 按行ID查找对应的记录
+        selected_record = self._by_row.get(selection[0])
         
         if selected_record:
             self._display_record_details(selected_record)
@@ -525,16 +720,7 @@ class HistoryViewer:
         file_info = f"{record.get('file_name', '')} ({self._format_file_size(record.get('file_size', 0))})"
         self.file_label.config(text=file_info)
         
-        created_at = record.get('created_at', '')
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S')
-            except:
-                formatted_time = created_at
-        else:
-            formatted_time = ''
-        self.time_label.config(text=formatted_time)
+        self.time_label.config(text=_format_time(record.get('created_at', '')))
         
         # 更新分析提示
         self.prompt_text.config(state="normal")
@@ -542,25 +728,68 @@ class HistoryViewer:
         self.prompt_text.insert(1.0, record.get('analysis_prompt', ''))
         self.prompt_text.config(state="disabled")
         
-        # 更新分析结果
-        self.result_text.config(state="normal")
-        self.result_text.delete(1.0, tk.END)
-        
         # 显示分析结果
-        analysis_result = record.get('analysis_result', '')
-        self.result_text.insert(1.0, analysis_result)
+        analysis_result = record.get('analysis_result', '') or ''
         
         # 添加OSS链接信息（如果存在）
         oss_url = record.get('oss_url')
         oss_file_name = record.get('oss_file_name')
         if oss_url:
-            oss_info = "\n\n=== OSS上传信息 ==="
-            oss_info += f"\nOSS链接: {oss_url}"
+            analysis_result += "\n\n=== OSS上传信息 ==="
+            analysis_result += f"\nOSS链接: {oss_url}"
             if oss_file_name:
-                oss_info += f"\nOSS文件名: {oss_file_name}"
-            self.result_text.insert(tk.END, oss_info)
+                analysis_result += f"\nOSS文件名: {oss_file_name}"
+        
+        # 首段立即显示，较长的结果在空闲时分段插入，避免点击记录时界面卡顿
+        self._cancel_result_stream()
+        self.result_text.config(state="normal")
+        self.result_text.replace(1.0, tk.END, analysis_result[:RESULT_CHUNK_SIZE])
+        self.result_text.config(state="disabled")
+        
+        if len(analysis_result) > RESULT_CHUNK_SIZE:
+            self._result_chunks = iter([
+                analysis_result[i:i + RESULT_CHUNK_SIZE]
+                for i in range(RESULT_CHUNK_SIZE, len(analysis_result), RESULT_CHUNK_SIZE)
+            ])
+            self._result_after_id = self.history_window.after_idle(self._stream_result_text)
+    
+    def _stream_result_text(self) -> None:
+        """
+        插入分析结果的下一段，仍有剩余时在空闲时继续
+        """
+        self._result_after_id = None
+        if self._result_chunks is None or not self.result_text.winfo_exists():
+            return
+        
+        chunk = next(self._result_chunks, None)
+        if chunk is None:
+            self._result_chunks = None
+            return
         
+        self.result_text.config(state="normal")
+        self.result_text.insert(tk.END, chunk)
         self.result_text.config(state="disabled")
+        self._result_after_id = self.history_window.after_idle(self._stream_result_text)
+    
+    def _cancel_result_stream(self) -> None:
+        """
+        取消尚未完成的分析结果分段插入
+        """
+        if self._result_after_id is not None:
+            self.history_window.after_cancel(self._result_after_id)
+            self._result_after_id = None
+        self._result_chunks = None
+    
+    def _flush_result_stream(self) -> None:
+        """
+        立即插入分析结果的剩余部分（读取文本框内容前调用）
+        """
+        chunks = self._result_chunks
+        self._cancel_result_stream()
+        if chunks is not None:
+            self.result_text.config(state="normal")
+            self.result_text.insert(tk.END, "".join(chunks))
+            self.result_text.config(state="disabled")
     
     def _sync_all_to_spreadsheet(self) -> None:
         """
@@ -573,8 +802,8 @@ class HistoryViewer:
                 messagebox.showwarning("配置错误", "请先在设置中配置飞书电子表格信息")
                 return
             
-            # 获取所有记录
-            all_records = db.get_all_history_records()
+            # 获取所有记录（历史记录已全部加载时直接使用内存中的数据）
+            all_records = self.history_data if self._history_complete else db.get_all_history_records()
             if not all_records:
                 messagebox.showinfo("提示", "没有可同步的记录")
                 return
@@ -583,90 +812,27 @@ class HistoryViewer:
             if not messagebox.askyesno("确认同步", f"确定要同步 {len(all_records)} 条记录到飞书电子表格吗？"):
                 return
             
-            # 创建进度窗口
-            progress_window = tk.Toplevel(self.history_window)
-            progress_window.title("同步进度")
-            progress_window.geometry("400x150")
-            progress_window.transient(self.history_window)
-            progress_window.grab_set()
-            
-            # 居中显示
-            progress_window.geometry("+%d+%d" % (
-                self.history_window.winfo_rootx() + 50,
-                self.history_window.winfo_rooty() + 50
-            ))
-            
-            # 进度标签
-            progress_label = tk.Label(progress_window, text="准备同步...", font=("Arial", 10))
-            progress_label.pack(pady=10)
-            
-            # 进度条
-            progress_bar = ttk.Progressbar(
-                progress_window,
-                mode='determinate',
-                maximum=len(all_records)
-            )
-            progress_bar.pack(pady=10, padx=20, fill="x")
-            
-            # 状态标签
-            status_label = tk.Label(progress_window, text="", font=("Arial", 9), fg="gray")
-            status_label.pack(pady=5)
-            
-            progress_window.update()
-            
-            # 执行同步
-            from ..utils.feishu_spreadsheet_sync import FeishuSpreadsheetSync
-            sync_service = FeishuSpreadsheetSync()
-            
-            success_count = 0
-            error_count = 0
-            error_messages = []
-            
-            for i, record in enumerate(all_records):
-                try:
-                    progress_label.config(text=f"正在同步第 {i+1}/{len(all_records)} 条记录...")
-                    status_label.config(text=f"文件: {record.get('file_name', 'Unknown')}")
-                    progress_bar['value'] = i
-                    progress_window.update()
-                    
-                    # 同步单条记录（强制更新以确保数据写入）
-                    result = sync_service.sync_record_to_spreadsheet(
-                        record.get('sequence_id'), 
-                        force_update=True
-                    )
-                    if result:
-                        success_count += 1
-                    else:
-                        raise Exception("同步失败")
-                    
-                except Exception as e:
-                    error_count += 1
-                    error_messages.append(f"记录 {record.get('sequence_id', 'Unknown')}: {str(e)}")
-                    
-                time.sleep(0.1)  # 避免请求过快
-            
-            progress_bar['value'] = len(all_records)
-            progress_label.config(text="同步完成")
-            progress_window.update()
-            
-            # 等待一下再关闭进度窗口
-            progress_window.after(1000, progress_window.destroy)
-            
-            # 显示结果
-            if error_count == 0:
-                result_message = f"成功同步 {success_count} 条记录到飞书电子表格"
-                messagebox.showinfo("同步完成", result_message)
-            else:
-                result_message = f"同步完成：成功 {success_count} 条，失败 {error_count} 条"
-                if len(error_messages) <= 5:
-                    result_message += "\n\n失败详情：\n" + "\n".join(error_messages)
+            def on_done(result: Dict) -> None:
+                # 显示结果
+                success_count = result['success']
+                error_count = result['failed']
+                error_messages = result['errors']
+                if error_count == 0:
+                    result_message = f"成功同步 {success_count} 条记录到飞书电子表格"
+                    messagebox.showinfo("同步完成", result_message)
                 else:
-                    result_message += f"\n\n失败详情（前5条）：\n" + "\n".join(error_messages[:5])
-                    result_message += f"\n... 还有 {len(error_messages) - 5} 条错误"
-                messagebox.showwarning("同步完成", result_message)
+                    result_message = f"同步完成：成功 {success_count} 条，失败 {error_count} 条"
+                    if len(error_messages) <= 5:
+                        result_message += "\n\n失败详情：\n" + "\n".join(error_messages)
+                    else:
+                        result_message += f"\n\n失败详情（前5条）：\n" + "\n".join(error_messages[:5])
+                        result_message += f"\n... 还有 {len(error_messages) - 5} 条错误"
+                    messagebox.showwarning("同步完成", result_message)
+                
+                # 原地刷新已加载的记录
+                self._refresh_loaded_records()
             
-            # 刷新数据
-            self._load_history_data()
+            self._run_spreadsheet_sync([record.get('sequence_id') for record in all_records], on_done)
             
         except Exception as e:
             messagebox.showerror("错误", f"同步失败: {str(e)}")
@@ -691,10 +857,9 @@ class HistoryViewer:
             # 获取记录详情
             selected_records = []
             for item in selected_items:
-                # sequence_id在第二列（索引1），第一列（索引0）是选择状态
-                sequence_id = self.tree.item(item, "values")[1]
-                record = db.get_analysis_by_sequence_id(sequence_id)
-                if record:
+                # 按行ID查找记录，缺少sequence_id的旧数据无法同步
+                record = self._by_row.get(item)
+                if record and record.get('sequence_id'):
                     selected_records.append(record)
             
             if not selected_records:
@@ -705,136 +870,175 @@ class HistoryViewer:
             if not messagebox.askyesno("确认同步", f"确定要同步 {len(selected_records)} 条记录到飞书电子表格吗？"):
                 return
             
-            # 创建进度窗口（如果记录数量较多）
-            progress_window = None
-            progress_label = None
-            progress_bar = None
-            
-            if len(selected_records) > 1:
-                progress_window = tk.Toplevel(self.history_window)
-                progress_window.title("同步进度")
-                progress_window.geometry("400x120")
-                progress_window.transient(self.history_window)
-                progress_window.grab_set()
-                
-                # 居中显示
-                progress_window.geometry("+%d+%d" % (
-                    self.history_window.winfo_rootx() + 50,
-                    self.history_window.winfo_rooty() + 50
-                ))
-                
-                # 进度标签
-                progress_label = tk.Label(progress_window, text="准备同步...", font=("Arial", 10))
-                progress_label.pack(pady=10)
+            def on_done(result: Dict) -> None:
+                # 显示结果
+                success_count = result['success']
+                error_count = result['failed']
+                error_messages = result['errors']
+                if error_count == 0:
+                    result_message = f"成功同步 {success_count} 条记录到飞书电子表格"
+                    if len(selected_records) == 1:
+                        result_message = "记录已成功同步到飞书电子表格"
+                    messagebox.showinfo("同步完成", result_message)
+                else:
+                    result_message = f"同步完成：成功 {success_count} 条，失败 {error_count} 条"
+                    if len(error_messages) <= 3:
+                        result_message += "\n\n失败详情：\n" + "\n".join(error_messages)
+                    else:
+                        result_message += f"\n\n失败详情（前3条）：\n" + "\n".join(error_messages[:3])
+                        result_message += f"\n... 还有 {len(error_messages) - 3} 条错误"
+                    if error_count == len(selected_records):
+                        messagebox.showerror("同步失败", result_message)
+                    else:
+                        messagebox.showinfo("同步完成", result_message)
                 
-                # 进度条
-                progress_bar = ttk.Progressbar(
-                    progress_window,
-                    mode='determinate',
-                    maximum=len(selected_records)
-                )
-                progress_bar.pack(pady=10, padx=20, fill="x")
+                # 只刷新同步过的行，保留当前的列表和选中状态
+                self._refresh_records([record['sequence_id'] for record in selected_records])
+            
+            self._run_spreadsheet_sync([record['sequence_id'] for record in selected_records], on_done)
                 
-                progress_window.update()
+        except Exception as e:
+            messagebox.showerror("错误", f"同步失败: {str(e)}")
+    
+    def _run_spreadsheet_sync(self, sequence_ids: List[str], on_done: Callable[[Dict], None]) -> None:
+        """
+        在后台线程中批量同步记录到电子表格，界面线程只负责显示进度
+        
+        Args:
+            sequence_ids (List[str]): 要同步的记录序列号
+            on_done (Callable[[Dict], None]): 同步完成后在界面线程中调用，参数为同步结果
+        """
+        total = len(sequence_ids)
+        
+        # 创建进度窗口（如果记录数量较多）
+        progress_window = None
+        progress_var = None
+        progress_bar = None
+        status_var = None
+        
+        if total > 1:
+            progress_window = tk.Toplevel(self.history_window)
+            progress_window.title("同步进度")
+            progress_window.geometry("400x150")
+            progress_window.transient(self.history_window)
+            progress_window.grab_set()
             
-            # 执行同步
-            from ..utils.feishu_spreadsheet_sync import FeishuSpreadsheetSync
-            sync_service = FeishuSpreadsheetSync()
+            # 居中显示
+            progress_window.geometry("+%d+%d" % (
+                self.history_window.winfo_rootx() + 50,
+                self.history_window.winfo_rooty() + 50
+            ))
             
-            success_count = 0
-            error_count = 0
-            error_messages = []
+            # 进度标签（通过变量更新文字）
+            progress_var = tk.StringVar(progress_window, value="准备同步...")
+            tk.Label(progress_window, textvariable=progress_var, font=("Arial", 10)).pack(pady=10)
             
-            for i, record in enumerate(selected_records):
-                try:
-                    if progress_window:
-                        progress_label.config(text=f"正在同步第 {i+1}/{len(selected_records)} 条记录...")
-                        progress_bar['value'] = i
-                        progress_window.update()
-                    
-                    # 同步单条记录（强制更新以确保数据写入）
-                    result = sync_service.sync_record_to_spreadsheet(
-                        record.get('sequence_id'), 
-                        force_update=True
-                    )
-                    if result:
-                        success_count += 1
+            # 进度条
+            progress_bar = ttk.Progressbar(
+                progress_window,
+                mode='determinate',
+                maximum=total
+            )
+            progress_bar.pack(pady=10, padx=20, fill="x")
+            
+            # 状态标签
+            status_var = tk.StringVar(progress_window)
+            tk.Label(progress_window, textvariable=status_var, font=("Arial", 9), fg="gray").pack(pady=5)
+        
+        # 后台线程通过队列回传进度和结果
+        updates = queue.Queue()
+        
+        def worker() -> None:
+            try:
+                # 同步记录（强制更新以确保数据写入）
+                result = self._spreadsheet_sync.sync_records_to_spreadsheet(
+                    sequence_ids,
+                    force_update=True,
+                    progress_callback=lambda done, _total, record: updates.put(('progress', done, record))
+                )
+            except Exception as e:
+                result = {'success': 0, 'failed': total, 'errors': [str(e)]}
+            updates.put(('done', result))
+        
+        def poll() -> None:
+            if not self.history_window or not self.history_window.winfo_exists():
+                return
+            
+            # 取出队列中的全部消息，只显示最新进度
+            latest = None
+            result = None
+            try:
+                while True:
+                    message = updates.get_nowait()
+                    if message[0] == 'progress':
+                        latest = message
                     else:
-                        raise Exception("同步失败")
-                    
-                except Exception as e:
-                    error_count += 1
-                    error_messages.append(f"记录 {record.get('sequence_id', 'Unknown')}: {str(e)}")
-                    
-                if len(selected_records) > 1:
-                    time.sleep(0.1)  # 避免请求过快
+                        result = message[1]
+            except queue.Empty:
+                pass
+            
+            if latest and progress_window:
+                _, done, record = latest
+                progress_var.set(f"已同步 {done}/{total} 条记录...")
+                status_var.set(f"文件: {record.get('file_name', 'Unknown')}")
+                progress_bar['value'] = done
+            
+            if result is None:
+                self.history_window.after(100, poll)
+                return
             
             if progress_window:
-                progress_bar['value'] = len(selected_records)
-                progress_label.config(text="同步完成")
-                progress_window.update()
+                progress_bar['value'] = total
+                progress_var.set("同步完成")
                 
                 # 等待一下再关闭进度窗口
                 progress_window.after(1000, progress_window.destroy)
             
-            # 显示结果
-            if error_count == 0:
-                result_message = f"成功同步 {success_count} 条记录到飞书电子表格"
-                if len(selected_records) == 1:
-                    result_message = "记录已成功同步到飞书电子表格"
-                messagebox.showinfo("同步完成", result_message)
-            else:
-                result_message = f"同步完成：成功 {success_count} 条，失败 {error_count} 条"
-                if len(error_messages) <= 3:
-                    result_message += "\n\n失败详情：\n" + "\n".join(error_messages)
-                else:
-                    result_message += f"\n\n失败详情（前3条）：\n" + "\n".join(error_messages[:3])
-                    result_message += f"\n... 还有 {len(error_messages) - 3} 条错误"
-                if error_count == len(selected_records):
-                    messagebox.showerror("同步失败", result_message)
-                else:
-                    messagebox.showinfo("同步完成", result_message)
-            
-            # 刷新数据
-            self._load_history_data()
-            
-            # 重新选中记录
-            if len(selected_records) == 1:
-                sequence_id = selected_records[0]['sequence_id']
-                for item in self.tree.get_children():
-                    if self.tree.item(item)['values'][0] == sequence_id:
-                        self.tree.selection_set(item)
-                        self.tree.focus(item)
-                        break
-                
-        except Exception as e:
-            messagebox.showerror("错误", f"同步失败: {str(e)}")
+            on_done(result)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.history_window.after(100, poll)
     
     def _on_search_changed(self, event=None) -> None:
         """
-        搜索框内容变化事件
+        搜索框内容变化事件，停止输入一段时间后再执行搜索
         
         Args:
             event: 事件对象
         """
-        # 实时搜索（可选）
-        pass
+        if self._search_after_id is not None:
+            self.history_window.after_cancel(self._search_after_id)
+        self._search_after_id = self.history_window.after(SEARCH_DEBOUNCE_MS, self._search_records)
     
     def _search_records(self) -> None:
         """
         搜索记录
         """
+        if self._search_after_id is not None:
+            self.history_window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
         keyword = self.search_var.get().strip()
         
         if not keyword:
-            self.filtered_data = self.history_data.copy()
+            self.filtered_data = self.history_data
+        elif self._history_complete:
+            # 记录已全部在内存中，直接过滤（与数据库搜索和导出的匹配规则相同）
+            self.filtered_data = filter_records(self.history_data, keyword)
+        elif keyword in self._search_cache:
+            self.filtered_data = self._search_cache[keyword]
         else:
             try:
-                # 使用数据库搜索
+                # 只加载了部分记录，使用数据库搜索
                 self.filtered_data = db.search_analysis_results(keyword)
             except Exception as e:
                 messagebox.showerror("错误", f"搜索失败: {str(e)}")
                 return
+            
+            # 缓存结果，重复搜索时不再查询数据库
+            if len(self._search_cache) >= SEARCH_CACHE_SIZE:
+                del self._search_cache[next(iter(self._search_cache))]
+            self._search_cache[keyword] = self.filtered_data
         
         self._update_tree_view()
         self._update_stats()
@@ -844,7 +1048,7 @@ class HistoryViewer:
         清除搜索
         """
         self.search_var.set("")
-        self.filtered_data = self.history_data.copy()
+        self.filtered_data = self.history_data
         self._update_tree_view()
         self._update_stats()
     
@@ -857,16 +1061,15 @@ class HistoryViewer:
             messagebox.showwarning("警告", "请先选择要删除的记录")
             return
         
-        # 从隐藏的sequence_id_data列获取正确的sequence_id
-        sequence_id = self.tree.set(selection[0], "sequence_id_data")
+        # 按行ID查找记录，缺少sequence_id的旧数据无法按序列号删除
+        record = self._by_row.get(selection[0])
+        sequence_id = record.get('sequence_id') if record else None
         
         if not sequence_id:
             return
         
-        # 获取文件名（第3列，索引为2）
-        item = self.tree.item(selection[0])
-        values = item['values']
-        file_name = values[2] if len(values) > 2 else "未知文件"
+        # 获取文件名
+        file_name = record.get('file_name') or "未知文件"
         
         # 确认删除
         if messagebox.askyesno("确认删除", f"确定要删除记录 '{file_name}' (序列号: {sequence_id}) 吗？"):
@@ -885,6 +1088,7 @@ class HistoryViewer:
                     self.prompt_text.delete(1.0, tk.END)
                     self.prompt_text.config(state="disabled")
                     
+                    self._cancel_result_stream()
                     self.result_text.config(state="normal")
                     self.result_text.delete(1.0, tk.END)
                     self.result_text.config(state="disabled")
@@ -898,18 +1102,37 @@ class HistoryViewer:
         """
         复制分析结果到剪贴板
         """
+        self._flush_result_stream()
         result_text = self.result_text.get(1.0, tk.END).strip()
         if result_text:
-            self.history_window.clipboard_clear()
-            self.history_window.clipboard_append(result_text)
+            self._set_clipboard(result_text)
             messagebox.showinfo("成功", "分析结果已复制到剪贴板")
         else:
             messagebox.showwarning("警告", "没有可复制的内容")
     
+    def _set_clipboard(self, text: str) -> None:
+        """
+        复制文本到剪贴板，大段文本优先直接调用系统剪贴板接口
+        
+        Args:
+            text (str): 要复制的文本
+        """
+        if pyperclip is not None and len(text) > NATIVE_CLIPBOARD_THRESHOLD:
+            try:
+                pyperclip.copy(text)
+                return
+            except Exception as e:
+                # 系统剪贴板不可用时（如Linux上未安装xclip）改用Tk剪贴板
+                self.logger.warning(f"系统剪贴板复制失败，改用Tk剪贴板: {e}")
+        
+        self.history_window.clipboard_clear()
+        self.history_window.clipboard_append(text)
+    
     def _save_result_as_text(self) -> None:
         """
         保存分析结果为文本文件
         """
+        self._flush_result_stream()
         result_text = self.result_text.get(1.0, tk.END).strip()
         if not result_text:
             messagebox.showwarning("警告", "没有可保存的内容")
@@ -932,13 +1155,21 @@ class HistoryViewer:
         
         if file_path:
             try:
+                lines = [
+                    "视频分析结果",
+                    f"序列号: {sequence_id}",
+                    f"文件名: {file_name}",
+                    f"分析时间: {self.time_label.cget('text')}",
+                    "",
+                    "分析提示:",
+                    self.prompt_text.get(1.0, tk.END).strip(),
+                    "",
+                    "分析结果:",
+                    result_text,
+                    ""
+                ]
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"视频分析结果\n")
-                    f.write(f"序列号: {sequence_id}\n")
-                    f.write(f"文件名: {file_name}\n")
-                    f.write(f"分析时间: {self.time_label.cget('text')}\n")
-                    f.write(f"\n分析提示:\n{self.prompt_text.get(1.0, tk.END).strip()}\n")
-                    f.write(f"\n分析结果:\n{result_text}\n")
+                    f.write("\n".join(lines))
                 
                 messagebox.showinfo("成功", f"分析结果已保存到: {file_path}")
                 
@@ -961,34 +1192,90 @@ class HistoryViewer:
             initialvalue="视频分析记录.csv"
         )
         
-        if file_path:
+        if not file_path:
+            return
+        
+        # 直接从数据库游标流式写入文件，按当前搜索条件导出
+        keyword = self.search_var.get().strip()
+        updates = queue.Queue()
+        
+        def worker() -> None:
+            count = 0
             try:
-                with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                    fieldnames = [
-                        '序列号', '文件名', '文件路径', '文件大小(字节)', '文件类型',
-                        '分析提示', '分析结果', 'OSS链接', 'OSS文件名', '创建时间', '更新时间'
-                    ]
+                with open(file_path, 'wb') as csvfile:
+                    # 每批行先序列化到内存缓冲区，编码后一次写入文件
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, quoting=csv.QUOTE_MINIMAL)
                     
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
+                    def flush() -> None:
+                        csvfile.write(buffer.getvalue().encode('utf-8'))
+                        buffer.seek(0)
+                        buffer.truncate()
                     
-                    for record in self.filtered_data:
-                        writer.writerow({
-                            '序列号': record.get('sequence_id', ''),
-                            '文件名': record.get('file_name', ''),
-                            '文件路径': record.get('file_path', ''),
-                            '文件大小(字节)': record.get('file_size', 0),
-                            '文件类型': record.get('mime_type', ''),
-                            '分析提示': record.get('analysis_prompt', ''),
-                            '分析结果': record.get('analysis_result', ''),
-                            '创建时间': record.get('created_at', ''),
-                            '更新时间': record.get('updated_at', '')
-                        })
-                
-                messagebox.showinfo("成功", f"数据已导出到: {file_path}")
+                    # 写入BOM，便于Excel识别UTF-8编码
+                    buffer.write('\ufeff')
+                    writer.writerow(_CSV_FIELDNAMES)
+                    
+                    batch = []
+                    for record in db.iter_analysis_results(keyword or None):
+                        batch.append(_record_to_csv_row(record))
+                        if len(batch) >= CSV_WRITE_BATCH_SIZE:
+                            writer.writerows(batch)
+                            flush()
+                            count += len(batch)
+                            batch.clear()
+                            updates.put(('progress', count))
+                    
+                    writer.writerows(batch)
+                    flush()
+                    count += len(batch)
                 
+                updates.put(('done', count))
             except Exception as e:
-                messagebox.showerror("错误", f"导出失败: {str(e)}")
+                updates.put(('error', e))
+        
+        def poll() -> None:
+            if not self.history_window or not self.history_window.winfo_exists():
+                return
+            
+            message = None
+            try:
+                while True:
+                    message = updates.get_nowait()
+                    if message[0] != 'progress':
+                        break
+            except queue.Empty:
+                pass
+            
+            if message is None or message[0] == 'progress':
+                if message:
+                    self.stats_label.config(text=f"正在导出... 已写入 {message[1]} 条记录")
+                self.history_window.after(100, poll)
+                return
+            
+            self._export_btn.config(state="normal")
+            self._update_stats()
+            if message[0] == 'done':
+                messagebox.showinfo("成功", f"已导出 {message[1]} 条记录到: {file_path}")
+            else:
+                messagebox.showerror("错误", f"导出失败: {str(message[1])}")
+        
+        self._export_btn.config(state="disabled")
+        self.stats_label.config(text="正在导出...")
+        threading.Thread(target=worker, daemon=True).start()
+        self.history_window.after(100, poll)
+    
+    def _count_all_records(self) -> tuple:
+        """
+        统计数据库中的记录总数和已同步到多维表格的记录数
+        
+        Returns:
+            tuple: (记录总数, 已同步记录数)，历史记录已全部加载时直接在内存中统计
+        """
+        if self._history_complete:
+            synced_count = sum(1 for record in self.history_data if record.get('feishu_record_id'))
+            return len(self.history_data), synced_count
+        return db.get_total_analysis_count(), db.get_synced_records_count()
     
     def _sync_all_to_feishu(self) -> None:
         """
@@ -1000,14 +1287,17 @@ class HistoryViewer:
                 messagebox.showerror("错误", "飞书连接失败，请检查配置")
                 return
             
-            # 统计已同步和未同步记录数
-            synced_count = sum(1 for record in self.history_data if record.get('feishu_record_id'))
-            unsynced_count = len(self.history_data) - synced_count
+            # 统计已同步和未同步记录数（同步范围是数据库中的全部记录，不限于已加载的部分）
+            total_count, synced_count = self._count_all_records()
+            unsynced_count = total_count - synced_count
             
             # 确认对话框
-            confirm_message = f"确定要将所有 {len(self.history_data)} 条记录同步到飞书多维表格吗？\n\n"
-            confirm_message += f"未同步记录: {unsynced_count} 条（将新建）\n"
-            confirm_message += f"已同步记录: {synced_count} 条（将更新）"
+            confirm_message = "\n".join([
+                f"确定要将所有 {total_count} 条记录同步到飞书多维表格吗？",
+                "",
+                f"未同步记录: {unsynced_count} 条（将新建）",
+                f"已同步记录: {synced_count} 条（将更新）"
+            ])
             
             result = messagebox.askyesno("确认同步", confirm_message)
             
@@ -1036,13 +1326,14 @@ class HistoryViewer:
             )
             progress_label.pack(pady=20)
             
-            # 进度条
+            # 进度条（整体同步没有逐条进度）
             progress_bar = ttk.Progressbar(
                 progress_window,
-                mode='determinate',
+                mode='indeterminate',
                 length=300
             )
             progress_bar.pack(pady=10)
+            progress_bar.start()
             
             # 状态标签
             status_label = tk.Label(
@@ -1053,33 +1344,38 @@ class HistoryViewer:
             )
             status_label.pack()
             
-            progress_window.update()
+            def show_result(result: Dict) -> None:
+                # 显示结果
+                success_count = result.get('success', 0)
+                failed_count = result.get('failed', 0)
+                created_count = result.get('created', 0)
+                updated_count = result.get('updated', 0)
+                
+                result_message = "\n".join([
+                    "同步完成！",
+                    "",
+                    f"总计处理: {total_count} 条",
+                    f"成功同步: {success_count} 条",
+                    f"  - 新建记录: {created_count} 条",
+                    f"  - 更新记录: {updated_count} 条",
+                    f"同步失败: {failed_count} 条"
+                ])
+                
+                if failed_count > 0:
+                    messagebox.showwarning("同步完成", result_message)
+                else:
+                    messagebox.showinfo("同步完成", result_message)
+                
+                # 原地刷新已加载的记录
+                self._refresh_loaded_records()
             
             # 执行同步 - 调用修改后的sync_all_records_to_feishu方法
-            result = feishu_sync.sync_all_records_to_feishu(include_synced=True)
-            
-            progress_window.destroy()
-            
-            # 显示结果
-            success_count = result.get('success', 0)
-            failed_count = result.get('failed', 0)
-            created_count = result.get('created', 0)
-            updated_count = result.get('updated', 0)
-            
-            result_message = f"同步完成！\n\n"
-            result_message += f"总计处理: {len(self.history_data)} 条\n"
-            result_message += f"成功同步: {success_count} 条\n"
-            result_message += f"  - 新建记录: {created_count} 条\n"
-            result_message += f"  - 更新记录: {updated_count} 条\n"
-            result_message += f"同步失败: {failed_count} 条"
-            
-            if failed_count > 0:
-                messagebox.showwarning("同步完成", result_message)
-            else:
-                messagebox.showinfo("同步完成", result_message)
-            
-            # 刷新数据
-            self._load_history_data()
+            self._run_sync_task(
+                lambda report: feishu_sync.sync_all_records_to_feishu(include_synced=True),
+                None,
+                show_result,
+                progress_window
+            )
             
         except Exception as e:
             messagebox.showerror("错误", f"同步失败: {str(e)}")
@@ -1103,14 +1399,10 @@ class HistoryViewer:
             # 获取选中记录的数据
             selected_records = []
             for selected_item in selected_items:
-                # 从隐藏的sequence_id_data列获取正确的sequence_id
-                sequence_id = self.tree.set(selected_item, "sequence_id_data")
-                
-                # 查找对应的记录数据
-                for record in self.history_data:
-                    if record.get('sequence_id') == sequence_id:
-                        selected_records.append(record)
-                        break
+                # 按行ID查找记录，缺少sequence_id的旧数据无法同步
+                record = self._by_row.get(selected_item)
+                if record and record.get('sequence_id'):
+                    selected_records.append(record)
             
             if not selected_records:
                 messagebox.showerror("错误", "未找到选中的记录数据")
@@ -1127,9 +1419,12 @@ class HistoryViewer:
                 if selected_records[0].get('feishu_record_id'):
                     confirm_message += "\n\n注意：此记录已同步，将执行更新操作。"
             else:
-                confirm_message = f"确定要将选中的 {len(selected_records)} 条记录同步到飞书多维表格吗？\n\n"
-                confirm_message += f"未同步记录: {unsynced_count} 条（将新建）\n"
-                confirm_message += f"已同步记录: {synced_count} 条（将更新）"
+                confirm_message = "\n".join([
+                    f"确定要将选中的 {len(selected_records)} 条记录同步到飞书多维表格吗？",
+                    "",
+                    f"未同步记录: {unsynced_count} 条（将新建）",
+                    f"已同步记录: {synced_count} 条（将更新）"
+                ])
             
             result = messagebox.askyesno("确认同步", confirm_message)
             
@@ -1139,12 +1434,13 @@ class HistoryViewer:
             # 创建进度窗口（如果选中多条记录）
             progress_window = None
             progress_bar = None
-            status_label = None
+            status_var = None
+            cancel_event = threading.Event()
             
             if len(selected_records) > 1:
                 progress_window = tk.Toplevel(self.history_window)
                 progress_window.title("同步进度")
-                progress_window.geometry("400x150")
+                progress_window.geometry("400x180")
                 progress_window.resizable(False, False)
                 progress_window.transient(self.history_window)
                 progress_window.grab_set()
@@ -1173,100 +1469,139 @@ class HistoryViewer:
                 progress_bar.pack(pady=10)
                 
                 # 状态标签
+                status_var = tk.StringVar(progress_window, value="准备中...")
                 status_label = tk.Label(
                     progress_window,
-                    text="准备中...",
+                    textvariable=status_var,
                     font=("Arial", 9),
                     fg="#666666"
                 )
                 status_label.pack()
                 
-                progress_window.update()
+                # 取消按钮：当前批次完成后停止
+                ttk.Button(
+                    progress_window,
+                    text="取消",
+                    command=cancel_event.set
+                ).pack(pady=5)
+            
+            def do_sync(report: Callable) -> Dict[str, int]:
+                # 在工作线程中按批同步：未同步的批量新建，已同步的批量更新
+                return feishu_sync.sync_records_to_feishu(
+                    [record['sequence_id'] for record in selected_records],
+                    include_synced=True,
+                    progress_callback=report,
+                    cancel_event=cancel_event
+                )
             
-            # 执行同步
-            success_count = 0
-            failed_count = 0
-            updated_count = 0
-            created_count = 0
-            
-            for i, record in enumerate(selected_records):
-                sequence_id = record['sequence_id']
-                file_name = record.get('file_name', '未知文件')
-                
-                # 更新进度
+            def update_progress(done: int, total: int) -> None:
                 if progress_bar:
-                    progress_bar['value'] = i + 1
-                    status_label.config(text=f"正在同步: {file_name} ({i+1}/{len(selected_records)})")
-                    progress_window.update()
+                    progress_bar['value'] = done
+                    status_var.set(f"已同步: {done}/{total}")
+            
+            def show_result(counts: Dict[str, int]) -> None:
+                success_count = counts['success']
+                failed_count = counts['failed']
+                created_count = counts['created']
+                updated_count = counts['updated']
+                processed_count = len(selected_records) - counts['skipped']
                 
-                try:
-                    # 统一使用sync_record_to_feishu方法，支持重复同步
-                    # 对于已同步的记录，使用force_resync=True强制重新同步
-                    force_resync = bool(record.get('feishu_record_id'))
-                    
-                    if feishu_sync.sync_record_to_feishu(sequence_id, force_resync=force_resync):
-                        success_count += 1
-                        if force_resync:
-                            updated_count += 1
-                        else:
-                            created_count += 1
+                # 显示结果
+                if len(selected_records) == 1:
+                    if success_count > 0:
+                        # 统一显示为"同步"，因为现在支持重复同步
+                        messagebox.showinfo("成功", "记录已成功同步到飞书多维表格")
                     else:
-                        failed_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    print(f"同步记录 {sequence_id} 失败: {e}")
-                
-                # 添加小延迟避免API限流
-                if len(selected_records) > 1:
-                    time.sleep(0.1)
-            
-            if progress_window:
-                progress_window.destroy()
-            
-            # 显示结果
-            if len(selected_records) == 1:
-                if success_count > 0:
-                    # 统一显示为"同步"，因为现在支持重复同步
-                    messagebox.showinfo("成功", "记录已成功同步到飞书多维表格")
+                        messagebox.showerror("错误", "同步失败，请检查网络连接和飞书配置")
                 else:
-                    messagebox.showerror("错误", "同步失败，请检查网络连接和飞书配置")
-            else:
-                result_message = f"批量同步完成！\n\n"
-                result_message += f"总计处理: {len(selected_records)} 条\n"
-                result_message += f"成功同步: {success_count} 条\n"
-                if created_count > 0:
-                    result_message += f"  - 新建记录: {created_count} 条\n"
-                if updated_count > 0:
-                    result_message += f"  - 更新记录: {updated_count} 条\n"
-                result_message += f"同步失败: {failed_count} 条"
+                    lines = [
+                        "同步已取消！" if counts['skipped'] else "批量同步完成！",
+                        "",
+                        f"总计处理: {processed_count} 条",
+                        f"成功同步: {success_count} 条"
+                    ]
+                    if created_count > 0:
+                        lines.append(f"  - 新建记录: {created_count} 条")
+                    if updated_count > 0:
+                        lines.append(f"  - 更新记录: {updated_count} 条")
+                    lines.append(f"同步失败: {failed_count} 条")
+                    result_message = "\n".join(lines)
+                    
+                    if failed_count > 0:
+                        messagebox.showwarning("同步完成", result_message)
+                    else:
+                        messagebox.showinfo("同步完成", result_message)
                 
-                if failed_count > 0:
-                    messagebox.showwarning("同步完成", result_message)
-                else:
-                    messagebox.showinfo("同步完成", result_message)
-            
-            # 刷新数据
-            self._load_history_data()
+                # 只刷新同步过的行，保留当前的列表和选中状态
+                self._refresh_records([record['sequence_id'] for record in selected_records])
             
-            # 重新选中记录
-            if len(selected_records) == 1:
-                sequence_id = selected_records[0]['sequence_id']
-                for item in self.tree.get_children():
-                    if self.tree.item(item)['values'][0] == sequence_id:
-                        self.tree.selection_set(item)
-                        self.tree.focus(item)
-                        break
+            self._run_sync_task(do_sync, update_progress, show_result, progress_window)
                 
         except Exception as e:
             messagebox.showerror("错误", f"同步失败: {str(e)}")
     
+    def _run_sync_task(self, task: Callable, on_progress: Optional[Callable],
+                       on_done: Callable, progress_window: Optional[tk.Toplevel] = None) -> None:
+        """
+        在同步工作线程中执行任务，界面线程定时取回最新进度和结果
+        
+        Args:
+            task (Callable): 在工作线程中执行的任务，参数为进度回报函数 report(*args)，返回任务结果
+            on_progress (Optional[Callable]): 在界面线程中以最新一次 report 的参数调用
+            on_done (Callable): 任务完成后在界面线程中以任务结果调用
+            progress_window (Optional[tk.Toplevel]): 任务结束时关闭的进度窗口
+        """
+        updates = queue.Queue()
+        
+        def run() -> None:
+            try:
+                result = task(lambda *args: updates.put(('progress', args)))
+            except Exception as e:
+                updates.put(('error', e))
+            else:
+                updates.put(('done', result))
+        
+        def poll() -> None:
+            if not self.history_window or not self.history_window.winfo_exists():
+                return
+            
+            # 取出队列中的全部消息，只显示最新进度
+            progress = None
+            message = None
+            try:
+                while True:
+                    message = updates.get_nowait()
+                    if message[0] != 'progress':
+                        break
+                    progress = message[1]
+                    message = None
+            except queue.Empty:
+                pass
+            
+            if progress and on_progress:
+                on_progress(*progress)
+            
+            if message is None:
+                self.history_window.after(100, poll)
+                return
+            
+            if progress_window:
+                progress_window.destroy()
+            if message[0] == 'done':
+                on_done(message[1])
+            else:
+                messagebox.showerror("错误", f"同步失败: {str(message[1])}")
+        
+        self._sync_executor.submit(run)
+        self.history_window.after(100, poll)
+    
     def _sync_all_to_doc(self) -> None:
         """
         同步所有记录到飞书云文档
         """
         try:
             # 检查飞书云文档配置
-            doc_sync = FeishuDocSyncService()
+            doc_sync = self._doc_sync
             if not doc_sync.is_available():
                 messagebox.showerror("错误", "飞书云文档未配置或配置无效，请检查设置")
                 return
@@ -1275,9 +1610,18 @@ class HistoryViewer:
                 messagebox.showerror("错误", "飞书云文档连接失败，请检查配置")
                 return
             
+            # 同步范围是数据库中的全部记录，不限于已加载的部分
+            total_count = self._count_all_records()[0]
+            if total_count == 0:
+                messagebox.showinfo("提示", "没有可同步的记录")
+                return
+            
             # 确认对话框
-            confirm_message = f"确定要将所有 {len(self.history_data)} 条记录同步到飞书云文档吗？\n\n"
-            confirm_message += "注意：记录将以追加方式添加到云文档中。"
+            confirm_message = "\n".join([
+                f"确定要将所有 {total_count} 条记录同步到飞书云文档吗？",
+                "",
+                "注意：记录将以追加方式添加到云文档中。"
+            ])
             
             result = messagebox.askyesno("确认同步", confirm_message)
             
@@ -1310,39 +1654,80 @@ class HistoryViewer:
             progress_bar = ttk.Progressbar(
                 progress_window,
                 mode='determinate',
-                length=300
+                length=300,
+                maximum=total_count
             )
             progress_bar.pack(pady=10)
             
             # 状态标签
+            status_var = tk.StringVar(progress_window, value="准备中...")
             status_label = tk.Label(
                 progress_window,
-                text="准备中...",
+                textvariable=status_var,
                 font=("Arial", 9),
                 fg="#666666"
             )
             status_label.pack()
             
-            progress_window.update()
-            
-            # 执行同步
-            result = doc_sync.sync_history_data(self.history_data)
-            
-            progress_window.destroy()
+            # 已全部加载时同步内存中记录的快照，否则在工作线程中从数据库逐页读取
+            records = list(self.history_data) if self._history_complete else None
+            
+            def iter_records():
+                if records is not None:
+                    yield from records
+                    return
+                # 每页单独查询：同步过程中会写入同步状态，不能一直占用读游标
+                offset = 0
+                while True:
+                    page = db.get_all_analysis_results(limit=HISTORY_LOAD_LIMIT, offset=offset)
+                    yield from page
+                    if len(page) < HISTORY_LOAD_LIMIT:
+                        return
+                    offset += len(page)
+            
+            def sync_records(report: Callable) -> Dict:
+                success_count = 0
+                failed_count = 0
+                for i, record in enumerate(iter_records(), 1):
+                    report(i, record.get('file_name', '未知文件'))
+                    if doc_sync.sync_record(record):
+                        success_count += 1
+                    else:
+                        failed_count += 1
+                return {'success': success_count, 'failed': failed_count}
             
-            # 显示结果
-            success_count = result.get('success', 0)
-            failed_count = result.get('failed', 0)
+            def show_progress(current: int, file_name: str) -> None:
+                progress_bar['value'] = current
+                status_var.set(f"正在同步: {file_name} ({current}/{total_count})")
             
-            result_message = f"同步完成！\n\n"
-            result_message += f"总计处理: {len(self.history_data)} 条\n"
-            result_message += f"成功同步: {success_count} 条\n"
-            result_message += f"同步失败: {failed_count} 条"
+            def show_result(result: Dict) -> None:
+                # 显示结果
+                success_count = result.get('success', 0)
+                failed_count = result.get('failed', 0)
+                
+                result_message = "\n".join([
+                    "同步完成！",
+                    "",
+                    f"总计处理: {result['success'] + result['failed']} 条",
+                    f"成功同步: {success_count} 条",
+                    f"同步失败: {failed_count} 条"
+                ])
+                
+                if failed_count > 0:
+                    messagebox.showwarning("同步完成", result_message)
+                else:
+                    messagebox.showinfo("同步完成", result_message)
+                
+                # 原地刷新已加载记录的文档同步状态
+                self._refresh_loaded_records()
             
-            if failed_count > 0:
-                messagebox.showwarning("同步完成", result_message)
-            else:
-                messagebox.showinfo("同步完成", result_message)
+            # 执行同步
+            self._run_sync_task(
+                sync_records,
+                show_progress,
+                show_result,
+                progress_window
+            )
             
         except Exception as e:
             messagebox.showerror("错误", f"同步失败: {str(e)}")
@@ -1359,7 +1744,7 @@ class HistoryViewer:
                 return
             
             # 检查飞书云文档配置
-            doc_sync = FeishuDocSyncService()
+            doc_sync = self._doc_sync
             if not doc_sync.is_available():
                 messagebox.showerror("错误", "飞书云文档未配置或配置无效，请检查设置")
                 return
@@ -1371,14 +1756,10 @@ class HistoryViewer:
             # 获取选中记录的数据
             selected_records = []
             for selected_item in selected_items:
-                # 从隐藏的sequence_id_data列获取正确的sequence_id
-                sequence_id = self.tree.set(selected_item, "sequence_id_data")
-                
-                # 查找对应的记录数据
-                for record in self.history_data:
-                    if record.get('sequence_id') == sequence_id:
-                        selected_records.append(record)
-                        break
+                # 按行ID查找记录，缺少sequence_id的旧数据无法同步
+                record = self._by_row.get(selected_item)
+                if record and record.get('sequence_id'):
+                    selected_records.append(record)
             
             if not selected_records:
                 messagebox.showerror("错误", "未找到选中的记录数据")
@@ -1389,8 +1770,11 @@ class HistoryViewer:
                 file_name = selected_records[0].get('file_name', '未知文件')
                 confirm_message = f"确定要将记录 '{file_name}' 同步到飞书云文档吗？"
             else:
-                confirm_message = f"确定要将选中的 {len(selected_records)} 条记录同步到飞书云文档吗？\n\n"
-                confirm_message += "注意：记录将以追加方式添加到云文档中。"
+                confirm_message = "\n".join([
+                    f"确定要将选中的 {len(selected_records)} 条记录同步到飞书云文档吗？",
+                    "",
+                    "注意：记录将以追加方式添加到云文档中。"
+                ])
             
             result = messagebox.askyesno("确认同步", confirm_message)
             
@@ -1400,7 +1784,7 @@ class HistoryViewer:
             # 创建进度窗口（如果选中多条记录）
             progress_window = None
             progress_bar = None
-            status_label = None
+            status_var = None
             
             if len(selected_records) > 1:
                 progress_window = tk.Toplevel(self.history_window)
@@ -1434,61 +1818,71 @@ class HistoryViewer:
                 progress_bar.pack(pady=10)
                 
                 # 状态标签
+                status_var = tk.StringVar(progress_window, value="准备中...")
                 status_label = tk.Label(
                     progress_window,
-                    text="准备中...",
+                    textvariable=status_var,
                     font=("Arial", 9),
                     fg="#666666"
                 )
                 status_label.pack()
-                
-                progress_window.update()
             
-            # 执行同步
-            success_count = 0
-            failed_count = 0
-            
-            for i, record in enumerate(selected_records):
-                file_name = record.get('file_name', '未知文件')
-                
-                # 更新进度
-                if progress_bar:
-                    progress_bar['value'] = i + 1
-                    status_label.config(text=f"正在同步: {file_name} ({i+1}/{len(selected_records)})")
-                    progress_window.update()
-                
-                try:
-                    if doc_sync.sync_record(record):
-                        success_count += 1
-                    else:
+            total = len(selected_records)
+            
+            def sync_records(report: Callable) -> Dict:
+                # 在工作线程中逐条追加到云文档
+                success_count = 0
+                failed_count = 0
+                for i, record in enumerate(selected_records):
+                    report(i + 1, record.get('file_name', '未知文件'))
+                    try:
+                        if doc_sync.sync_record(record):
+                            success_count += 1
+                        else:
+                            failed_count += 1
+                    except Exception:
                         failed_count += 1
-                except Exception as e:
-                    failed_count += 1
-                    print(f"同步记录失败: {e}")
-                
-                # 添加小延迟避免API限流
-                if len(selected_records) > 1:
-                    time.sleep(0.1)
+                        self.logger.exception(f"同步记录 {record.get('sequence_id')} 失败")
+                return {'success': success_count, 'failed': failed_count}
             
-            if progress_window:
-                progress_window.destroy()
+            def show_progress(current: int, file_name: str) -> None:
+                progress_bar['value'] = current
+                status_var.set(f"正在同步: {file_name} ({current}/{total})")
             
-            # 显示结果
-            if len(selected_records) == 1:
-                if success_count > 0:
-                    messagebox.showinfo("成功", "记录已成功同步到飞书云文档")
-                else:
-                    messagebox.showerror("错误", "同步失败，请检查网络连接和飞书配置")
-            else:
-                result_message = f"批量同步完成！\n\n"
-                result_message += f"总计处理: {len(selected_records)} 条\n"
-                result_message += f"成功同步: {success_count} 条\n"
-                result_message += f"同步失败: {failed_count} 条"
+            def show_result(result: Dict) -> None:
+                success_count = result['success']
+                failed_count = result['failed']
                 
-                if failed_count > 0:
-                    messagebox.showwarning("同步完成", result_message)
+                # 显示结果
+                if total == 1:
+                    if success_count > 0:
+                        messagebox.showinfo("成功", "记录已成功同步到飞书云文档")
+                    else:
+                        messagebox.showerror("错误", "同步失败，请检查网络连接和飞书配置")
                 else:
-                    messagebox.showinfo("同步完成", result_message)
+                    result_message = "\n".join([
+                        "批量同步完成！",
+                        "",
+                        f"总计处理: {total} 条",
+                        f"成功同步: {success_count} 条",
+                        f"同步失败: {failed_count} 条"
+                    ])
+                    
+                    if failed_count > 0:
+                        messagebox.showwarning("同步完成", result_message)
+                    else:
+                        messagebox.showinfo("同步完成", result_message)
+                
+                # 只刷新同步过的行，保留当前的列表和选中状态
+                self._refresh_records([record['sequence_id'] for record in selected_records])
+            
+            # 执行同步
+            self._run_sync_task(
+                sync_records,
+                show_progress if progress_bar else None,
+                show_result,
+                progress_window
+            )
             
         except Exception as e:
             messagebox.showerror("错误", f"同步失败: {str(e)}")
@@ -1504,16 +1898,8 @@ class HistoryViewer:
                 messagebox.showwarning("提示", "请先选择一条历史记录")
                 return
             
-            # 获取记录详情
-            item = selected_items[0]
-            sequence_id = self.tree.item(item, "values")[0]
-            
-            # 从数据库获取完整记录
-            record = None
-            for data in self.history_data:
-                if data.get('sequence_id') == sequence_id:
-                    record = data
-                    break
+            # 按行ID查找对应的完整记录
+            record = self._by_row.get(selected_items[0])
             
             if not record:
                 messagebox.showerror("错误", "未找到选中的记录")
@@ -1567,16 +1953,8 @@ class HistoryViewer:
             messagebox.showwarning("警告", "请先选择要编辑的记录")
             return
         
-        # 从隐藏的sequence_id_data列获取正确的sequence_id
-        item = selected_items[0]
-        sequence_id = self.tree.set(item, "sequence_id_data")
-        
-        # 从历史数据中找到对应记录
-        record = None
-        for r in self.history_data:
-            if r.get('sequence_id') == sequence_id:
-                record = r
-                break
+        # 按行ID查找对应记录
+        record = self._by_row.get(selected_items[0])
         
         if not record:
             messagebox.showerror("错误", "未找到对应的记录")
@@ -1707,14 +2085,11 @@ class HistoryViewer:
             if success:
                 messagebox.showinfo("成功", "记录已成功更新")
                 
-                # 更新本地数据
-                for r in self.history_data:
-                    if r.get('sequence_id') == record['sequence_id']:
-                        if 'analysis_prompt' in update_fields:
-                            r['analysis_prompt'] = new_prompt
-                        if 'analysis_result' in update_fields:
-                            r['analysis_result'] = new_result
-                        break
+                # 更新本地数据（搜索结果中的记录与已加载的记录可能是不同的字典）
+                for r in (record, self._history_by_seq.get(record['sequence_id'])):
+                    if r is not None:
+                        r.update(update_fields)
+                self._search_cache.clear()
                 
                 # 刷新界面显示
                 self._display_record_details(record)
@@ -1749,19 +2124,14 @@ class HistoryViewer:
         Args:
             item_id (str): 树形视图项目ID
         """
-        values = self.tree.item(item_id, 'values')
-        if not values:
-            return
-            
-        sequence_id = values[1]  # 序列号在第二列
-        
-        if sequence_id in self.selected_items:
+        if item_id in self.selected_items:
             # 取消选择
-            del self.selected_items[sequence_id]
+            del self.selected_items[item_id]
             self.tree.set(item_id, "选择", "☐")
         else:
-            # 选择
-            self.selected_items[sequence_id] = item_id
+            # 选择，记下对应的序列号
+            record = self._by_row.get(item_id)
+            self.selected_items[item_id] = record.get('sequence_id') if record else None
             self.tree.set(item_id, "选择", "☑")
         
         # 更新全选状态
@@ -1773,20 +2143,20 @@ class HistoryViewer:
         """
         self.select_all_state = not self.select_all_state
         
+        # 全选需要覆盖所有行
+        self._insert_pending_rows()
+        
         if self.select_all_state:
             # 全选
-            self.selected_items.clear()
-            for item_id in self.tree.get_children():
-                values = self.tree.item(item_id, 'values')
-                if values:
-                    sequence_id = values[1]
-                    self.selected_items[sequence_id] = item_id
-                    self.tree.set(item_id, "选择", "☑")
+            # 显示的行与 _by_row 一一对应，无需向表格查询行ID
+            self.selected_items = {row_id: record.get('sequence_id') for row_id, record in self._by_row.items()}
+            for item_id in self._by_row:
+                self.tree.set(item_id, "选择", "☑")
             self.tree.heading("选择", text="☑")
         else:
             # 取消全选
             self.selected_items.clear()
-            for item_id in self.tree.get_children():
+            for item_id in self._by_row:
                 self.tree.set(item_id, "选择", "☐")
             self.tree.heading("选择", text="☐")
     
@@ -1794,7 +2164,8 @@ class HistoryViewer:
         """
         更新全选按钮状态
         """
-        total_items = len(self.tree.get_children())
+        # 已插入和待插入的行合计即为当前显示的记录数
+        total_items = len(self._by_row)
         selected_items = len(self.selected_items)
         
         if selected_items == 0:
@@ -1821,8 +2192,10 @@ class HistoryViewer:
         if messagebox.askyesno("确认批量删除", 
                               f"确定要删除选中的 {selected_count} 条记录吗？\n\n此操作不可撤销！"):
             try:
-                # 获取选中的序列号列表
-                sequence_ids = list(self.selected_items.keys())
+                # 获取选中的序列号列表（跳过缺少序列号的旧数据，重复的序列号只删除一次）
+                sequence_ids = list(dict.fromkeys(
+                    sequence_id for sequence_id in self.selected_items.values() if sequence_id
+                ))
                 
                 # 批量删除
                 result = db.delete_multiple_analysis_results(sequence_ids)
@@ -1854,8 +2227,8 @@ class HistoryViewer:
         """
         删除所有记录
         """
-        # 获取总记录数
-        total_count = len(self.history_data)
+        # 获取总记录数（数据库中的全部记录，不限于已加载的部分）
+        total_count = self._count_all_records()[0]
         
         if total_count == 0:
             messagebox.showinfo("提示", "没有记录可以删除")
@@ -1902,6 +2275,7 @@ class HistoryViewer:
         self.prompt_text.delete(1.0, tk.END)
         self.prompt_text.config(state="disabled")
         
+        self._cancel_result_stream()
         self.result_text.config(state="normal")
         self.result_text.delete(1.0, tk.END)
         self.result_text.config(state="disabled")
\ No newline at end of file
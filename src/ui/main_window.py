@@ -38,16 +38,16 @@ class MainWindow:
         self.selected_files = []  # 存储多个选中的文件
         self.current_analysis_index = 0  # 当前分析的文件索引
         
-        # 初始化快速提示管理器和历史记录查看器
-        self.quick_prompts_manager = QuickPromptsManager(self.root)
-        self.history_viewer = HistoryViewer(self.root)
-        
         # 初始化飞书同步服务
         self.feishu_sync = FeishuSyncService()
         
-        # 初始化飞书云文档同步服务
+        # 初始化飞书云文档同步服务（与历史记录查看器共用）
         self.doc_sync = FeishuDocSyncService()
         
+        # 初始化快速提示管理器和历史记录查看器
+        self.quick_prompts_manager = QuickPromptsManager(self.root)
+        self.history_viewer = HistoryViewer(self.root, doc_sync=self.doc_sync)
+        
         # 初始化飞书电子表格同步服务
         from ..utils.feishu_spreadsheet_sync import feishu_spreadsheet_sync
         self.spreadsheet_sync = feishu_spreadsheet_sync
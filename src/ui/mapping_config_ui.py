@@ -13,11 +13,14 @@ from pathlib import Path
 import sys
 import os
 
-# 添加项目根目录到路径
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.mapping_config_manager import MappingConfigManager
-from utils.custom_field_mapper import CustomFieldMapper
+try:
+    from ..utils.mapping_config_manager import MappingConfigManager
+    from ..utils.custom_field_mapper import CustomFieldMapper
+except ImportError:
+    # 作为独立脚本运行时，添加src目录到路径
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils.mapping_config_manager import MappingConfigManager
+    from utils.custom_field_mapper import CustomFieldMapper
 
 class MappingConfigUI:
     """映射配置UI类"""
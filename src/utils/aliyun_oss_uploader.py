@@ -28,6 +28,13 @@ except ImportError:
     print("警告：未安装阿里云OSS SDK，请运行：pip install oss2")
 
 
+# 分片上传设置
+MULTIPART_THRESHOLD = 100 * 1024 * 1024  # 大于100MB使用分片上传
+MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+MULTIPART_THREADS = 8
+MULTIPART_STATE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'video-analyzer', 'oss-multipart')
+
+
 class AliyunOSSUploader:
     """阿里云OSS文件上传器"""
     
@@ -185,7 +192,7 @@ class AliyunOSSUploader:
                     progress_callback(bytes_consumed, total_bytes)
             
             # 执行上传
-            if file_size > 100 * 1024 * 1024:  # 大于100MB使用分片上传
+            if file_size > MULTIPART_THRESHOLD:
                 result = self._multipart_upload(file_path, object_key, headers, progress_wrapper)
             else:
                 result = self.bucket.put_object_from_file(
@@ -239,7 +246,7 @@ class AliyunOSSUploader:
                          headers: Dict[str, str],
                          progress_callback: Optional[Callable[[int, int], None]] = None):
         """
-        分片上传大文件
+        分片上传大文件（多线程并行上传分片，失败时取消分片上传）
         
         Args:
             file_path: 本地文件路径
@@ -250,43 +257,56 @@ class AliyunOSSUploader:
         Returns:
             上传结果
         """
-        # 初始化分片上传
-        upload_id = self.bucket.init_multipart_upload(object_key, headers=headers).upload_id
-        
-        parts = []
-        part_size = 10 * 1024 * 1024  # 10MB per part
         file_size = os.path.getsize(file_path)
-        uploaded_bytes = 0
+        # 分片不小于5MB，且分片数量控制在100个左右
+        part_size = max(MULTIPART_MIN_PART_SIZE, file_size // 100)
+        
+        # 整个文件的Content-MD5不适用于分片上传
+        multipart_headers = {k: v for k, v in headers.items() if k != 'Content-MD5'}
+        
+        # 分片上传进度记录在本地存储中
+        store = oss2.ResumableStore(root=MULTIPART_STATE_DIR)
         
         try:
-            with open(file_path, 'rb') as f:
-                part_number = 1
-                while True:
-                    data = f.read(part_size)
-                    if not data:
-                        break
-                    
-                    # 上传分片
-                    result = self.bucket.upload_part(
-                        object_key, upload_id, part_number, data
-                    )
-                    parts.append(oss2.models.PartInfo(part_number, result.etag))
-                    
-                    # 更新进度
-                    uploaded_bytes += len(data)
-                    if progress_callback:
-                        progress_callback(uploaded_bytes, file_size)
-                    
-                    part_number += 1
-            
-            # 完成分片上传
-            result = self.bucket.complete_multipart_upload(object_key, upload_id, parts)
-            return result
-            
+            return oss2.resumable_upload(
+                self.bucket, object_key, file_path,
+                store=store,
+                headers=multipart_headers,
+                multipart_threshold=0,
+                part_size=part_size,
+                num_threads=MULTIPART_THREADS,
+                progress_callback=progress_callback
+            )
+        except Exception:
+            # 对象键带时间戳，重试时不会续传同一分片上传，需取消以免残留分片持续计费
+            self._abort_multipart_upload(store, object_key, file_path)
+            raise
+    
+    def _abort_multipart_upload(self, store, object_key: str, file_path: str) -> None:
+        """
+        取消未完成的分片上传并删除本地进度记录
+        
+        Args:
+            store: 分片上传进度存储
+            object_key: OSS对象键
+            file_path: 本地文件路径
+        """
+        # 与oss2记录进度时使用相同的键（文件取绝对路径）
+        store_key = store.make_store_key(self.bucket.bucket_name, object_key, os.path.abspath(file_path))
+        record = store.get(store_key)
+        if not record:
+            return
+        
+        try:
+            if record.get('upload_id'):
+                self.bucket.abort_multipart_upload(object_key, record['upload_id'])
         except Exception as e:
-            # 取消分片上传
-            self.bucket.abort_multipart_upload(object_key, upload_id)
-            raise e
+            logging.warning(f"取消分片上传失败：{object_key} - {str(e)}")
+        
+        try:
+            store.delete(store_key)
+        except OSError as e:
+            logging.warning(f"删除分片上传记录失败：{store_key} - {str(e)}")
     
     def upload_files(self, file_paths: List[str],
                     custom_path: Optional[str] = None,
@@ -6,10 +6,15 @@
 """
 
 import os
+from functools import cached_property
 from dotenv import load_dotenv
 from typing import List, Dict, Any
 from pathlib import Path
 
+# 项目根目录及 .env 文件路径（模块加载时计算一次）
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ENV_FILE = PROJECT_ROOT / '.env'
+
 # 加载环境变量
 load_dotenv()
 
@@ -89,6 +94,16 @@ class Config:
         """
         return self.supported_video_formats
     
+    @cached_property
+    def supported_formats_str(self) -> str:
+        """
+        获取用于显示的支持格式字符串（首次访问后缓存）
+        
+        Returns:
+            str: 以逗号分隔的格式列表
+        """
+        return ', '.join(self.get_supported_formats())
+    
     def get_available_models(self) -> Dict[str, str]:
         """
         获取可用的模型列表
@@ -137,6 +152,8 @@ class Config:
         重新加载配置
         """
         load_dotenv(override=True)
+        # 清除基于旧配置缓存的派生值
+        self.__dict__.pop('supported_formats_str', None)
         self.__init__()
     
     def get_feishu_config(self) -> Dict[str, Any]:
@@ -227,7 +244,7 @@ class Config:
         """
         try:
             # 更新环境变量文件
-            env_file = Path(__file__).parent.parent.parent / '.env'
+            env_file = ENV_FILE
             
             # 读取现有配置
             env_vars = {}
@@ -7,11 +7,55 @@
 
 import sqlite3
 import os
+import string
 import uuid
 import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from pathlib import Path
 
+# IN (...) 查询每批最多使用的参数数量（SQLite默认上限为999）
+SQL_IN_BATCH_SIZE = 500
+# 流式读取时每次从游标取出的行数
+ITER_FETCH_SIZE = 500
+# 关键词搜索匹配的列：界面过滤、数据库搜索和导出共用同一组列
+SEARCH_COLUMNS = ('sequence_id', 'file_name', 'analysis_prompt', 'analysis_result')
+# 关键词搜索只忽略ASCII字母的大小写，与SQLite内置的lower()一致
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# 关键词搜索的SQL条件：任一搜索列包含关键词（按字面匹配，不把%和_当作通配符）
+_SEARCH_WHERE = " OR ".join(f"instr(lower({column}), ?) > 0" for column in SEARCH_COLUMNS)
+
+
+def _search_params(keyword: str) -> tuple:
+    """
+    构建关键词搜索SQL条件的参数
+    
+    Args:
+        keyword (str): 搜索关键词
+        
+    Returns:
+        tuple: 每个搜索列对应一个转为小写的关键词
+    """
+    return (keyword.translate(_ASCII_LOWER),) * len(SEARCH_COLUMNS)
+
+
+def filter_records(records: List[Dict[str, Any]], keyword: str) -> List[Dict[str, Any]]:
+    """
+    在内存中按关键词过滤记录，匹配规则与数据库搜索完全一致
+    
+    Args:
+        records (List[Dict[str, Any]]): 记录列表
+        keyword (str): 搜索关键词
+        
+    Returns:
+        List[Dict[str, Any]]: 匹配的记录，保持原有顺序
+    """
+    keyword = keyword.translate(_ASCII_LOWER)
+    return [
+        record for record in records
+        if any(keyword in (record.get(column) or '').translate(_ASCII_LOWER) for column in SEARCH_COLUMNS)
+    ]
+
+
 class VideoAnalysisDB:
     """
     视频分析结果数据库管理类
@@ -303,6 +347,37 @@ class VideoAnalysisDB:
                 return dict(row)
             return None
     
+    def get_analysis_by_sequence_ids(self, sequence_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        根据多个序列号批量获取分析结果
+        
+        Args:
+            sequence_ids (List[str]): 序列号列表
+            
+        Returns:
+            List[Dict[str, Any]]: 分析结果列表，按传入序列号的顺序排列，不存在的序列号会被跳过
+        """
+        if not sequence_ids:
+            return []
+        
+        rows_by_id = {}
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            # 分批查询，避免超出SQLite的参数数量限制
+            for start in range(0, len(sequence_ids), SQL_IN_BATCH_SIZE):
+                batch = sequence_ids[start:start + SQL_IN_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"""
+                    SELECT * FROM video_analysis WHERE sequence_id IN ({placeholders})
+                """, batch)
+                
+                for row in cursor.fetchall():
+                    rows_by_id[row['sequence_id']] = dict(row)
+        
+        return [rows_by_id[sequence_id] for sequence_id in sequence_ids if sequence_id in rows_by_id]
+    
     def get_all_analysis_results(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
         获取所有分析结果
@@ -341,15 +416,51 @@ class VideoAnalysisDB:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT * FROM video_analysis 
-                WHERE file_name LIKE ? OR analysis_prompt LIKE ? OR analysis_result LIKE ?
+                WHERE {_SEARCH_WHERE}
                 ORDER BY created_at DESC
-            """, (f"%{keyword}%", f"%{keyword}%", f"%{keyword}%"))
+            """, _search_params(keyword))
             
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
     
+    def iter_analysis_results(self, keyword: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        逐批读取分析结果，不把整个结果集加载到内存
+        
+        Args:
+            keyword (Optional[str]): 搜索关键词，为空时返回全部记录
+            
+        Returns:
+            Iterator[Dict[str, Any]]: 按创建时间倒序依次产出的分析结果
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            if keyword:
+                cursor.execute(f"""
+                    SELECT * FROM video_analysis 
+                    WHERE {_SEARCH_WHERE}
+                    ORDER BY created_at DESC
+                """, _search_params(keyword))
+            else:
+                cursor.execute("""
+                    SELECT * FROM video_analysis 
+                    ORDER BY created_at DESC
+                """)
+            
+            while True:
+                rows = cursor.fetchmany(ITER_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            conn.close()
+    
     def get_recent_records(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         获取最近的分析记录
@@ -7,6 +7,7 @@
 
 import json
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from ..api.feishu_client import FeishuClient
@@ -14,6 +15,9 @@ from ..api.feishu_sdk_client import FeishuSDKClient
 from .config import config
 from .database import db
 
+# 连接测试成功后的结果有效期（秒），期间不再重复请求
+CONNECTION_CHECK_TTL = 30
+
 class FeishuDocSyncService:
     """
     飞书云文档同步服务类
@@ -27,6 +31,7 @@ class FeishuDocSyncService:
         self.logger = logging.getLogger(__name__)
         self.client = None
         self.sdk_client = None
+        self._connection_ok_at = None
         
         # 初始化飞书客户端
         if config.is_feishu_doc_valid():
@@ -64,12 +69,17 @@ class FeishuDocSyncService:
         if not self.is_available():
             return False
         
+        # 最近测试成功过则直接返回
+        if self._connection_ok_at is not None and time.monotonic() - self._connection_ok_at < CONNECTION_CHECK_TTL:
+            return True
+        
         try:
             # 优先使用SDK客户端，如果失败则使用旧客户端
             result = self.sdk_client.test_doc_connection(self.doc_token)
             if not result and self.client:
                 self.logger.warning("SDK客户端连接失败，尝试使用旧客户端")
                 result = self.client.test_doc_connection(self.doc_token)
+            self._connection_ok_at = time.monotonic() if result else None
             return result
         except Exception as e:
             self.logger.error(f"测试云文档连接失败: {str(e)}")
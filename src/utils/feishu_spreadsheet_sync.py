@@ -10,8 +10,9 @@ import threading
 import time
 import json
 import re
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import uuid
 
 from ..api.feishu_client import FeishuClient
@@ -20,6 +21,12 @@ from .database import db
 from .custom_field_mapper import CustomFieldMapper
 from .ai_output_adapter import AIOutputAdapter
 
+# 批量同步时的最大并发请求数
+SPREADSHEET_SYNC_WORKERS = 10
+
+# 连接测试成功后的结果有效期（秒），期间不再重复请求
+CONNECTION_CHECK_TTL = 30
+
 class FeishuSpreadsheetSync:
     """
     飞书电子表格同步服务类
@@ -38,6 +45,7 @@ class FeishuSpreadsheetSync:
         self.last_sync_time = None
         self.spreadsheet_token = None  # 电子表格token
         self.sheet_id = None  # 工作表ID
+        self._connection_ok_at = None  # 最近一次连接测试成功的时间
         self._init_client()
         
     def _init_client(self):
@@ -78,15 +86,22 @@ class FeishuSpreadsheetSync:
             if not self.spreadsheet_token or not self.sheet_id:
                 self.logger.error("电子表格配置不完整")
                 return False
+            
+            # 最近测试成功过则直接返回
+            if (self._connection_ok_at is not None
+                    and time.monotonic() - self._connection_ok_at < CONNECTION_CHECK_TTL):
+                return True
                 
             # 测试获取电子表格信息
             # _make_request方法在成功时返回数据部分，失败时返回None
             response = self.feishu_client.get_spreadsheet_info(self.spreadsheet_token)
             if response is not None:
                 self.logger.info("飞书电子表格连接测试成功")
+                self._connection_ok_at = time.monotonic()
                 return True
             else:
                 self.logger.error("飞书电子表格连接测试失败")
+                self._connection_ok_at = None
                 return False
                 
         except Exception as e:
@@ -220,6 +235,175 @@ class FeishuSpreadsheetSync:
                 self.logger.error(f"异常堆栈: {traceback.format_exc()}")
                 return False
     
+    def sync_records_to_spreadsheet(self, sequence_ids: List[str], force_update: bool = False,
+                                    max_workers: int = SPREADSHEET_SYNC_WORKERS,
+                                    progress_callback: Optional[Callable[[int, int, Dict], None]] = None
+                                    ) -> Dict[str, Any]:
+        """
+        批量同步多条记录到电子表格
+        
+        连接只测试一次，新行号一次性分配，各行的写入请求并发进行。
+        写入失败留下的空行会由其后写入成功的行下移填补，保持新写入的行连续。
+        
+        Args:
+            sequence_ids (List[str]): 记录序列号列表
+            force_update (bool): 是否强制更新已存在的记录
+            max_workers (int): 最大并发请求数
+            progress_callback (Callable, optional): 进度回调 (已完成数, 总数, 记录)，在调用线程中执行
+            
+        Returns:
+            Dict[str, Any]: 同步结果 {'success': 成功数, 'failed': 失败数, 'errors': 错误信息列表}
+        """
+        result = {
+            'success': 0,
+            'failed': 0,
+            'errors': []
+        }
+        total = len(sequence_ids)
+        
+        def _fail(sequence_id: str, message: str) -> None:
+            result['failed'] += 1
+            result['errors'].append(f"记录 {sequence_id}: {message}")
+        
+        with self.sync_lock:
+            try:
+                if not self.spreadsheet_token or not self.sheet_id or not self.test_connection():
+                    for sequence_id in sequence_ids:
+                        _fail(sequence_id, "飞书电子表格连接失败")
+                    return result
+                
+                # 准备每条记录的行号和数据
+                jobs = []
+                next_row = None
+                done = 0
+                records = {
+                    record['sequence_id']: record
+                    for record in db.get_analysis_by_sequence_ids(sequence_ids)
+                }
+                for sequence_id in sequence_ids:
+                    record = records.get(sequence_id)
+                    if not record:
+                        _fail(sequence_id, "未找到记录")
+                        done += 1
+                        continue
+                    
+                    row_number = record.get('feishu_spreadsheet_row')
+                    if row_number and not force_update:
+                        result['success'] += 1
+                        done += 1
+                        continue
+                    
+                    is_new_row = not row_number
+                    if is_new_row:
+                        # 只查询一次可用行，之后依次分配
+                        if next_row is None:
+                            next_row = self._find_next_available_row()
+                            if not next_row:
+                                _fail(sequence_id, "无法找到可用行")
+                                done += 1
+                                continue
+                        row_number = next_row
+                        next_row += 1
+                    
+                    jobs.append((record, row_number, self._prepare_sync_data(record), is_new_row))
+                
+                # 并发写入各行，记录新分配行的写入结果
+                written_rows = {}
+                empty_rows = []
+                workers = max(1, min(max_workers, len(jobs)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(
+                            self.feishu_client.update_spreadsheet_range,
+                            spreadsheet_token=self.spreadsheet_token,
+                            sheet_id=self.sheet_id,
+                            range_str=f"A{row_number}:I{row_number}",
+                            values=[sync_data]
+                        ): (record, row_number, sync_data, is_new_row)
+                        for record, row_number, sync_data, is_new_row in jobs
+                    }
+                    
+                    for future in as_completed(futures):
+                        record, row_number, sync_data, is_new_row = futures[future]
+                        sequence_id = record['sequence_id']
+                        try:
+                            success = future.result()
+                        except Exception as e:
+                            success = False
+                            self.logger.error(f"同步记录 {sequence_id} 到电子表格异常: {e}")
+                        
+                        if success:
+                            db.update_feishu_spreadsheet_row(sequence_id, row_number)
+                            result['success'] += 1
+                            if is_new_row:
+                                written_rows[row_number] = (record, sync_data)
+                        else:
+                            _fail(sequence_id, "同步失败")
+                            if is_new_row:
+                                empty_rows.append(row_number)
+                        
+                        done += 1
+                        if progress_callback:
+                            progress_callback(done, total, record)
+                
+                if empty_rows and written_rows:
+                    self._compact_rows(written_rows, empty_rows)
+                
+                if result['success']:
+                    self.last_sync_time = datetime.now()
+                self.logger.info(f"批量同步到电子表格完成: 成功 {result['success']} 条, 失败 {result['failed']} 条")
+                
+            except Exception as e:
+                self.logger.error(f"批量同步到电子表格异常: {e}")
+                result['failed'] = total - result['success']
+                result['errors'].append(str(e))
+        
+        return result
+    
+    def _compact_rows(self, written_rows: Dict[int, Tuple[Dict, List[str]]], empty_rows: List[int]) -> None:
+        """
+        将写入失败留下的空行用其后写入成功的行填补
+        
+        查找可用行时只取最后一个有数据行之后的位置，中间的空行以后不会再被使用，
+        因此把最靠后的成功行移到最靠前的空行，并清空原来的行。
+        
+        Args:
+            written_rows (Dict[int, Tuple[Dict, List[str]]]): 本次新写入成功的行 {行号: (记录, 行数据)}
+            empty_rows (List[int]): 本次分配但写入失败的行号
+        """
+        empty_rows = sorted(empty_rows)
+        while empty_rows and written_rows:
+            last_row = max(written_rows)
+            target_row = empty_rows[0]
+            if last_row < target_row:
+                break
+            
+            record, sync_data = written_rows.pop(last_row)
+            sequence_id = record['sequence_id']
+            if not self.feishu_client.update_spreadsheet_range(
+                spreadsheet_token=self.spreadsheet_token,
+                sheet_id=self.sheet_id,
+                range_str=f"A{target_row}:I{target_row}",
+                values=[sync_data]
+            ):
+                self.logger.warning(f"移动记录 {sequence_id} 到第 {target_row} 行失败，保留空行")
+                break
+            
+            db.update_feishu_spreadsheet_row(sequence_id, target_row)
+            empty_rows.pop(0)
+            
+            # 清空原来的行，它成为新的空行，留给更靠后的行填补
+            if not self.feishu_client.update_spreadsheet_range(
+                spreadsheet_token=self.spreadsheet_token,
+                sheet_id=self.sheet_id,
+                range_str=f"A{last_row}:I{last_row}",
+                values=[[''] * len(sync_data)]
+            ):
+                self.logger.warning(f"清空第 {last_row} 行失败，该行与第 {target_row} 行内容重复")
+                break
+            empty_rows.append(last_row)
+            empty_rows.sort()
+    
     def sync_all_records_to_spreadsheet(self) -> Dict[str, int]:
         """
         批量同步所有未同步的记录到电子表格
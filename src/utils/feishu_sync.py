@@ -7,9 +7,8 @@
 
 import logging
 import threading
-import time
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 import uuid
 
@@ -20,6 +19,9 @@ from .feishu_field_fixer import FeishuFieldFixer
 from .custom_field_mapper import CustomFieldMapper
 from .ai_output_adapter import AIOutputAdapter
 
+# 批量同步时每次请求的记录数（飞书接口单次上限为1000）
+FEISHU_BATCH_SIZE = 500
+
 class FeishuSyncService:
     """
     飞书数据同步服务类
@@ -174,48 +176,155 @@ class FeishuSyncService:
                 # 获取所有未同步的记录
                 all_records = db.get_unsynced_records()
             
-            success_count = 0
-            failed_count = 0
-            created_count = 0
-            updated_count = 0
+            return self._batch_sync_records(all_records, include_synced)
+            
+        except Exception as e:
+            self.logger.error(f"批量同步异常: {str(e)}")
+            return {'success': 0, 'failed': 0, 'skipped': 0, 'created': 0, 'updated': 0}
+    
+    def sync_records_to_feishu(self, sequence_ids: List[str], include_synced: bool = True,
+                               progress_callback: Optional[Callable[[int, int], None]] = None,
+                               cancel_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """
+        将指定记录批量同步到飞书：未同步的记录批量新建，已同步的记录批量更新
+        
+        Args:
+            sequence_ids (List[str]): 记录的序列ID列表
+            include_synced (bool): 是否更新已同步的记录
+            progress_callback (Callable, optional): 每批完成后调用 (已处理数, 总数)
+            cancel_event (threading.Event, optional): 设置后不再发送剩余的批次
+            
+        Returns:
+            Dict[str, int]: 同步结果统计
+        """
+        if not self.feishu_client or not config.feishu_enabled:
+            return {'success': 0, 'failed': len(sequence_ids), 'skipped': 0, 'created': 0, 'updated': 0}
+        
+        try:
+            records = db.get_analysis_by_sequence_ids(sequence_ids)
+            result = self._batch_sync_records(records, include_synced, progress_callback, cancel_event)
             
-            for record in all_records:
+            # 本地已不存在的记录计为失败
+            missing_count = len(sequence_ids) - len(records)
+            if missing_count:
+                self.logger.error(f"有 {missing_count} 条记录在本地数据库中不存在")
+                result['failed'] += missing_count
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"批量同步异常: {str(e)}")
+            return {'success': 0, 'failed': len(sequence_ids), 'skipped': 0, 'created': 0, 'updated': 0}
+    
+    def _batch_sync_records(self, records: List[Dict], include_synced: bool,
+                            progress_callback: Optional[Callable[[int, int], None]] = None,
+                            cancel_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """
+        按批新建或更新飞书记录，每批一次请求
+        
+        Args:
+            records (List[Dict]): 本地记录列表
+            include_synced (bool): 是否更新已同步的记录
+            progress_callback (Callable, optional): 每批完成后调用 (已处理数, 总数)
+            cancel_event (threading.Event, optional): 设置后不再发送剩余的批次
+            
+        Returns:
+            Dict[str, int]: 同步结果统计
+        """
+        success_count = 0
+        failed_count = 0
+        created_count = 0
+        updated_count = 0
+        
+        feishu_config = config.get_feishu_config()
+        to_create = []  # [(sequence_id, feishu_data)]
+        to_update = []  # [(feishu_record_id, sequence_id, feishu_data)]
+        retry_sequence_ids = []
+        total = len(records)
+        done = 0
+        
+        with self.sync_lock:
+            for record in records:
                 sequence_id = record['sequence_id']
+                feishu_data = self._prepare_feishu_record(record)
+                if not feishu_data:
+                    self.logger.error(f"准备飞书数据失败: {sequence_id}")
+                    failed_count += 1
+                    done += 1
+                    continue
                 
                 if record.get('feishu_record_id') and include_synced:
                     # 已同步记录，执行更新
-                    if self.update_record_in_feishu(sequence_id):
-                        success_count += 1
-                        updated_count += 1
-                    else:
-                        failed_count += 1
+                    to_update.append((record['feishu_record_id'], sequence_id, feishu_data))
                 else:
                     # 未同步记录，执行新建
-                    if self.sync_record_to_feishu(sequence_id):
+                    to_create.append((sequence_id, feishu_data))
+            
+            # 批量新建，每批一次请求
+            for i in range(0, len(to_create), FEISHU_BATCH_SIZE):
+                if cancel_event and cancel_event.is_set():
+                    break
+                chunk = to_create[i:i + FEISHU_BATCH_SIZE]
+                record_ids = self.feishu_client.batch_add_records(
+                    app_token=feishu_config['app_token'],
+                    table_id=feishu_config['table_id'],
+                    records=[feishu_data for _, feishu_data in chunk],
+                    batch_size=FEISHU_BATCH_SIZE
+                )
+                for (sequence_id, _), record_id in zip(chunk, record_ids):
+                    if record_id:
+                        db.update_feishu_record_id(sequence_id, record_id)
                         success_count += 1
                         created_count += 1
                     else:
                         failed_count += 1
-                
-                # 添加小延迟避免API限流
-                time.sleep(0.1)
-            
-            # 更新最后同步时间
-            if success_count > 0:
-                self.last_sync_time = datetime.now()
-            
-            self.logger.info(f"批量同步完成: 成功 {success_count} (新建 {created_count}, 更新 {updated_count}), 失败 {failed_count}")
-            return {
-                'success': success_count,
-                'failed': failed_count,
-                'skipped': 0,
-                'created': created_count,
-                'updated': updated_count
-            }
-            
-        except Exception as e:
-            self.logger.error(f"批量同步异常: {str(e)}")
-            return {'success': 0, 'failed': 0, 'skipped': 0, 'created': 0, 'updated': 0}
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, total)
+            
+            # 批量更新，每批一次请求
+            for i in range(0, len(to_update), FEISHU_BATCH_SIZE):
+                if cancel_event and cancel_event.is_set():
+                    break
+                chunk = to_update[i:i + FEISHU_BATCH_SIZE]
+                results = self.feishu_client.batch_update_records(
+                    app_token=feishu_config['app_token'],
+                    table_id=feishu_config['table_id'],
+                    records={record_id: feishu_data for record_id, _, feishu_data in chunk},
+                    batch_size=FEISHU_BATCH_SIZE
+                )
+                for (_, sequence_id, _), updated in zip(chunk, results):
+                    if updated:
+                        success_count += 1
+                        updated_count += 1
+                    else:
+                        retry_sequence_ids.append(sequence_id)
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, total)
+        
+        # 批量更新失败的记录（如已在飞书中被删除）逐条处理，必要时重新创建
+        for sequence_id in retry_sequence_ids:
+            if self.update_record_in_feishu(sequence_id):
+                success_count += 1
+                updated_count += 1
+            else:
+                failed_count += 1
+        
+        # 取消后未发送的记录
+        skipped_count = total - done
+        
+        # 更新最后同步时间
+        if success_count > 0:
+            self.last_sync_time = datetime.now()
+        
+        self.logger.info(f"批量同步完成: 成功 {success_count} (新建 {created_count}, 更新 {updated_count}), 失败 {failed_count}")
+        return {
+            'success': success_count,
+            'failed': failed_count,
+            'skipped': skipped_count,
+            'created': created_count,
+            'updated': updated_count
+        }
     
     def update_record_in_feishu(self, sequence_id: str) -> bool:
         """
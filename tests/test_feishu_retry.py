@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+飞书API请求重试测试
+非幂等的POST请求只在服务端确定未处理时重发，避免产生重复记录
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.api.feishu_client import FeishuClient
+
+
+def _http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = mock.Mock(status_code=status_code, headers={}, content=b'{}', text='{}')
+    return requests.exceptions.HTTPError(f"{status_code}", response=response)
+
+
+def _connection_refused() -> requests.exceptions.ConnectionError:
+    try:
+        try:
+            raise ConnectionRefusedError(111, 'Connection refused')
+        except ConnectionRefusedError:
+            raise OSError('Failed to establish a new connection')
+    except OSError as e:
+        return requests.exceptions.ConnectionError(e)
+
+
+class RequestRetryTest(unittest.TestCase):
+    """不同请求方法和错误类型的重试策略"""
+    
+    def setUp(self):
+        self.client = FeishuClient(app_id='app', app_secret='secret')
+        sleep_patcher = mock.patch('src.api.feishu_client.time.sleep')
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+    
+    def _request(self, method: str, errors) -> int:
+        """依次抛出给定异常后成功，返回实际发送的次数"""
+        with mock.patch.object(
+            self.client, '_do_request',
+            side_effect=list(errors) + [{'code': 0, 'data': {}}]
+        ) as do_request:
+            self.client._request_with_retry(method, '/bitable/v1/apps/app/tables/t/records', {'fields': {}})
+        return do_request.call_count
+    
+    def test_post_read_timeout_is_not_resent(self):
+        self.assertEqual(self._request('POST', [requests.exceptions.ReadTimeout('read timed out')]), 1)
+    
+    def test_post_server_error_is_not_resent(self):
+        self.assertEqual(self._request('POST', [_http_error(502)]), 1)
+    
+    def test_post_is_resent_when_not_processed(self):
+        self.assertEqual(self._request('POST', [requests.exceptions.ConnectTimeout('connect timed out')]), 2)
+        self.assertEqual(self._request('POST', [_connection_refused()]), 2)
+        self.assertEqual(self._request('POST', [_http_error(429)]), 2)
+    
+    def test_post_is_resent_when_rate_limited(self):
+        with mock.patch.object(
+            self.client, '_do_request',
+            side_effect=[{'code': 99991400, 'msg': 'rate limited'}, {'code': 0, 'data': {}}]
+        ) as do_request:
+            self.client._request_with_retry('POST', '/bitable/v1/apps/app/tables/t/records', {'fields': {}})
+        self.assertEqual(do_request.call_count, 2)
+    
+    def test_idempotent_methods_are_resent(self):
+        for method in ('GET', 'PUT', 'DELETE'):
+            with self.subTest(method=method):
+                self.assertEqual(self._request(method, [requests.exceptions.ReadTimeout('read timed out')]), 2)
+                self.assertEqual(self._request(method, [_http_error(502)]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+关键词搜索一致性测试
+历史记录界面的内存过滤、数据库搜索和CSV导出对同一关键词应返回相同的记录
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.database import VideoAnalysisDB, filter_records
+
+
+class SearchConsistencyTest(unittest.TestCase):
+    """内存过滤与数据库搜索的一致性"""
+    
+    def setUp(self):
+        fd, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        self.db = VideoAnalysisDB(self.db_path)
+        
+        samples = [
+            ('Report_Final.mp4', '分析视频内容', '画面中有一只猫'),
+            ('holiday.MOV', 'Describe the SCENE', 'A beach at sunset'),
+            ('100%真实.mp4', '统计占比', '完成率 50% 以上'),
+            ('Élan.mp4', 'ÉTÉ', 'été'),
+            ('empty.mp4', '', ''),
+        ]
+        self.sequence_ids = [
+            self.db.save_analysis_result(
+                file_path=f"/videos/{name}", file_name=name, file_size=1024,
+                mime_type='video/mp4', analysis_prompt=prompt, analysis_result=result
+            )
+            for name, prompt, result in samples
+        ]
+    
+    def tearDown(self):
+        os.remove(self.db_path)
+    
+    def _assert_same_rows(self, keyword: str) -> None:
+        # 界面已全部加载历史记录时在内存中过滤，否则使用数据库搜索；导出走流式数据库查询
+        loaded = self.db.get_all_analysis_results(limit=1000)
+        filtered = sorted(r['sequence_id'] for r in filter_records(loaded, keyword))
+        searched = sorted(r['sequence_id'] for r in self.db.search_analysis_results(keyword))
+        exported = sorted(r['sequence_id'] for r in self.db.iter_analysis_results(keyword))
+        
+        self.assertEqual(filtered, searched, keyword)
+        self.assertEqual(filtered, exported, keyword)
+    
+    def test_keywords_match_the_same_rows(self):
+        keywords = [
+            self.sequence_ids[0],          # 按序列号搜索
+            self.sequence_ids[1].lower(),  # 序列号中的字母不区分大小写
+            'report', 'SCENE', 'mov',      # ASCII字母不区分大小写
+            '猫', '分析',                  # 中文
+            '%', '_', '50%',               # 按字面匹配，不作为通配符
+            'é', 'É',                      # 非ASCII字母区分大小写
+            'not-present',
+        ]
+        for keyword in keywords:
+            with self.subTest(keyword=keyword):
+                self._assert_same_rows(keyword)
+    
+    def test_sequence_id_search_finds_the_record(self):
+        sequence_id = self.sequence_ids[2]
+        exported = [r['sequence_id'] for r in self.db.iter_analysis_results(sequence_id)]
+        self.assertEqual(exported, [sequence_id])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+电子表格批量同步行号测试
+并发写入中某行失败时，其后成功的行应下移填补，新写入的行保持连续
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils import feishu_spreadsheet_sync
+from src.utils.feishu_spreadsheet_sync import FeishuSpreadsheetSync
+
+
+class FakeSheetClient:
+    """在内存中模拟电子表格，写入指定记录时失败"""
+    
+    def __init__(self, failing_ids):
+        self.rows = {1: '表头'}
+        self.failing_ids = set(failing_ids)
+        self.lock = threading.Lock()
+    
+    def get_spreadsheet_range(self, spreadsheet_token, sheet_id, range_str):
+        last_row = max(self.rows)
+        return {'values': [[self.rows.get(i)] for i in range(1, last_row + 1)]}
+    
+    def update_spreadsheet_range(self, spreadsheet_token, sheet_id, range_str, values):
+        row_number = int(range_str.split(':')[0][1:])
+        value = values[0][0]
+        if value in self.failing_ids:
+            return False
+        with self.lock:
+            if value:
+                self.rows[row_number] = value
+            else:
+                self.rows.pop(row_number, None)
+        return True
+
+
+class SpreadsheetRowCompactionTest(unittest.TestCase):
+    """写入失败后的空行填补"""
+    
+    def _sync(self, sequence_ids, failing_ids):
+        with mock.patch.object(feishu_spreadsheet_sync.config, 'is_feishu_spreadsheet_valid', return_value=False):
+            sync = FeishuSpreadsheetSync()
+        sync.feishu_client = FakeSheetClient(failing_ids)
+        sync.spreadsheet_token = 'token'
+        sync.sheet_id = 'sheet'
+        
+        fake_db = mock.Mock()
+        fake_db.get_analysis_by_sequence_ids.return_value = [
+            {'sequence_id': sequence_id} for sequence_id in sequence_ids
+        ]
+        
+        with mock.patch.object(feishu_spreadsheet_sync, 'db', fake_db), \
+                mock.patch.object(sync, 'test_connection', return_value=True), \
+                mock.patch.object(sync, '_prepare_sync_data', side_effect=lambda r: [r['sequence_id']] + [''] * 8):
+            result = sync.sync_records_to_spreadsheet(sequence_ids)
+        
+        saved_rows = {
+            call.args[0]: call.args[1]
+            for call in fake_db.update_feishu_spreadsheet_row.call_args_list
+        }
+        return result, sync.feishu_client.rows, saved_rows
+    
+    def test_failed_rows_are_filled_by_later_rows(self):
+        sequence_ids = [f"S{i}" for i in range(1, 7)]
+        result, rows, saved_rows = self._sync(sequence_ids, failing_ids={'S2', 'S4'})
+        
+        self.assertEqual(result['success'], 4)
+        self.assertEqual(result['failed'], 2)
+        # 表格中没有空行
+        self.assertEqual(sorted(rows), list(range(1, 6)))
+        # 数据库记录的行号与表格内容一致
+        for sequence_id in ('S1', 'S3', 'S5', 'S6'):
+            self.assertEqual(rows[saved_rows[sequence_id]], sequence_id)
+        self.assertNotIn('S2', saved_rows)
+        self.assertNotIn('S4', saved_rows)
+    
+    def test_failed_last_row_leaves_no_gap(self):
+        result, rows, saved_rows = self._sync(['S1', 'S2', 'S3'], failing_ids={'S3'})
+        
+        self.assertEqual(result['success'], 2)
+        self.assertEqual(sorted(rows), [1, 2, 3])
+        self.assertEqual(saved_rows, {'S1': 2, 'S2': 3})
+
+
+if __name__ == '__main__':
+    unittest.main()